@@ -0,0 +1,39 @@
+"""Drop the redundant variables workspace_id index.
+
+Revision ID: 0f5b7d19e8a3
+Revises: 9a6f3e2b18c4
+Create Date: 2026-10-16
+
+Workspace variables are read with WHERE workspace_id = ? ORDER BY key,
+which the uq_variables_workspace_key (workspace_id, key) index serves
+directly, sort included. The single-column ix_variables_workspace_id was
+a strict prefix of it.
+"""
+
+from alembic import op
+
+revision = "0f5b7d19e8a3"
+down_revision = "9a6f3e2b18c4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_variables_workspace_id",
+            table_name="variables",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_variables_workspace_id",
+            "variables",
+            ["workspace_id"],
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,46 @@
+"""Store token_hash as a raw 32-byte SHA-256 digest.
+
+Revision ID: 31c9cd975c1c
+Revises: 690bfb693c6e
+Create Date: 2026-10-16
+
+api_tokens.token_hash and agent_pool_tokens.token_hash move from 64-char
+hex VARCHAR to BYTEA holding the raw digest, halving the column and index
+key size. Existing hashes are converted in place with decode(..., 'hex');
+the unique constraints and hash indexes are rebuilt by the type change.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import BYTEA
+
+revision = "31c9cd975c1c"
+down_revision = "690bfb693c6e"
+branch_labels = None
+depends_on = None
+
+_TABLES = ("api_tokens", "agent_pool_tokens")
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        op.alter_column(
+            table,
+            "token_hash",
+            type_=BYTEA(),
+            existing_type=sa.String(64),
+            existing_nullable=False,
+            postgresql_using="decode(token_hash, 'hex')",
+        )
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.alter_column(
+            table,
+            "token_hash",
+            type_=sa.String(64),
+            existing_type=BYTEA(),
+            existing_nullable=False,
+            postgresql_using="encode(token_hash, 'hex')",
+        )
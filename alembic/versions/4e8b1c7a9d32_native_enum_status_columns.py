@@ -0,0 +1,100 @@
+"""Store server-controlled status columns as native enums.
+
+Revision ID: 4e8b1c7a9d32
+Revises: d81a6b3c5e27
+Create Date: 2026-10-16
+
+api_tokens.token_type, registry_modules.status, the two upload_status
+columns and vcs_connections.status only ever hold values the server
+writes. As native enums they are 4-byte OIDs compared as integers instead
+of collated VARCHARs.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "4e8b1c7a9d32"
+down_revision = "d81a6b3c5e27"
+branch_labels = None
+depends_on = None
+
+_ENUMS = {
+    "api_token_type": ("user", "organization"),
+    "registry_module_status": ("pending", "setup_complete"),
+    "upload_status": ("pending", "uploaded"),
+    "vcs_connection_status": ("active", "suspended", "removed"),
+}
+
+# (table, column, enum type, server default)
+_COLUMNS = (
+    ("api_tokens", "token_type", "api_token_type", "user"),
+    ("registry_modules", "status", "registry_module_status", "pending"),
+    ("registry_module_versions", "upload_status", "upload_status", "pending"),
+    ("registry_provider_platforms", "upload_status", "upload_status", "pending"),
+    ("vcs_connections", "status", "vcs_connection_status", "active"),
+)
+
+
+def _enum(name: str) -> postgresql.ENUM:
+    return postgresql.ENUM(*_ENUMS[name], name=name, create_type=False)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    for name in _ENUMS:
+        _enum(name).create(bind, checkfirst=True)
+    for table, column, enum_name, default in _COLUMNS:
+        # Postgres can't cast the varchar default along with the column, so
+        # drop it first and put it back as an enum literal.
+        op.alter_column(
+            table,
+            column,
+            server_default=None,
+            existing_type=sa.String(20),
+            existing_nullable=False,
+        )
+        op.alter_column(
+            table,
+            column,
+            type_=_enum(enum_name),
+            existing_type=sa.String(20),
+            existing_nullable=False,
+            postgresql_using=f"{column}::{enum_name}",
+        )
+        op.alter_column(
+            table,
+            column,
+            server_default=sa.text(f"'{default}'::{enum_name}"),
+            existing_type=_enum(enum_name),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    for table, column, enum_name, default in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            server_default=None,
+            existing_type=_enum(enum_name),
+            existing_nullable=False,
+        )
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(20),
+            existing_type=_enum(enum_name),
+            existing_nullable=False,
+            postgresql_using=f"{column}::text",
+        )
+        op.alter_column(
+            table,
+            column,
+            server_default=default,
+            existing_type=sa.String(20),
+            existing_nullable=False,
+        )
+    bind = op.get_bind()
+    for name in _ENUMS:
+        _enum(name).drop(bind, checkfirst=True)
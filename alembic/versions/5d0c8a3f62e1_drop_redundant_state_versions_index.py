@@ -0,0 +1,40 @@
+"""Drop the redundant state_versions workspace_id index.
+
+Revision ID: 5d0c8a3f62e1
+Revises: b7e2d41c9a05
+Create Date: 2026-10-16
+
+The uq_state_versions (workspace_id, serial) unique index already serves
+equality lookups on workspace_id and the "WHERE workspace_id = ? ORDER BY
+serial DESC LIMIT 1" current-state query as a backward index scan. The
+single-column ix_state_versions_workspace_id only added write amplification
+on every state upload.
+"""
+
+from alembic import op
+
+revision = "5d0c8a3f62e1"
+down_revision = "b7e2d41c9a05"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_state_versions_workspace_id",
+            table_name="state_versions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_state_versions_workspace_id",
+            "state_versions",
+            ["workspace_id"],
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,45 @@
+"""Use hash indexes for token_hash lookups.
+
+Revision ID: 690bfb693c6e
+Revises: ad9e14fa1469
+Create Date: 2026-10-16
+
+api_tokens.token_hash and agent_pool_tokens.token_hash are only ever
+queried by exact equality (every API request / listener join). The
+secondary btree indexes duplicated the unique constraint's btree; they are
+replaced with hash indexes. Uniqueness is still enforced by the unique
+constraints, which are left untouched.
+"""
+
+from alembic import op
+
+revision = "690bfb693c6e"
+down_revision = "ad9e14fa1469"
+branch_labels = None
+depends_on = None
+
+_INDEXES = (
+    ("ix_api_tokens_token_hash", "api_tokens"),
+    ("ix_agent_pool_tokens_token_hash", "agent_pool_tokens"),
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for name, table in _INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+            op.create_index(
+                name,
+                table,
+                ["token_hash"],
+                postgresql_using="hash",
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table in _INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+            op.create_index(name, table, ["token_hash"], postgresql_concurrently=True)
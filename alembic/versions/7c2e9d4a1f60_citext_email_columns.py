@@ -0,0 +1,51 @@
+"""Store email identity columns as CITEXT.
+
+Revision ID: 7c2e9d4a1f60
+Revises: 0f5b7d19e8a3
+Create Date: 2026-10-16
+
+users.email, role_assignments.email, platform_role_assignments.email and
+api_tokens.user_email are compared case-insensitively in practice. As
+CITEXT, "Foo@x" and "foo@x" resolve to the same primary key and equality
+lookups stay direct index hits. The upgrade fails on existing rows that
+differ only by case; those must be merged by hand first.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import CITEXT
+
+revision = "7c2e9d4a1f60"
+down_revision = "0f5b7d19e8a3"
+branch_labels = None
+depends_on = None
+
+_COLUMNS = (
+    ("users", "email", False),
+    ("role_assignments", "email", False),
+    ("platform_role_assignments", "email", False),
+    ("api_tokens", "user_email", True),
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS citext")
+    for table, column, nullable in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=CITEXT(),
+            existing_type=sa.String(255),
+            existing_nullable=nullable,
+        )
+
+
+def downgrade() -> None:
+    for table, column, nullable in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(255),
+            existing_type=CITEXT(),
+            existing_nullable=nullable,
+        )
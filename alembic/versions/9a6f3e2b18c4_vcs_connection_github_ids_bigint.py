@@ -0,0 +1,44 @@
+"""Widen VCS connection GitHub app/installation IDs to BIGINT.
+
+Revision ID: 9a6f3e2b18c4
+Revises: e4a19c07b3d2
+Create Date: 2026-10-16
+
+GitHub app and installation IDs are 64-bit; INTEGER overflows for large
+installation IDs. The uq_vcs_connections_install unique index is rebuilt
+by the type change.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "9a6f3e2b18c4"
+down_revision = "e4a19c07b3d2"
+branch_labels = None
+depends_on = None
+
+_COLUMNS = ("github_app_id", "github_installation_id")
+
+
+def upgrade() -> None:
+    for column in _COLUMNS:
+        op.alter_column(
+            "vcs_connections",
+            column,
+            type_=sa.BigInteger(),
+            existing_type=sa.Integer(),
+            existing_nullable=False,
+            existing_server_default=sa.text("0"),
+        )
+
+
+def downgrade() -> None:
+    for column in _COLUMNS:
+        op.alter_column(
+            "vcs_connections",
+            column,
+            type_=sa.Integer(),
+            existing_type=sa.BigInteger(),
+            existing_nullable=False,
+            existing_server_default=sa.text("0"),
+        )
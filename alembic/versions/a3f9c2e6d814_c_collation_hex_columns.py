@@ -0,0 +1,53 @@
+"""Use the "C" collation for hex digest and SHA columns.
+
+Revision ID: a3f9c2e6d814
+Revises: 4e8b1c7a9d32
+Create Date: 2026-10-16
+
+These columns hold ASCII hex digests, commit SHAs, GPG key IDs and the
+state lineage UUID. Comparisons under the database locale go through
+strcoll; the "C" collation compares bytes. Indexes on these columns
+(uq_gpg_keys) are rebuilt by the change.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "a3f9c2e6d814"
+down_revision = "4e8b1c7a9d32"
+branch_labels = None
+depends_on = None
+
+_COLUMNS = (
+    ("workspaces", "vcs_last_commit_sha", 40),
+    ("state_versions", "lineage", 63),
+    ("state_versions", "md5", 32),
+    ("registry_module_versions", "vcs_commit_sha", 64),
+    ("gpg_keys", "key_id", 40),
+    ("registry_provider_platforms", "shasum", 64),
+    ("cached_provider_packages", "shasum", 64),
+    ("cached_binaries", "shasum", 64),
+    ("runs", "vcs_commit_sha", 40),
+)
+
+
+def upgrade() -> None:
+    for table, column, length in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(length, collation="C"),
+            existing_type=sa.String(length),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    for table, column, length in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(length),
+            existing_type=sa.String(length, collation="C"),
+            existing_nullable=False,
+        )
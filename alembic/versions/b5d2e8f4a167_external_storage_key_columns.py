@@ -0,0 +1,35 @@
+"""Store armored key columns with STORAGE EXTERNAL.
+
+Revision ID: b5d2e8f4a167
+Revises: a3f9c2e6d814
+Create Date: 2026-10-16
+
+gpg_keys.ascii_armor, gpg_keys.private_key and vcs_connections.token hold
+base64/PEM key material that barely compresses and is always read whole.
+EXTERNAL skips the pglz attempt on write and decompression on read; large
+values still move to the TOAST table. Existing rows keep their current
+representation until rewritten.
+"""
+
+from alembic import op
+
+revision = "b5d2e8f4a167"
+down_revision = "a3f9c2e6d814"
+branch_labels = None
+depends_on = None
+
+_COLUMNS = (
+    ("gpg_keys", "ascii_armor"),
+    ("gpg_keys", "private_key"),
+    ("vcs_connections", "token"),
+)
+
+
+def upgrade() -> None:
+    for table, column in _COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET STORAGE EXTERNAL")
+
+
+def downgrade() -> None:
+    for table, column in _COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET STORAGE EXTENDED")
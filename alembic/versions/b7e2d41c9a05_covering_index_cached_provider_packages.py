@@ -0,0 +1,56 @@
+"""Covering index for cached provider package lookups.
+
+Revision ID: b7e2d41c9a05
+Revises: 31c9cd975c1c
+Create Date: 2026-10-16
+
+Provider downloads resolve a package by the full (hostname, namespace, type,
+version, os, arch) key and only need filename/shasum/h1_hash. The index
+INCLUDEs those columns so the lookup can be served from the index alone.
+The (hostname, namespace, type) prefix index is dropped: both the unique
+constraint and the new index already serve that prefix.
+"""
+
+from alembic import op
+
+revision = "b7e2d41c9a05"
+down_revision = "31c9cd975c1c"
+branch_labels = None
+depends_on = None
+
+_TABLE = "cached_provider_packages"
+_KEY = ["hostname", "namespace", "type", "version", "os", "arch"]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_cached_provider_packages_full_lookup",
+            _TABLE,
+            _KEY,
+            postgresql_include=["filename", "shasum", "h1_hash"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_cached_provider_packages_lookup",
+            table_name=_TABLE,
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_cached_provider_packages_lookup",
+            _TABLE,
+            ["hostname", "namespace", "type"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_cached_provider_packages_full_lookup",
+            table_name=_TABLE,
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,58 @@
+"""Replace the runs status index with a partial index on active runs.
+
+Revision ID: c6e1a8d3f52b
+Revises: b5d2e8f4a167
+Create Date: 2026-10-16
+
+Runs settle into applied/errored/discarded/canceled within minutes, so
+ix_runs_status was almost entirely terminal entries that status lookups
+never ask for. ix_runs_active (status, workspace_id) covers only the
+in-flight states polled by the reconciler, listener claim and
+workspace-busy checks, and stays small enough to live in cache.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "c6e1a8d3f52b"
+down_revision = "b5d2e8f4a167"
+branch_labels = None
+depends_on = None
+
+_ACTIVE = "status IN ('pending', 'queued', 'planning', 'planned', 'confirmed', 'applying')"
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_runs_active",
+            "runs",
+            ["status", "workspace_id"],
+            postgresql_where=sa.text(_ACTIVE),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_runs_status",
+            table_name="runs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_runs_status",
+            "runs",
+            ["status"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_runs_active",
+            table_name="runs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
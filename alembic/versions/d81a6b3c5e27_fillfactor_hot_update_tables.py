@@ -0,0 +1,31 @@
+"""Lower fillfactor on frequently updated tables.
+
+Revision ID: d81a6b3c5e27
+Revises: 7c2e9d4a1f60
+Create Date: 2026-10-16
+
+workspaces (lock/unlock, VCS poll bookkeeping) and agent_pool_tokens
+(use_count on every listener join) are updated in place on the hot path.
+A fillfactor of 70 leaves room on each page for HOT updates. The setting
+applies to pages written from now on; existing pages pick it up as they
+are rewritten, so no blocking table rewrite is done here.
+"""
+
+from alembic import op
+
+revision = "d81a6b3c5e27"
+down_revision = "7c2e9d4a1f60"
+branch_labels = None
+depends_on = None
+
+_TABLES = ("workspaces", "agent_pool_tokens")
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        op.execute(f"ALTER TABLE {table} SET (fillfactor = 70)")
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.execute(f"ALTER TABLE {table} RESET (fillfactor)")
@@ -0,0 +1,39 @@
+"""GIN index on workspaces.labels.
+
+Revision ID: e4a19c07b3d2
+Revises: 5d0c8a3f62e1
+Create Date: 2026-10-16
+
+Workspace listing filters by tag via labels @> '{"k": "v"}' and
+labels ? 'k'. Both operators are served by the default jsonb_ops GIN
+operator class (jsonb_path_ops only supports containment).
+"""
+
+from alembic import op
+
+revision = "e4a19c07b3d2"
+down_revision = "5d0c8a3f62e1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_workspaces_labels_gin",
+            "workspaces",
+            ["labels"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_workspaces_labels_gin",
+            table_name="workspaces",
+            postgresql_concurrently=True,
+        )
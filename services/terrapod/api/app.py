@@ -217,6 +217,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     # Shutdown
     logger.info("Shutting down Terrapod API server")
     await close_storage()
+    from terrapod.services.github_service import close_client as close_github_client
+
+    await close_github_client()
     await close_redis()
     await close_db()
 
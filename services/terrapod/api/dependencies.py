@@ -286,7 +286,7 @@ async def authenticate_listener(request: Request) -> "ListenerIdentity":
     # Verify CA signature
     ca = get_ca()
     try:
-        ca.ca_cert.public_key().verify(cert.signature, cert.tbs_certificate_bytes)
+        ca.ca_public_key.verify(cert.signature, cert.tbs_certificate_bytes)
     except (InvalidSignature, Exception):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -459,7 +459,7 @@ async def get_listener_identity(
     # Verify CA signature
     ca = get_ca()
     try:
-        ca.ca_cert.public_key().verify(
+        ca.ca_public_key.verify(
             cert.signature,
             cert.tbs_certificate_bytes,
         )
@@ -10,7 +10,7 @@ instrumentation points (1-2 lines each).
 import time
 
 from fastapi import Request, Response
-from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
 
 # ---------------------------------------------------------------------------
 # HTTP request metrics
@@ -200,6 +200,13 @@ REDIS_ERRORS = Counter(
     ["operation"],
 )
 
+# Read from the engine's pool at scrape time (wired up in init_db()).
+DB_POOL_CONNECTIONS = Gauge(
+    "terrapod_db_pool_connections",
+    "Database pool connections by state",
+    ["state"],
+)
+
 # ---------------------------------------------------------------------------
 # State metrics
 # ---------------------------------------------------------------------------
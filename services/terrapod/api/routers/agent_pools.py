@@ -517,7 +517,10 @@ async def join_listener(
     if token.pool_id != pool.id:
         raise HTTPException(status_code=403, detail="Token does not belong to this pool")
 
-    result = await agent_pool_service.join_listener(pool, token, name, db)
+    if await agent_pool_service.consume_join_token(db, token) is None:
+        raise HTTPException(status_code=401, detail="Invalid or expired join token")
+
+    result = await agent_pool_service.join_listener(pool, name)
     await db.commit()
 
     from terrapod.api.metrics import LISTENER_JOINS
@@ -558,7 +561,10 @@ async def join_listener_by_token(
     if pool is None:
         raise HTTPException(status_code=404, detail="Pool not found")
 
-    result = await agent_pool_service.join_listener(pool, token, name, db)
+    if await agent_pool_service.consume_join_token(db, token) is None:
+        raise HTTPException(status_code=401, detail="Invalid or expired join token")
+
+    result = await agent_pool_service.join_listener(pool, name)
     result["pool_id"] = str(pool.id)
     await db.commit()
 
@@ -631,7 +637,7 @@ async def pool_events(
     """
     from terrapod.api.dependencies import authenticate_request
     from terrapod.db.session import get_db_session
-    from terrapod.redis.client import POOL_EVENTS_PREFIX, subscribe_channel
+    from terrapod.redis.client import POOL_EVENTS_PREFIX, stream_pubsub_events, subscribe_channel
 
     user = await authenticate_request(request)
 
@@ -643,29 +649,9 @@ async def pool_events(
     channel = f"{POOL_EVENTS_PREFIX}{pool_uuid}"
     pubsub = await subscribe_channel(channel)
 
-    async def event_generator():
-        try:
-            while True:
-                if await request.is_disconnected():
-                    break
-                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
-                if message and message["type"] == "message":
-                    data = message["data"]
-                    if isinstance(data, bytes):
-                        data = data.decode()
-                    payload = json.loads(data)
-                    yield {
-                        "event": payload.get("event", "update"),
-                        "data": json.dumps(payload),
-                    }
-                else:
-                    yield {"comment": "keepalive"}
-                    await asyncio.sleep(1)
-        finally:
-            await pubsub.unsubscribe(channel)
-            await pubsub.aclose()
-
-    return EventSourceResponse(event_generator())
+    return EventSourceResponse(
+        stream_pubsub_events(pubsub, channel, request.is_disconnected, "update")
+    )
 
 
 @router.delete("/listeners/{listener_id}", status_code=204)
@@ -711,7 +697,11 @@ async def listener_events(
     Events: run_available, check_job_status, stream_logs, cancel_job.
     """
     from terrapod.api.dependencies import authenticate_listener
-    from terrapod.redis.client import LISTENER_EVENTS_PREFIX, subscribe_channel
+    from terrapod.redis.client import (
+        LISTENER_EVENTS_PREFIX,
+        stream_pubsub_events,
+        subscribe_channel,
+    )
 
     identity = await authenticate_listener(request)
     pool_id = str(identity.pool_id)
@@ -719,29 +709,9 @@ async def listener_events(
     channel = f"{LISTENER_EVENTS_PREFIX}{pool_id}"
     pubsub = await subscribe_channel(channel)
 
-    async def event_generator():
-        try:
-            while True:
-                if await request.is_disconnected():
-                    break
-                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
-                if message and message["type"] == "message":
-                    data = message["data"]
-                    if isinstance(data, bytes):
-                        data = data.decode()
-                    payload = json.loads(data)
-                    yield {
-                        "event": payload.get("event", "message"),
-                        "data": data,
-                    }
-                else:
-                    yield {"comment": "keepalive"}
-                    await asyncio.sleep(1)
-        finally:
-            await pubsub.unsubscribe(channel)
-            await pubsub.aclose()
-
-    return EventSourceResponse(event_generator())
+    return EventSourceResponse(
+        stream_pubsub_events(pubsub, channel, request.is_disconnected, "message")
+    )
 
 
 # ── Heartbeat & Renewal ─────────────────────────────────────────────────
@@ -791,7 +761,7 @@ async def listener_heartbeat(
 
     # Publish heartbeat event to admin dashboard + pool SSE channels
     try:
-        from terrapod.redis.client import ADMIN_EVENTS_CHANNEL, POOL_EVENTS_PREFIX, publish_event
+        from terrapod.redis.client import ADMIN_EVENTS_CHANNEL, POOL_EVENTS_PREFIX, publish_events
 
         heartbeat_payload = json.dumps(
             {
@@ -802,8 +772,10 @@ async def listener_heartbeat(
                 "active_runs": active_runs,
             }
         )
-        await publish_event(ADMIN_EVENTS_CHANNEL, heartbeat_payload)
-        await publish_event(f"{POOL_EVENTS_PREFIX}{listener['pool_id']}", heartbeat_payload)
+        await publish_events(
+            (ADMIN_EVENTS_CHANNEL, f"{POOL_EVENTS_PREFIX}{listener['pool_id']}"),
+            heartbeat_payload,
+        )
     except Exception:
         pass  # Never break heartbeat for SSE
 
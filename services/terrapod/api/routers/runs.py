@@ -22,7 +22,6 @@ Endpoints:
     GET    /api/v2/listeners/{id}/runs/next            (poll for next run)
 """
 
-import asyncio
 import json
 import re
 import uuid
@@ -823,7 +822,7 @@ async def run_events_stream(
     """
     from terrapod.api.dependencies import authenticate_request
     from terrapod.db.session import get_db_session
-    from terrapod.redis.client import RUN_EVENTS_PREFIX, subscribe_channel
+    from terrapod.redis.client import RUN_EVENTS_PREFIX, stream_pubsub_events, subscribe_channel
 
     user = await authenticate_request(request)
 
@@ -840,30 +839,9 @@ async def run_events_stream(
     channel = f"{RUN_EVENTS_PREFIX}{ws_id}"
     pubsub = await subscribe_channel(channel)
 
-    async def event_generator():
-        try:
-            while True:
-                if await request.is_disconnected():
-                    break
-                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
-                if message and message["type"] == "message":
-                    data = message["data"]
-                    if isinstance(data, bytes):
-                        data = data.decode()
-                    payload = json.loads(data)
-                    yield {
-                        "event": payload.get("event", "run_status_change"),
-                        "data": json.dumps(payload),
-                    }
-                else:
-                    # Send keepalive comment every cycle when no messages
-                    yield {"comment": "keepalive"}
-                    await asyncio.sleep(1)
-        finally:
-            await pubsub.unsubscribe(channel)
-            await pubsub.aclose()
-
-    return EventSourceResponse(event_generator())
+    return EventSourceResponse(
+        stream_pubsub_events(pubsub, channel, request.is_disconnected, "run_status_change")
+    )
 
 
 # ── Listener Run Queue ───────────────────────────────────────────────────
@@ -905,8 +883,8 @@ async def next_run(
 
     run, phase = claim
 
-    # Fetch workspace once for variables + var_files
-    ws = await db.get(Workspace, run.workspace_id)
+    # Loaded with the claim query, no extra round-trip
+    ws = run.workspace
 
     # Resolve workspace variables for injection into the runner Job
     from terrapod.services.variable_service import resolve_variables
@@ -987,20 +965,13 @@ async def update_run_status(
         elif target_status == "planned" and run.auto_apply and not run.plan_only:
             run = await run_service.transition_run(db, run, "confirmed")
 
-        # Unlock workspace when plan-only run reaches planned
-        # (plan-only runs don't mutate state, so no need to hold the lock)
-        if target_status == "planned" and run.plan_only:
-            ws = await db.get(Workspace, run.workspace_id)
-            if ws and ws.locked:
-                ws.locked = False
-                ws.lock_id = None
-
-        # Unlock workspace on terminal state
-        if target_status in run_service.TERMINAL_STATES:
-            ws = await db.get(Workspace, run.workspace_id)
-            if ws and ws.locked:
-                ws.locked = False
-                ws.lock_id = None
+        # Unlock workspace on terminal state, or when a plan-only run reaches
+        # planned (plan-only runs don't mutate state, so no need to hold the
+        # lock). Same transaction as the transition above.
+        if target_status in run_service.TERMINAL_STATES or (
+            target_status == "planned" and run.plan_only
+        ):
+            await run_service.unlock_workspace(db, run.workspace_id)
 
         await db.commit()
     except ValueError as e:
@@ -1305,13 +1276,10 @@ async def _serve_log(
         # Try live-streamed data from Redis (available for both in-progress
         # and recently-completed runs where the Job didn't upload final logs)
         try:
-            from terrapod.redis.client import LOG_STREAM_PREFIX, get_redis_client
+            from terrapod.redis.client import LOG_STREAM_PREFIX, get_bytes
 
-            redis = get_redis_client()
-            live_data = await redis.get(f"{LOG_STREAM_PREFIX}{run.id}:{phase}")
+            live_data = await get_bytes(f"{LOG_STREAM_PREFIX}{run.id}:{phase}")
             if live_data is not None:
-                if isinstance(live_data, str):
-                    live_data = live_data.encode()
                 data = live_data
             elif phase_done:
                 # Phase finished, no log in storage or Redis — empty stream
@@ -402,7 +402,6 @@ async def list_varset_vars(
 ) -> JSONResponse:
     """List variables in a variable set."""
     vs = await _get_varset(varset_id, db)
-    await db.refresh(vs, ["variables"])
     return JSONResponse(content={"data": [_vsvar_json(v, varset_id) for v in vs.variables]})
 
 
@@ -9,9 +9,6 @@ Endpoints:
     POST /api/v2/workspaces/{workspace_id}/actions/dismiss-drift — clear drift status
 """
 
-import asyncio
-import json
-
 from fastapi import APIRouter, Depends, HTTPException, Path, Request, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -41,35 +38,21 @@ async def workspace_list_events(
     for auth, then releases before SSE streaming.
     """
     from terrapod.api.dependencies import authenticate_request
-    from terrapod.redis.client import WORKSPACE_LIST_EVENTS_CHANNEL, subscribe_channel
+    from terrapod.redis.client import (
+        WORKSPACE_LIST_EVENTS_CHANNEL,
+        stream_pubsub_events,
+        subscribe_channel,
+    )
 
     await authenticate_request(request)
 
     pubsub = await subscribe_channel(WORKSPACE_LIST_EVENTS_CHANNEL)
 
-    async def event_generator():
-        try:
-            while True:
-                if await request.is_disconnected():
-                    break
-                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
-                if message and message["type"] == "message":
-                    data = message["data"]
-                    if isinstance(data, bytes):
-                        data = data.decode()
-                    payload = json.loads(data)
-                    yield {
-                        "event": payload.get("event", "update"),
-                        "data": json.dumps(payload),
-                    }
-                else:
-                    yield {"comment": "keepalive"}
-                    await asyncio.sleep(1)
-        finally:
-            await pubsub.unsubscribe(WORKSPACE_LIST_EVENTS_CHANNEL)
-            await pubsub.aclose()
-
-    return EventSourceResponse(event_generator())
+    return EventSourceResponse(
+        stream_pubsub_events(
+            pubsub, WORKSPACE_LIST_EVENTS_CHANNEL, request.is_disconnected, "update"
+        )
+    )
 
 
 @router.get("/workspaces/{workspace_id}/vcs-refs")
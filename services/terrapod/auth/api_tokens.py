@@ -1,6 +1,6 @@
 """API token management for terraform CLI and automation.
 
-API tokens are long-lived Bearer tokens stored as SHA-256 hashes in PostgreSQL.
+API tokens are long-lived Bearer tokens stored as SHA-256 digests in PostgreSQL.
 The raw token value is only available at creation time. Lookup is by hash
 (indexed column) on every request.
 
@@ -11,7 +11,7 @@ import hashlib
 import secrets
 from datetime import timedelta
 
-from sqlalchemy import select, update
+from sqlalchemy import bindparam, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from terrapod.config import settings
@@ -24,6 +24,16 @@ logger = get_logger(__name__)
 # Avoids a DB write on every single API request.
 LAST_USED_UPDATE_INTERVAL = 60
 
+# Built once so the per-request auth path reuses the same statement objects
+# (and their compiled-cache entries) instead of constructing new clauses.
+_SELECT_BY_HASH = select(APIToken).where(APIToken.token_hash == bindparam("token_hash"))
+_UPDATE_LAST_USED = (
+    update(APIToken)
+    .where(APIToken.id == bindparam("token_id"))
+    .values(last_used_at=bindparam("last_used_at"))
+    .execution_options(synchronize_session=False)
+)
+
 
 def _generate_token_id() -> str:
     """Generate a token ID in the format 'at-{random}'."""
@@ -37,9 +47,9 @@ def _generate_raw_token() -> str:
     return f"{random_id}.tpod.{random_secret}"
 
 
-def hash_token(raw_token: str) -> str:
-    """SHA-256 hash a raw token for storage."""
-    return hashlib.sha256(raw_token.encode()).hexdigest()
+def hash_token(raw_token: str) -> bytes:
+    """SHA-256 hash a raw token for storage (raw 32-byte digest)."""
+    return hashlib.sha256(raw_token.encode()).digest()
 
 
 async def create_api_token(
@@ -95,7 +105,7 @@ async def validate_api_token(db: AsyncSession, raw_token: str) -> APIToken | Non
     """
     token_hash = hash_token(raw_token)
 
-    result = await db.execute(select(APIToken).where(APIToken.token_hash == token_hash))
+    result = await db.execute(_SELECT_BY_HASH, {"token_hash": token_hash})
     api_token = result.scalar_one_or_none()
 
     if api_token is None:
@@ -120,9 +130,7 @@ async def validate_api_token(db: AsyncSession, raw_token: str) -> APIToken | Non
         or (now - api_token.last_used_at).total_seconds() > LAST_USED_UPDATE_INTERVAL
     )
     if should_update:
-        await db.execute(
-            update(APIToken).where(APIToken.id == api_token.id).values(last_used_at=now)
-        )
+        await db.execute(_UPDATE_LAST_USED, {"token_id": api_token.id, "last_used_at": now})
 
     return api_token
 
@@ -13,6 +13,7 @@ from pathlib import Path
 from cryptography import x509
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import ed25519
+from cryptography.hazmat.primitives.asymmetric.types import CertificatePublicKeyTypes
 from cryptography.x509.oid import NameOID
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -38,6 +39,11 @@ class CertificateAuthority:
     ):
         self._ca_cert = ca_cert
         self._ca_key = ca_key
+        # Derived once here rather than per call — every listener request
+        # verifies against the public key, and the PEM is returned on each
+        # join/renew.
+        self._ca_public_key = ca_cert.public_key()
+        self._ca_cert_pem = ca_cert.public_bytes(serialization.Encoding.PEM).decode()
 
     @property
     def ca_cert(self) -> x509.Certificate:
@@ -47,10 +53,15 @@ class CertificateAuthority:
     def ca_key(self) -> ed25519.Ed25519PrivateKey:
         return self._ca_key
 
+    @property
+    def ca_public_key(self) -> CertificatePublicKeyTypes:
+        """Return the CA public key used to verify listener certificates."""
+        return self._ca_public_key
+
     @property
     def ca_cert_pem(self) -> str:
         """Return the CA certificate as a PEM string."""
-        return self._ca_cert.public_bytes(serialization.Encoding.PEM).decode()
+        return self._ca_cert_pem
 
     @classmethod
     def generate(
@@ -13,7 +13,6 @@ Reads configuration from environment variables:
 """
 
 import asyncio
-import hashlib
 import logging
 import os
 import secrets
@@ -24,6 +23,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 
 from terrapod.auth.passwords import hash_password
 from terrapod.db.models import AgentPool, AgentPoolToken, PlatformRoleAssignment, User
+from terrapod.services.agent_pool_service import hash_join_token
 
 # Use stdlib logging — structlog isn't configured yet during bootstrap
 logger = logging.getLogger("terrapod.bootstrap")
@@ -130,7 +130,7 @@ async def _bootstrap_pool(session: AsyncSession, pool_name: str) -> None:
         logger.info("Created agent pool: %s (id: %s)", pool_name, pool.id)
 
     # Check if a token with this hash already exists (unique constraint spans all pools)
-    token_hash = hashlib.sha256(raw_token.encode()).hexdigest()
+    token_hash = hash_join_token(raw_token)
     result = await session.execute(
         select(AgentPoolToken).where(AgentPoolToken.token_hash == token_hash)
     )
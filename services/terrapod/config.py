@@ -5,6 +5,7 @@ Non-secret configuration loaded from YAML file, secrets from environment variabl
 """
 
 from enum import StrEnum
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Literal
 
@@ -35,6 +36,11 @@ class RunnerImageConfig(BaseModel):
     tag: str = Field(default="")
     pull_policy: str = Field(default="IfNotPresent")
 
+    @cached_property
+    def ref(self) -> str:
+        """Full image reference (``repository[:tag]``), resolved once per config load."""
+        return f"{self.repository}:{self.tag}" if self.tag else self.repository
+
 
 class RunnerConfig(BaseModel):
     """Runner configuration, loaded from /etc/terrapod/runners.yaml.
@@ -454,21 +460,25 @@ class DriftDetectionConfig(BaseModel):
 
 
 class CORSConfig(BaseModel):
-    """CORS (Cross-Origin Resource Sharing) configuration."""
+    """CORS (Cross-Origin Resource Sharing) configuration.
 
-    allow_origins: list[str] = Field(
-        default_factory=list,
-        description="Allowed origins. Empty list means CORS middleware is disabled.",
+    Origins, methods and headers are held as frozensets so the middleware's
+    per-request membership checks are hash lookups rather than list scans.
+    """
+
+    allow_origins: frozenset[str] = Field(
+        default=frozenset(),
+        description="Allowed origins. Empty means CORS middleware is disabled.",
     )
     allow_credentials: bool = Field(
         default=True, description="Allow credentials (cookies, auth headers)"
     )
-    allow_methods: list[str] = Field(
-        default=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_methods: frozenset[str] = Field(
+        default=frozenset({"GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}),
         description="Allowed HTTP methods",
     )
-    allow_headers: list[str] = Field(
-        default=["Content-Type", "Authorization", "X-Request-ID"],
+    allow_headers: frozenset[str] = Field(
+        default=frozenset({"Content-Type", "Authorization", "X-Request-ID"}),
         description="Allowed request headers",
     )
 
@@ -633,6 +643,17 @@ class DatabaseConfig(BaseModel):
         default=30,
         description="Seconds to wait for a connection from the pool before raising an error",
     )
+    pool_use_lifo: bool = Field(
+        default=True,
+        description=(
+            "Hand out the most recently returned connection first, so idle extras "
+            "age out via pool_recycle instead of all being kept warm"
+        ),
+    )
+    pool_prewarm: bool = Field(
+        default=False,
+        description="Open pool_size connections at startup so the first requests skip connect",
+    )
     connect_timeout: int = Field(
         default=10,
         description="Seconds to wait for initial TCP connection to the database",
@@ -641,6 +662,39 @@ class DatabaseConfig(BaseModel):
         default=30,
         description="Seconds to wait for a query to complete",
     )
+    query_cache_size: int = Field(
+        default=1200,
+        description="Size of SQLAlchemy's compiled statement cache (SQLAlchemy default is 500)",
+    )
+
+
+class RedisConfig(BaseModel):
+    """redis-py connection pool settings.
+
+    Every open SSE stream holds a pooled connection for its lifetime, so
+    max_connections must sit above the expected concurrent streams per replica.
+    """
+
+    max_connections: int | None = Field(
+        default=None,
+        description="Cap on pooled Redis connections per replica (unset = redis-py default)",
+    )
+    health_check_interval: int = Field(
+        default=30,
+        description="PING a connection before reuse if idle this many seconds (0 disables)",
+    )
+    socket_keepalive: bool = Field(
+        default=True,
+        description="Enable TCP keepalive so NAT/LB idle timeouts don't silently drop connections",
+    )
+    socket_keepalive_idle: int = Field(
+        default=60,
+        description="Seconds a connection sits idle before the first TCP keepalive probe",
+    )
+    health_cache_seconds: float = Field(
+        default=5.0,
+        description="Reuse a successful readiness-probe PING for this long (0 disables)",
+    )
 
 
 # --- Main Settings ---
@@ -682,6 +736,7 @@ class Settings(BaseSettings):
         default="redis://localhost:6379",
         description="Redis connection URL",
     )
+    redis: RedisConfig = Field(default_factory=RedisConfig)
 
     # Storage
     storage: StorageConfig = Field(default_factory=StorageConfig)
@@ -9,43 +9,44 @@ All models use:
 - Hard deletes (no soft delete columns)
 """
 
+import os
+import time
 import uuid
 from datetime import UTC, datetime
 from typing import Any
 
 import sqlalchemy as sa
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     DateTime,
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
 )
-from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
+from sqlalchemy.dialects.postgresql import ARRAY, CITEXT, JSONB, UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
+# Version (0b0111) and variant (0b10) bits, applied to the 128-bit integer.
+_UUID7_CLEAR = ~((0xF << 76) | (0x3 << 62))
+_UUID7_SET = (0x7 << 76) | (0x2 << 62)
+
 
 def generate_uuid7() -> uuid.UUID:
     """Generate a UUIDv7 (time-sortable UUID)."""
-    import time
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10))
+    return uuid.UUID(int=value & _UUID7_CLEAR | _UUID7_SET)
 
-    timestamp_ms = int(time.time() * 1000)
-    rand_bytes = uuid.uuid4().bytes[6:]
 
-    uuid_bytes = (
-        timestamp_ms.to_bytes(6, "big")
-        + bytes([0x70 | (rand_bytes[0] & 0x0F)])  # Version 7
-        + bytes([0x80 | (rand_bytes[1] & 0x3F)])  # Variant
-        + rand_bytes[2:]
-    )
-    return uuid.UUID(bytes=uuid_bytes)
+_datetime_now = datetime.now
 
 
 def utc_now() -> datetime:
     """Get current UTC datetime."""
-    return datetime.now(UTC)
+    return _datetime_now(UTC)
 
 
 class Base(DeclarativeBase):
@@ -56,26 +57,47 @@ class Base(DeclarativeBase):
     }
 
 
+# Email identity columns are CITEXT; make sure the extension exists before
+# metadata.create_all() (alembic migrations create it explicitly).
+sa.event.listen(Base.metadata, "before_create", sa.DDL("CREATE EXTENSION IF NOT EXISTS citext"))
+
+# Native enums for status columns whose values are only ever written by the
+# server. User-supplied fields (execution_mode, category, ...) stay String so
+# unexpected input surfaces as a validation error rather than a DB error.
+_API_TOKEN_TYPE = sa.Enum("user", "organization", name="api_token_type")
+_REGISTRY_MODULE_STATUS = sa.Enum("pending", "setup_complete", name="registry_module_status")
+_UPLOAD_STATUS = sa.Enum("pending", "uploaded", name="upload_status")
+_VCS_CONNECTION_STATUS = sa.Enum("active", "suspended", "removed", name="vcs_connection_status")
+
+# For models whose defaults are all client-side: never refetch after INSERT,
+# so inserts stay on the batched insertmanyvalues path. A model using this
+# must not have a server_default: the column would stay unloaded after flush,
+# and reading it without a refresh is a lazy load that fails under
+# AsyncSession.
+_NO_REFETCH_MAPPER_ARGS = {"eager_defaults": False}
+
+
 class User(Base):
     """User account model.
 
     PK is email (natural key). Users are identified by email across all
     authentication providers. Permissions live on roles, not on individual users.
+    Email columns are CITEXT so lookups are case-insensitive index hits.
     """
 
     __tablename__ = "users"
 
-    email: Mapped[str] = mapped_column(String(255), primary_key=True)
+    email: Mapped[str] = mapped_column(CITEXT, primary_key=True)
     display_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
     password_hash: Mapped[str | None] = mapped_column(String(255), nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     last_login_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), onupdate=utc_now, nullable=False
     )
 
 
@@ -92,10 +114,18 @@ class Role(Base):
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     # Permissions
-    allow_labels: Mapped[dict[str, Any]] = mapped_column(JSONB, default=dict, nullable=False)
-    allow_names: Mapped[list[str]] = mapped_column(JSONB, default=list, nullable=False)
-    deny_labels: Mapped[dict[str, Any]] = mapped_column(JSONB, default=dict, nullable=False)
-    deny_names: Mapped[list[str]] = mapped_column(JSONB, default=list, nullable=False)
+    allow_labels: Mapped[dict[str, Any]] = mapped_column(
+        JSONB, server_default=sa.text("'{}'::jsonb"), nullable=False
+    )
+    allow_names: Mapped[list[str]] = mapped_column(
+        JSONB, server_default=sa.text("'[]'::jsonb"), nullable=False
+    )
+    deny_labels: Mapped[dict[str, Any]] = mapped_column(
+        JSONB, server_default=sa.text("'{}'::jsonb"), nullable=False
+    )
+    deny_names: Mapped[list[str]] = mapped_column(
+        JSONB, server_default=sa.text("'[]'::jsonb"), nullable=False
+    )
     workspace_permission: Mapped[str] = mapped_column(
         String(20), nullable=False, default="read"
     )  # read, plan, write, admin
@@ -104,10 +134,10 @@ class Role(Base):
     )  # read, write, admin
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), onupdate=utc_now, nullable=False
     )
 
 
@@ -121,12 +151,12 @@ class RoleAssignment(Base):
     __tablename__ = "role_assignments"
 
     provider_name: Mapped[str] = mapped_column(String(63), primary_key=True)
-    email: Mapped[str] = mapped_column(String(255), primary_key=True)
+    email: Mapped[str] = mapped_column(CITEXT, primary_key=True)
     role_name: Mapped[str] = mapped_column(
         String(63), ForeignKey("roles.name", ondelete="CASCADE"), primary_key=True
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
 
 
@@ -140,37 +170,40 @@ class PlatformRoleAssignment(Base):
     __tablename__ = "platform_role_assignments"
 
     provider_name: Mapped[str] = mapped_column(String(63), primary_key=True)
-    email: Mapped[str] = mapped_column(String(255), primary_key=True)
+    email: Mapped[str] = mapped_column(CITEXT, primary_key=True)
     role_name: Mapped[str] = mapped_column(String(63), primary_key=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
 
 
 class APIToken(Base):
     """Long-lived API tokens for terraform CLI and automation.
 
-    Tokens are hashed at rest (SHA-256). The raw token value is only
-    returned once at creation time. Lookup by hash on every request
+    Tokens are hashed at rest (raw 32-byte SHA-256 digest). The raw token
+    value is only returned once at creation time. Lookup by hash on every request
     (indexed column).
     """
 
     __tablename__ = "api_tokens"
 
     id: Mapped[str] = mapped_column(String(63), primary_key=True)  # "at-{uuid7}"
-    token_hash: Mapped[str] = mapped_column(String(64), unique=True, nullable=False, index=True)
+    token_hash: Mapped[bytes] = mapped_column(LargeBinary(32), unique=True, nullable=False)
     description: Mapped[str] = mapped_column(String(255), nullable=False, default="")
-    user_email: Mapped[str | None] = mapped_column(String(255), nullable=True)
-    token_type: Mapped[str] = mapped_column(
-        String(20), nullable=False, default="user"
-    )  # "user", "organization"
+    user_email: Mapped[str | None] = mapped_column(CITEXT, nullable=True)
+    token_type: Mapped[str] = mapped_column(_API_TOKEN_TYPE, nullable=False, default="user")
     last_used_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
     lifespan_hours: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
-    __table_args__ = (Index("ix_api_tokens_user_email", "user_email"),)
+    __table_args__ = (
+        # Equality-only lookup on every request — hash index; uniqueness is
+        # enforced by the column's unique constraint.
+        Index("ix_api_tokens_token_hash", "token_hash", postgresql_using="hash"),
+        Index("ix_api_tokens_user_email", "user_email"),
+    )
 
 
 class AgentPool(Base):
@@ -191,19 +224,19 @@ class AgentPool(Base):
 
     # RBAC
     labels: Mapped[dict[str, Any]] = mapped_column(
-        JSONB, default=dict, server_default="{}", nullable=False
+        JSONB, server_default=sa.text("'{}'::jsonb"), nullable=False
     )
     owner_email: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), onupdate=utc_now, nullable=False
     )
 
     tokens: Mapped[list["AgentPoolToken"]] = relationship(
-        back_populates="pool", passive_deletes=True
+        back_populates="pool", passive_deletes=True, lazy="raise_on_sql"
     )
 
 
@@ -222,7 +255,7 @@ class AgentPoolToken(Base):
     pool_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("agent_pools.id", ondelete="CASCADE"), nullable=False
     )
-    token_hash: Mapped[str] = mapped_column(String(64), unique=True, nullable=False, index=True)
+    token_hash: Mapped[bytes] = mapped_column(LargeBinary(32), unique=True, nullable=False)
     description: Mapped[str] = mapped_column(String(255), nullable=False, default="")
     expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     max_uses: Mapped[int | None] = mapped_column(Integer, nullable=True)
@@ -230,13 +263,23 @@ class AgentPoolToken(Base):
     is_revoked: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
     created_by: Mapped[str] = mapped_column(String(255), nullable=False)
 
-    pool: Mapped["AgentPool"] = relationship(back_populates="tokens")
+    pool: Mapped["AgentPool"] = relationship(back_populates="tokens", lazy="raise_on_sql")
+
+    __table_args__ = (
+        Index("ix_agent_pool_tokens_pool_id", "pool_id"),
+        Index("ix_agent_pool_tokens_token_hash", "token_hash", postgresql_using="hash"),
+    )
+
 
-    __table_args__ = (Index("ix_agent_pool_tokens_pool_id", "pool_id"),)
+# Tables whose rows are updated in place on the hot path (use_count on every
+# listener join; lock/unlock and VCS poll bookkeeping on workspaces). Free
+# space on each page keeps those updates HOT, so indexes are not touched.
+_FILLFACTOR_DDL = sa.DDL("ALTER TABLE %(table)s SET (fillfactor = 70)")
+sa.event.listen(AgentPoolToken.__table__, "after_create", _FILLFACTOR_DDL)
 
 
 # --- Workspace Models ---
@@ -274,7 +317,9 @@ class Workspace(Base):
     resource_memory: Mapped[str] = mapped_column(String(20), nullable=False, default="2Gi")
 
     # RBAC
-    labels: Mapped[dict[str, Any]] = mapped_column(JSONB, default=dict, nullable=False)
+    labels: Mapped[dict[str, Any]] = mapped_column(
+        JSONB, server_default=sa.text("'{}'::jsonb"), nullable=False
+    )
     owner_email: Mapped[str] = mapped_column(String(255), nullable=False, default="")
 
     # VCS integration
@@ -288,7 +333,9 @@ class Workspace(Base):
     )
     vcs_repo_url: Mapped[str] = mapped_column(String(500), nullable=False, default="")
     vcs_branch: Mapped[str] = mapped_column(String(255), nullable=False, default="")
-    vcs_last_commit_sha: Mapped[str] = mapped_column(String(40), nullable=False, default="")
+    vcs_last_commit_sha: Mapped[str] = mapped_column(
+        String(40, collation="C"), nullable=False, default=""
+    )
 
     # VCS polling health
     vcs_last_polled_at: Mapped[datetime | None] = mapped_column(
@@ -325,23 +372,39 @@ class Workspace(Base):
     state_diverged: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="false")
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), onupdate=utc_now, nullable=False
     )
 
     state_versions: Mapped[list["StateVersion"]] = relationship(
-        back_populates="workspace", cascade="all, delete-orphan"
+        back_populates="workspace",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     variables: Mapped[list["Variable"]] = relationship(
-        back_populates="workspace", cascade="all, delete-orphan"
+        back_populates="workspace",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     runs: Mapped[list["Run"]] = relationship(
-        back_populates="workspace", cascade="all, delete-orphan"
+        back_populates="workspace",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
-    __table_args__ = (sa.UniqueConstraint("name", name="uq_workspaces"),)
+    __table_args__ = (
+        sa.UniqueConstraint("name", name="uq_workspaces"),
+        # Tag filters use both @> and ? — jsonb_path_ops would not serve ?.
+        Index("ix_workspaces_labels_gin", "labels", postgresql_using="gin"),
+    )
+
+
+sa.event.listen(Workspace.__table__, "after_create", _FILLFACTOR_DDL)
 
 
 class StateVersion(Base):
@@ -362,8 +425,8 @@ class StateVersion(Base):
         nullable=False,
     )
     serial: Mapped[int] = mapped_column(Integer, nullable=False)
-    lineage: Mapped[str] = mapped_column(String(63), nullable=False, default="")
-    md5: Mapped[str] = mapped_column(String(32), nullable=False, default="")
+    lineage: Mapped[str] = mapped_column(String(63, collation="C"), nullable=False, default="")
+    md5: Mapped[str] = mapped_column(String(32, collation="C"), nullable=False, default="")
     state_size: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     run_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True),
@@ -376,14 +439,18 @@ class StateVersion(Base):
         DateTime(timezone=True), default=utc_now, nullable=False
     )
 
-    workspace: Mapped["Workspace"] = relationship(back_populates="state_versions")
+    workspace: Mapped["Workspace"] = relationship(
+        back_populates="state_versions", lazy="raise_on_sql"
+    )
 
     __table_args__ = (
+        # Also serves workspace_id lookups and the "latest serial" backward scan.
         sa.UniqueConstraint("workspace_id", "serial", name="uq_state_versions"),
-        Index("ix_state_versions_workspace_id", "workspace_id"),
         Index("ix_state_versions_run_id", "run_id"),
     )
 
+    __mapper_args__ = _NO_REFETCH_MAPPER_ARGS
+
 
 # --- Registry Models ---
 
@@ -402,8 +469,10 @@ class RegistryModule(Base):
     namespace: Mapped[str] = mapped_column(String(63), nullable=False)
     name: Mapped[str] = mapped_column(String(63), nullable=False)
     provider: Mapped[str] = mapped_column(String(63), nullable=False)
-    status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending")
-    labels: Mapped[dict[str, Any]] = mapped_column(JSONB, default=dict, nullable=False)
+    status: Mapped[str] = mapped_column(_REGISTRY_MODULE_STATUS, nullable=False, default="pending")
+    labels: Mapped[dict[str, Any]] = mapped_column(
+        JSONB, server_default=sa.text("'{}'::jsonb"), nullable=False
+    )
     owner_email: Mapped[str] = mapped_column(String(255), nullable=False, default="")
 
     # VCS source tracking
@@ -420,17 +489,23 @@ class RegistryModule(Base):
     vcs_last_pr_shas: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), onupdate=utc_now, nullable=False
     )
 
     versions: Mapped[list["RegistryModuleVersion"]] = relationship(
-        back_populates="module", cascade="all, delete-orphan"
+        back_populates="module",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     workspace_links: Mapped[list["ModuleWorkspaceLink"]] = relationship(
-        back_populates="module", cascade="all, delete-orphan"
+        back_populates="module",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     __table_args__ = (
@@ -452,18 +527,20 @@ class RegistryModuleVersion(Base):
         nullable=False,
     )
     version: Mapped[str] = mapped_column(String(63), nullable=False)
-    upload_status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending")
-    vcs_commit_sha: Mapped[str] = mapped_column(String(64), nullable=False, default="")
+    upload_status: Mapped[str] = mapped_column(_UPLOAD_STATUS, nullable=False, default="pending")
+    vcs_commit_sha: Mapped[str] = mapped_column(
+        String(64, collation="C"), nullable=False, default=""
+    )
     vcs_tag: Mapped[str] = mapped_column(String(255), nullable=False, default="")
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), onupdate=utc_now, nullable=False
     )
 
-    module: Mapped["RegistryModule"] = relationship(back_populates="versions")
+    module: Mapped["RegistryModule"] = relationship(back_populates="versions", lazy="raise_on_sql")
 
     __table_args__ = (
         sa.UniqueConstraint("module_id", "version", name="uq_registry_module_versions"),
@@ -494,11 +571,13 @@ class ModuleWorkspaceLink(Base):
         nullable=False,
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
     created_by: Mapped[str] = mapped_column(Text, nullable=False)
 
-    module: Mapped["RegistryModule"] = relationship(back_populates="workspace_links")
+    module: Mapped["RegistryModule"] = relationship(
+        back_populates="workspace_links", lazy="raise_on_sql"
+    )
     workspace: Mapped["Workspace"] = relationship(lazy="joined")
 
     __table_args__ = (
@@ -518,18 +597,23 @@ class RegistryProvider(Base):
     )
     namespace: Mapped[str] = mapped_column(String(63), nullable=False)
     name: Mapped[str] = mapped_column(String(63), nullable=False)
-    labels: Mapped[dict[str, Any]] = mapped_column(JSONB, default=dict, nullable=False)
+    labels: Mapped[dict[str, Any]] = mapped_column(
+        JSONB, server_default=sa.text("'{}'::jsonb"), nullable=False
+    )
     owner_email: Mapped[str] = mapped_column(String(255), nullable=False, default="")
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), onupdate=utc_now, nullable=False
     )
 
     versions: Mapped[list["RegistryProviderVersion"]] = relationship(
-        back_populates="provider", cascade="all, delete-orphan"
+        back_populates="provider",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     __table_args__ = (sa.UniqueConstraint("namespace", "name", name="uq_registry_providers"),)
@@ -543,22 +627,38 @@ class GPGKey(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=generate_uuid7
     )
-    key_id: Mapped[str] = mapped_column(String(40), nullable=False)
+    key_id: Mapped[str] = mapped_column(String(40, collation="C"), nullable=False)
     ascii_armor: Mapped[str] = mapped_column(Text, nullable=False)
     source: Mapped[str] = mapped_column(String(63), nullable=False, default="terrapod")
     source_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
-    private_key: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Only the signing path reads the armored private key; keep it out of
+    # every other GPGKey load (undefer() explicitly where it is needed).
+    private_key: Mapped[str | None] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_raiseload=True
+    )
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), onupdate=utc_now, nullable=False
     )
 
     __table_args__ = (sa.UniqueConstraint("key_id", name="uq_gpg_keys"),)
 
 
+# Armored keys barely compress (base64) and are read whole, so skip pglz on
+# write and read; values past the TOAST threshold go out of line as-is.
+sa.event.listen(
+    GPGKey.__table__,
+    "after_create",
+    sa.DDL(
+        "ALTER TABLE %(table)s ALTER COLUMN ascii_armor SET STORAGE EXTERNAL,"
+        " ALTER COLUMN private_key SET STORAGE EXTERNAL"
+    ),
+)
+
+
 class RegistryProviderVersion(Base):
     """Version of a registry provider with GPG key ref and shasums tracking."""
 
@@ -579,23 +679,28 @@ class RegistryProviderVersion(Base):
         nullable=True,
     )
     protocols: Mapped[dict[str, Any]] = mapped_column(
-        JSONB, nullable=False, default=lambda: ["5.0"]
+        JSONB, nullable=False, server_default=sa.text("'[\"5.0\"]'::jsonb")
     )
     shasums_uploaded: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     shasums_sig_uploaded: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), onupdate=utc_now, nullable=False
     )
 
-    provider: Mapped["RegistryProvider"] = relationship(back_populates="versions")
+    provider: Mapped["RegistryProvider"] = relationship(
+        back_populates="versions", lazy="raise_on_sql"
+    )
     platforms: Mapped[list["RegistryProviderPlatform"]] = relationship(
-        back_populates="version", cascade="all, delete-orphan"
+        back_populates="version",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
-    gpg_key: Mapped["GPGKey | None"] = relationship()
+    gpg_key: Mapped["GPGKey | None"] = relationship(lazy="raise_on_sql")
 
     __table_args__ = (
         sa.UniqueConstraint("provider_id", "version", name="uq_registry_provider_versions"),
@@ -617,15 +722,17 @@ class RegistryProviderPlatform(Base):
     )
     os: Mapped[str] = mapped_column(String(20), nullable=False)
     arch: Mapped[str] = mapped_column(String(20), nullable=False)
-    shasum: Mapped[str] = mapped_column(String(64), nullable=False, default="")
+    shasum: Mapped[str] = mapped_column(String(64, collation="C"), nullable=False, default="")
     filename: Mapped[str] = mapped_column(String(255), nullable=False, default="")
-    upload_status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending")
+    upload_status: Mapped[str] = mapped_column(_UPLOAD_STATUS, nullable=False, default="pending")
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
 
-    version: Mapped["RegistryProviderVersion"] = relationship(back_populates="platforms")
+    version: Mapped["RegistryProviderVersion"] = relationship(
+        back_populates="platforms", lazy="raise_on_sql"
+    )
 
     __table_args__ = (
         sa.UniqueConstraint("version_id", "os", "arch", name="uq_registry_provider_platforms"),
@@ -650,13 +757,13 @@ class CachedProviderPackage(Base):
     os: Mapped[str] = mapped_column(String(20), nullable=False)
     arch: Mapped[str] = mapped_column(String(20), nullable=False)
     filename: Mapped[str] = mapped_column(String(255), nullable=False)
-    shasum: Mapped[str] = mapped_column(String(64), nullable=False)
+    shasum: Mapped[str] = mapped_column(String(64, collation="C"), nullable=False)
     h1_hash: Mapped[str] = mapped_column(String(64), nullable=False, default="")
     cached_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
     last_accessed_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
 
     __table_args__ = (
@@ -669,7 +776,17 @@ class CachedProviderPackage(Base):
             "arch",
             name="uq_cached_provider_packages",
         ),
-        Index("ix_cached_provider_packages_lookup", "hostname", "namespace", "type"),
+        # Covers the exact-platform lookup so filename/shasum come from the index.
+        Index(
+            "ix_cached_provider_packages_full_lookup",
+            "hostname",
+            "namespace",
+            "type",
+            "version",
+            "os",
+            "arch",
+            postgresql_include=["filename", "shasum", "h1_hash"],
+        ),
     )
 
 
@@ -685,13 +802,13 @@ class CachedBinary(Base):
     version: Mapped[str] = mapped_column(String(63), nullable=False)
     os: Mapped[str] = mapped_column(String(20), nullable=False)
     arch: Mapped[str] = mapped_column(String(20), nullable=False)
-    shasum: Mapped[str] = mapped_column(String(64), nullable=False, default="")
+    shasum: Mapped[str] = mapped_column(String(64, collation="C"), nullable=False, default="")
     download_url: Mapped[str] = mapped_column(String(1000), nullable=False, default="")
     cached_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
     last_accessed_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
 
     __table_args__ = (
@@ -716,7 +833,7 @@ class CertificateAuthorityModel(Base):
     ca_cert: Mapped[str] = mapped_column(Text, nullable=False)
     ca_key_encrypted: Mapped[str] = mapped_column(Text, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
 
 
@@ -750,22 +867,20 @@ class VCSConnection(Base):
     )  # PAT (GitLab) or PEM private key (GitHub App)
 
     # GitHub-specific
-    github_app_id: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
-    github_installation_id: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    github_app_id: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    github_installation_id: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
     github_account_login: Mapped[str] = mapped_column(String(255), nullable=False, default="")
     github_account_type: Mapped[str] = mapped_column(
         String(20), nullable=False, default=""
     )  # Organization, User (GitHub only)
 
-    status: Mapped[str] = mapped_column(
-        String(20), nullable=False, default="active"
-    )  # active, suspended, removed
+    status: Mapped[str] = mapped_column(_VCS_CONNECTION_STATUS, nullable=False, default="active")
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), onupdate=utc_now, nullable=False
     )
 
     __table_args__ = (
@@ -775,6 +890,14 @@ class VCSConnection(Base):
     )
 
 
+# PEM private key / PAT; same reasoning as the GPG key columns.
+sa.event.listen(
+    VCSConnection.__table__,
+    "after_create",
+    sa.DDL("ALTER TABLE %(table)s ALTER COLUMN token SET STORAGE EXTERNAL"),
+)
+
+
 # --- Variables ---
 
 
@@ -812,13 +935,15 @@ class Variable(Base):
         DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False
     )
 
-    workspace: Mapped["Workspace"] = relationship(back_populates="variables")
+    workspace: Mapped["Workspace"] = relationship(back_populates="variables", lazy="raise_on_sql")
 
     __table_args__ = (
+        # Serves the per-run "WHERE workspace_id = ? ORDER BY key" read.
         sa.UniqueConstraint("workspace_id", "key", name="uq_variables_workspace_key"),
-        Index("ix_variables_workspace_id", "workspace_id"),
     )
 
+    __mapper_args__ = _NO_REFETCH_MAPPER_ARGS
+
 
 class VariableSet(Base):
     """Organization-scoped variable set, applicable to multiple workspaces."""
@@ -834,17 +959,24 @@ class VariableSet(Base):
     priority: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), onupdate=utc_now, nullable=False
     )
 
+    # Every caller needs the set's variables. selectin batches them in one
+    # IN query; a joined load would repeat the parent row for each variable.
     variables: Mapped[list["VariableSetVariable"]] = relationship(
-        back_populates="variable_set", cascade="all, delete-orphan"
+        back_populates="variable_set",
+        cascade="all, delete-orphan",
+        lazy="selectin",
+        passive_deletes=True,
     )
     workspace_assignments: Mapped[list["VariableSetWorkspace"]] = relationship(
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     __table_args__ = (sa.UniqueConstraint("name", name="uq_variable_sets"),)
@@ -872,13 +1004,15 @@ class VariableSetVariable(Base):
     version_id: Mapped[str] = mapped_column(String(64), nullable=False, default="")
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), onupdate=utc_now, nullable=False
     )
 
-    variable_set: Mapped["VariableSet"] = relationship(back_populates="variables")
+    variable_set: Mapped["VariableSet"] = relationship(
+        back_populates="variables", lazy="raise_on_sql"
+    )
 
     __table_args__ = (
         sa.UniqueConstraint("variable_set_id", "key", name="uq_variable_set_variables"),
@@ -931,7 +1065,7 @@ class ConfigurationVersion(Base):
     speculative: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
 
     __table_args__ = (Index("ix_configuration_versions_workspace_id", "workspace_id"),)
@@ -1004,7 +1138,9 @@ class Run(Base):
     job_namespace: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
     # VCS metadata
-    vcs_commit_sha: Mapped[str] = mapped_column(String(40), nullable=False, default="")
+    vcs_commit_sha: Mapped[str] = mapped_column(
+        String(40, collation="C"), nullable=False, default=""
+    )
     vcs_branch: Mapped[str] = mapped_column(String(255), nullable=False, default="")
     vcs_pull_request_number: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
@@ -1020,6 +1156,8 @@ class Run(Base):
     )
     created_by: Mapped[str] = mapped_column(String(255), nullable=False, default="")
 
+    # Python-side on purpose: created_at is the run queue's FIFO key, and
+    # now() would give every run inserted in one transaction the same value.
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=utc_now, nullable=False
     )
@@ -1027,13 +1165,24 @@ class Run(Base):
         DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False
     )
 
-    workspace: Mapped["Workspace"] = relationship(back_populates="runs")
+    workspace: Mapped["Workspace"] = relationship(back_populates="runs", lazy="raise_on_sql")
 
     __table_args__ = (
         Index("ix_runs_workspace_id", "workspace_id"),
-        Index("ix_runs_status", "status"),
+        # Only in-flight runs: the reconciler, listener claim and busy checks
+        # never look up terminal runs by status, and those are nearly all rows.
+        Index(
+            "ix_runs_active",
+            "status",
+            "workspace_id",
+            postgresql_where=sa.text(
+                "status IN ('pending', 'queued', 'planning', 'planned', 'confirmed', 'applying')"
+            ),
+        ),
     )
 
+    __mapper_args__ = _NO_REFETCH_MAPPER_ARGS
+
 
 # --- Audit Logs ---
 
@@ -1052,7 +1201,7 @@ class AuditLog(Base):
         UUID(as_uuid=True), primary_key=True, default=generate_uuid7
     )
     timestamp: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
     actor_email: Mapped[str] = mapped_column(String(255), nullable=False, default="")
     actor_ip: Mapped[str] = mapped_column(String(45), nullable=False, default="")
@@ -1066,7 +1215,7 @@ class AuditLog(Base):
     duration_ms: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     detail: Mapped[str] = mapped_column(Text, nullable=False, default="")
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
 
     __table_args__ = (
@@ -1104,11 +1253,13 @@ class RunTrigger(Base):
     )
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
 
-    workspace: Mapped["Workspace"] = relationship(foreign_keys=[workspace_id])
-    source_workspace: Mapped["Workspace"] = relationship(foreign_keys=[source_workspace_id])
+    workspace: Mapped["Workspace"] = relationship(foreign_keys=[workspace_id], lazy="raise_on_sql")
+    source_workspace: Mapped["Workspace"] = relationship(
+        foreign_keys=[source_workspace_id], lazy="raise_on_sql"
+    )
 
     __table_args__ = (
         sa.UniqueConstraint("workspace_id", "source_workspace_id", name="uq_run_triggers"),
@@ -1143,18 +1294,24 @@ class NotificationConfiguration(Base):
     url: Mapped[str] = mapped_column(String(2000), nullable=False, default="")
     token: Mapped[str | None] = mapped_column(Text, nullable=True)
     enabled: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
-    triggers: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False, default=list)
-    email_addresses: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False, default=list)
-    delivery_responses: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False, default=list)
+    triggers: Mapped[dict[str, Any]] = mapped_column(
+        JSONB, nullable=False, server_default=sa.text("'[]'::jsonb")
+    )
+    email_addresses: Mapped[dict[str, Any]] = mapped_column(
+        JSONB, nullable=False, server_default=sa.text("'[]'::jsonb")
+    )
+    delivery_responses: Mapped[dict[str, Any]] = mapped_column(
+        JSONB, nullable=False, server_default=sa.text("'[]'::jsonb")
+    )
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), onupdate=utc_now, nullable=False
     )
 
-    workspace: Mapped["Workspace"] = relationship()
+    workspace: Mapped["Workspace"] = relationship(lazy="raise_on_sql")
 
     __table_args__ = (Index("ix_notification_configurations_workspace_id", "workspace_id"),)
 
@@ -1189,13 +1346,13 @@ class RunTask(Base):
     )  # mandatory, advisory
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), onupdate=utc_now, nullable=False
     )
 
-    workspace: Mapped["Workspace"] = relationship()
+    workspace: Mapped["Workspace"] = relationship(lazy="raise_on_sql")
 
     __table_args__ = (Index("ix_run_tasks_workspace_id", "workspace_id"),)
 
@@ -1223,14 +1380,17 @@ class TaskStage(Base):
     )  # pending/running/passed/failed/errored/canceled/overridden
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), onupdate=utc_now, nullable=False
     )
 
     results: Mapped[list["TaskStageResult"]] = relationship(
-        back_populates="task_stage", cascade="all, delete-orphan"
+        back_populates="task_stage",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     __table_args__ = (Index("ix_task_stages_run_id", "run_id"),)
@@ -1268,10 +1428,10 @@ class TaskStageResult(Base):
     started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), server_default=sa.func.now(), nullable=False
     )
 
-    task_stage: Mapped["TaskStage"] = relationship(back_populates="results")
-    run_task: Mapped["RunTask | None"] = relationship()
+    task_stage: Mapped["TaskStage"] = relationship(back_populates="results", lazy="raise_on_sql")
+    run_task: Mapped["RunTask | None"] = relationship(lazy="raise_on_sql")
 
     __table_args__ = (Index("ix_task_stage_results_task_stage_id", "task_stage_id"),)
@@ -5,6 +5,7 @@ Provides async SQLAlchemy session factory for database access.
 Single engine (no read replica for MVP).
 """
 
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
@@ -35,6 +36,8 @@ async def init_db() -> None:
         max_overflow=db_cfg.max_overflow,
         pool_recycle=db_cfg.pool_recycle,
         pool_timeout=db_cfg.pool_timeout,
+        pool_use_lifo=db_cfg.pool_use_lifo,
+        query_cache_size=db_cfg.query_cache_size,
         connect_args={
             "timeout": db_cfg.connect_timeout,
             "command_timeout": db_cfg.command_timeout,
@@ -49,10 +52,24 @@ async def init_db() -> None:
         autoflush=False,
     )
 
+    from terrapod.api.metrics import DB_POOL_CONNECTIONS
+
+    pool = _engine.pool
+    DB_POOL_CONNECTIONS.labels(state="checked_out").set_function(pool.checkedout)
+    DB_POOL_CONNECTIONS.labels(state="idle").set_function(pool.checkedin)
+    DB_POOL_CONNECTIONS.labels(state="overflow").set_function(lambda: max(pool.overflow(), 0))
+
     async with _engine.begin() as conn:
         await conn.execute(text("SELECT 1"))
     logger.info("Database connection established")
 
+    if db_cfg.pool_prewarm:
+        # Open pool_size connections concurrently and hand them straight back,
+        # so the pool starts full instead of connecting on the first requests.
+        conns = await asyncio.gather(*(_engine.connect() for _ in range(db_cfg.pool_size)))
+        await asyncio.gather(*(conn.close() for conn in conns))
+        logger.info("Database pool pre-warmed", connections=len(conns))
+
 
 async def close_db() -> None:
     """Close database connection pool."""
@@ -79,7 +96,9 @@ async def get_db() -> AsyncGenerator[AsyncSession]:
     async with _async_session_factory() as session:
         try:
             yield session
-            await session.commit()
+            # Nothing to commit if no statement ever began a transaction.
+            if session.in_transaction():
+                await session.commit()
         except Exception:
             from terrapod.api.metrics import DB_ERRORS
 
@@ -101,7 +120,8 @@ async def get_db_session() -> AsyncGenerator[AsyncSession]:
     async with _async_session_factory() as session:
         try:
             yield session
-            await session.commit()
+            if session.in_transaction():
+                await session.commit()
         except Exception:
             from terrapod.api.metrics import DB_ERRORS
 
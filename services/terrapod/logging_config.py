@@ -6,9 +6,10 @@ Configures structlog for JSON output in production and console in development.
 
 import logging
 import sys
-from datetime import UTC, datetime
+import time
 from typing import Any
 
+import orjson
 import structlog
 from structlog.types import EventDict, Processor
 
@@ -34,13 +35,32 @@ def reorder_keys(logger: Any, method_name: str, event_dict: EventDict) -> EventD
     return new_dict
 
 
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") — strftime runs once per second, not
+# once per log event. Replaced as a whole tuple so threads never see a torn pair.
+_ts_cache: tuple[int, str] = (-1, "")
+
+
 def utc_timestamper(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
-    """Add ISO8601 UTC timestamp to log events."""
-    now = datetime.now(UTC)
-    event_dict["timestamp"] = now.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+    """Add ISO8601 UTC timestamp (millisecond precision) to log events."""
+    global _ts_cache  # noqa: PLW0603
+    now = time.time()
+    sec = int(now)
+    cached_sec, prefix = _ts_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _ts_cache = (sec, prefix)
+    event_dict["timestamp"] = f"{prefix}.{int((now - sec) * 1000):03d}Z"
     return event_dict
 
 
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log event with orjson, returning str for stdlib handlers.
+
+    OPT_NON_STR_KEYS keeps parity with stdlib json, which accepts int keys.
+    """
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, **kwargs).decode()
+
+
 def configure_logging(json_logs: bool = True, log_level: str = "INFO") -> None:
     """Configure logging for the entire application."""
     level = getattr(logging, log_level.upper(), logging.INFO)
@@ -51,12 +71,15 @@ def configure_logging(json_logs: bool = True, log_level: str = "INFO") -> None:
         level=level,
     )
 
+    # Calls below the configured level become no-ops on the bound logger
+    # itself, before any processor runs.
+    wrapper_class = structlog.make_filtering_bound_logger(level)
+
     shared_processors: list[Processor] = [
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
         utc_timestamper,
-        structlog.processors.StackInfoRenderer(),
         add_app_context,
     ]
 
@@ -67,7 +90,7 @@ def configure_logging(json_logs: bool = True, log_level: str = "INFO") -> None:
                 structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
             ],
             logger_factory=structlog.stdlib.LoggerFactory(),
-            wrapper_class=structlog.stdlib.BoundLogger,
+            wrapper_class=wrapper_class,
             cache_logger_on_first_use=True,
         )
 
@@ -76,7 +99,7 @@ def configure_logging(json_logs: bool = True, log_level: str = "INFO") -> None:
             processors=[
                 structlog.stdlib.ProcessorFormatter.remove_processors_meta,
                 reorder_keys,
-                structlog.processors.JSONRenderer(),
+                structlog.processors.JSONRenderer(serializer=_orjson_dumps),
             ],
         )
     else:
@@ -86,7 +109,7 @@ def configure_logging(json_logs: bool = True, log_level: str = "INFO") -> None:
                 structlog.dev.ConsoleRenderer(colors=True),
             ],
             logger_factory=structlog.stdlib.LoggerFactory(),
-            wrapper_class=structlog.stdlib.BoundLogger,
+            wrapper_class=wrapper_class,
             cache_logger_on_first_use=True,
         )
 
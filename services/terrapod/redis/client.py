@@ -5,9 +5,12 @@ Provides async Redis client, health checking, and FastAPI dependency injection.
 Follows the same lifecycle pattern as db/session.py.
 """
 
-from collections.abc import AsyncGenerator
+import socket
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
 
 import redis.asyncio as aioredis
+from redis.client import NEVER_DECODE
 from terrapod.config import settings
 from terrapod.logging_config import get_logger
 
@@ -16,14 +19,25 @@ logger = get_logger(__name__)
 # Module-level client reference, initialized in lifespan
 _redis: aioredis.Redis | None = None
 
+# monotonic() of the last successful readiness PING (-inf = never)
+_last_healthy = float("-inf")
+
 
 async def init_redis() -> None:
     """Initialize Redis connection pool."""
     global _redis  # noqa: PLW0603
     logger.info("Initializing Redis connection")
+    cfg = settings.redis
+    keepalive_options: dict[int, int] = {}
+    if cfg.socket_keepalive and hasattr(socket, "TCP_KEEPIDLE"):
+        keepalive_options[socket.TCP_KEEPIDLE] = cfg.socket_keepalive_idle
     _redis = aioredis.from_url(
         str(settings.redis_url),
         decode_responses=True,
+        max_connections=cfg.max_connections,
+        health_check_interval=cfg.health_check_interval,
+        socket_keepalive=cfg.socket_keepalive,
+        socket_keepalive_options=keepalive_options or None,
     )
     # Test connection
     await _redis.ping()
@@ -32,7 +46,8 @@ async def init_redis() -> None:
 
 async def close_redis() -> None:
     """Close Redis connection pool."""
-    global _redis  # noqa: PLW0603
+    global _redis, _last_healthy  # noqa: PLW0603
+    _last_healthy = float("-inf")
     if _redis is not None:
         logger.info("Closing Redis connection pool")
         await _redis.aclose()
@@ -59,13 +74,23 @@ async def get_redis() -> AsyncGenerator[aioredis.Redis]:
 
 
 async def get_redis_health() -> bool:
-    """Check Redis health for readiness probe."""
+    """Check Redis health for readiness probe.
+
+    A successful PING is reused for settings.redis.health_cache_seconds, so
+    frequent probes across replicas don't each cost a Redis round trip.
+    """
+    global _last_healthy  # noqa: PLW0603
     try:
         if _redis is None:
             return False
+        now = time.monotonic()
+        if now - _last_healthy < settings.redis.health_cache_seconds:
+            return True
         await _redis.ping()
+        _last_healthy = now
         return True
     except Exception as e:
+        _last_healthy = float("-inf")
         from terrapod.api.metrics import REDIS_ERRORS
 
         REDIS_ERRORS.labels(operation="health_check").inc()
@@ -84,12 +109,33 @@ JOB_STATUS_PREFIX = "tp:job_status:"  # per-run job status cache
 LOG_STREAM_PREFIX = "tp:log_stream:"  # per-run live log cache
 
 
+async def get_bytes(key: str) -> bytes | None:
+    """GET a binary value as raw bytes.
+
+    The shared client decodes replies as UTF-8, which would re-encode live
+    log blobs on every read and fail on a tail cut mid-character.
+    """
+    return await get_redis_client().execute_command("GET", key, **{NEVER_DECODE: True})
+
+
 async def publish_event(channel: str, data: str) -> None:
     """Publish a message to a Redis pub/sub channel."""
     client = get_redis_client()
     await client.publish(channel, data)
 
 
+async def publish_events(channels: Iterable[str], data: str) -> None:
+    """Publish one message to several channels in a single round trip.
+
+    Non-transactional pipeline: the channels may hash to different cluster
+    slots, and subscribers don't need the fan-out to be atomic.
+    """
+    pipe = get_redis_client().pipeline(transaction=False)
+    for channel in channels:
+        pipe.publish(channel, data)
+    await pipe.execute()
+
+
 async def subscribe_channel(channel: str) -> aioredis.client.PubSub:
     """Create a pub/sub subscription and return the PubSub object."""
     client = get_redis_client()
@@ -98,6 +144,49 @@ async def subscribe_channel(channel: str) -> aioredis.client.PubSub:
     return pubsub
 
 
+# How long one get_message() call blocks waiting for a message. An idle SSE
+# stream gets a keepalive comment at this cadence.
+SSE_IDLE_TIMEOUT = 2.0
+
+
+async def stream_pubsub_events(
+    pubsub: aioredis.client.PubSub,
+    channel: str,
+    is_disconnected: Callable[[], Awaitable[bool]],
+    default_event: str,
+) -> AsyncGenerator[dict]:
+    """Relay pub/sub messages as SSE events until the client disconnects.
+
+    Each message's JSON "event" field becomes the SSE event name (falling back
+    to default_event), and the raw message is forwarded as the data. The
+    subscription is closed when the stream ends.
+
+    get_message() blocks for up to SSE_IDLE_TIMEOUT, so an empty result means
+    the channel was idle for that long: send a keepalive and loop straight back
+    instead of sleeping, which would delay events published in the meantime.
+    """
+    import json
+
+    try:
+        while not await is_disconnected():
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=SSE_IDLE_TIMEOUT
+            )
+            if message and message["type"] == "message":
+                data = message["data"]
+                if isinstance(data, bytes):
+                    data = data.decode()
+                yield {
+                    "event": json.loads(data).get("event", default_event),
+                    "data": data,
+                }
+            else:
+                yield {"comment": "keepalive"}
+    finally:
+        await pubsub.unsubscribe(channel)
+        await pubsub.aclose()
+
+
 async def publish_workspace_event(
     workspace_id: str, event_type: str, extra: dict | None = None
 ) -> None:
@@ -39,16 +39,22 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import functools
 import hashlib
 import os
 import uuid
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 
 from cryptography import x509
 
 from terrapod.logging_config import get_logger
 
+if TYPE_CHECKING:
+    import httpx
+
 logger = get_logger(__name__)
 
 
@@ -82,9 +88,9 @@ async def establish_identity() -> ListenerIdentity:
     name = os.environ.get("TERRAPOD_LISTENER_NAME", "listener")
     api_url = os.environ.get("TERRAPOD_API_URL", "http://localhost:8000")
     secret_name = _credentials_secret_name(name)
-    namespace = _read_in_pod_namespace()
+    namespace = await _off_loop(_read_in_pod_namespace)
 
-    secret = _read_secret(secret_name, namespace)
+    secret = await _off_loop(_read_secret, secret_name, namespace)
     if secret is not None:
         identity = _identity_from_secret(secret, name=name, api_url=api_url)
         logger.info(
@@ -239,6 +245,19 @@ def _core_api():
     return _get_core_api()
 
 
+async def _off_loop[**P, T](fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """Run a blocking Secret/filesystem call on the bounded K8s executor.
+
+    Renewal runs alongside Job handling, so an apiserver round trip here
+    must not stall the listener's event loop.
+    """
+    from terrapod.runner.job_manager import _executor
+
+    return await asyncio.get_running_loop().run_in_executor(
+        _executor, functools.partial(fn, *args, **kwargs)
+    )
+
+
 # ── Secret → identity ───────────────────────────────────────────────
 
 
@@ -294,7 +313,7 @@ async def _bootstrap_via_join_token(
     for attempt in range(max_attempts):
         # Always re-check the Secret first — another pod may have raced ahead
         # since our last attempt.
-        secret = _read_secret(secret_name, namespace)
+        secret = await _off_loop(_read_secret, secret_name, namespace)
         if secret is not None:
             identity = _identity_from_secret(secret, name=name, api_url=api_url)
             logger.info(
@@ -335,7 +354,8 @@ async def _bootstrap_via_join_token(
         # possible), adopt theirs and discard our cert. The losing cert
         # remains valid until expiry but is unused.
         try:
-            secret = _create_secret(
+            secret = await _off_loop(
+                _create_secret,
                 secret_name,
                 namespace,
                 cert=data["certificate"],
@@ -345,7 +365,7 @@ async def _bootstrap_via_join_token(
                 pool_id=uuid.UUID(data["pool_id"]),
             )
         except _SecretAlreadyExists:
-            secret = _read_secret(secret_name, namespace)
+            secret = await _off_loop(_read_secret, secret_name, namespace)
             if secret is None:
                 # Should be impossible — we just hit AlreadyExists.
                 continue
@@ -447,7 +467,7 @@ async def renew_loop(
             continue
 
         # ── Step 1: maybe another pod already renewed
-        secret = _read_secret(secret_name, namespace)
+        secret = await _off_loop(_read_secret, secret_name, namespace)
         if secret is not None:
             try:
                 secret_cert_pem = _decode_data_field(secret, _K_TLS_CRT)
@@ -486,7 +506,8 @@ async def renew_loop(
             continue
 
         try:
-            secret = _replace_secret(
+            secret = await _off_loop(
+                _replace_secret,
                 secret_name,
                 namespace,
                 cert=new_cert["certificate"],
@@ -510,7 +531,7 @@ async def renew_loop(
         except _SecretConflict:
             # Lost CAS race — another pod wrote first. Drop our cert,
             # adopt theirs.
-            secret = _read_secret(secret_name, namespace)
+            secret = await _off_loop(_read_secret, secret_name, namespace)
             if secret is not None:
                 identity_holder.identity = _identity_from_secret(
                     secret, name=cert.name, api_url=cert.api_url
@@ -541,14 +562,39 @@ class _SecretConflict(Exception):
     """Raised on Secret replace returning 409 Conflict (stale resourceVersion)."""
 
 
-async def _call_join(api_url: str, join_token: str, name: str) -> dict:
+# Shared by /join and /renew so bootstrap and renewal retries reuse one
+# keep-alive connection instead of a fresh TCP/TLS handshake per attempt.
+_api_client: httpx.AsyncClient | None = None
+_api_client_url = ""
+
+
+def _get_api_client(api_url: str) -> httpx.AsyncClient:
     import httpx
 
-    async with httpx.AsyncClient(base_url=api_url, timeout=30) as client:
-        r = await client.post(
-            "/api/v2/agent-pools/join",
-            json={"join_token": join_token, "name": name},
+    global _api_client, _api_client_url  # noqa: PLW0603
+    if _api_client is None or _api_client.is_closed or _api_client_url != api_url:
+        _api_client = httpx.AsyncClient(
+            base_url=api_url,
+            timeout=httpx.Timeout(30, connect=10),
+            limits=httpx.Limits(max_connections=2, max_keepalive_connections=1),
         )
+        _api_client_url = api_url
+    return _api_client
+
+
+async def close_api_client() -> None:
+    """Close the shared /join and /renew client. Called on listener shutdown."""
+    global _api_client  # noqa: PLW0603
+    if _api_client is not None:
+        await _api_client.aclose()
+        _api_client = None
+
+
+async def _call_join(api_url: str, join_token: str, name: str) -> dict:
+    r = await _get_api_client(api_url).post(
+        "/api/v2/agent-pools/join",
+        json={"join_token": join_token, "name": name},
+    )
     if r.status_code in (401, 403):
         # Token revoked / expired / max_uses exhausted
         raise _JoinTokenExhausted(r.text)
@@ -570,14 +616,14 @@ async def _call_renew_with_retries(identity: ListenerIdentity) -> dict | None:
 
     cert_b64 = base64.b64encode(identity.certificate_pem.encode()).decode()
     headers = {"X-Terrapod-Client-Cert": cert_b64}
+    client = _get_api_client(identity.api_url)
     backoff = 1.0
     for attempt in range(3):
         try:
-            async with httpx.AsyncClient(base_url=identity.api_url, timeout=30) as client:
-                r = await client.post(
-                    f"/api/v2/listeners/listener-{identity.listener_id}/renew",
-                    headers=headers,
-                )
+            r = await client.post(
+                f"/api/v2/listeners/listener-{identity.listener_id}/renew",
+                headers=headers,
+            )
             if r.status_code == 200:
                 return r.json()["data"]
             if r.status_code in (401, 403):
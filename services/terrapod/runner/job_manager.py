@@ -5,7 +5,9 @@ Uses the kubernetes Python client to interact with the K8s API.
 
 import asyncio
 import os
+from collections.abc import AsyncIterator
 from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
@@ -46,20 +48,25 @@ def init_k8s() -> None:
     _core_v1 = client.CoreV1Api()
 
 
+# Steady-state callers hit the first return; the init + assert only run once.
 def _get_batch_api() -> client.BatchV1Api:
-    if _batch_v1 is None:
-        init_k8s()
+    if _batch_v1 is not None:
+        return _batch_v1
+    init_k8s()
     assert _batch_v1 is not None
     return _batch_v1
 
 
 def _get_core_api() -> client.CoreV1Api:
-    if _core_v1 is None:
-        init_k8s()
+    if _core_v1 is not None:
+        return _core_v1
+    init_k8s()
     assert _core_v1 is not None
     return _core_v1
 
 
+# A container's env is fixed for its lifetime, so read it once.
+@lru_cache(maxsize=1)
 def _default_namespace() -> str:
     return os.environ.get("TERRAPOD_RUNNER_NAMESPACE", "terrapod-runners")
 
@@ -76,7 +83,7 @@ async def create_job(job_spec: dict, namespace: str = "") -> str:
     job_name = job_spec.get("metadata", {}).get("name", "unknown")
 
     try:
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         await loop.run_in_executor(
             _executor,
             lambda: batch_api.create_namespaced_job(namespace=namespace, body=job_spec),
@@ -110,10 +117,11 @@ async def watch_job(
     if not namespace:
         namespace = _default_namespace()
 
-    deadline = asyncio.get_event_loop().time() + timeout_seconds
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_seconds
 
     prev_status = None
-    while asyncio.get_event_loop().time() < deadline:
+    while loop.time() < deadline:
         status = await get_job_status(job_name, namespace)
 
         if status != prev_status:
@@ -143,7 +151,7 @@ async def _check_pod_stuck(job_name: str, namespace: str) -> str | None:
     core_api = _get_core_api()
 
     try:
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         pods = await loop.run_in_executor(
             _executor,
             lambda: core_api.list_namespaced_pod(
@@ -179,10 +187,11 @@ async def delete_job(
     if not namespace:
         namespace = _default_namespace()
 
+    _job_pod_cache.pop((namespace, job_name), None)
     batch_api = _get_batch_api()
 
     try:
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         await loop.run_in_executor(
             _executor,
             lambda: batch_api.delete_namespaced_job(
@@ -203,6 +212,58 @@ async def delete_job(
             raise
 
 
+def _job_phase(job: client.V1Job) -> str:
+    status = job.status
+    if status is None:
+        return "running"  # Job exists but no status yet
+    if status.succeeded and status.succeeded > 0:
+        return "succeeded"
+    if status.failed and status.failed > 0:
+        return "failed"
+    return "running"
+
+
+# The reconciler asks for every in-flight Job's status every couple of seconds.
+# Rather than one read_namespaced_job per run, concurrent callers share a single
+# labelled list per namespace, reused for _JOB_SNAPSHOT_TTL seconds.
+_JOB_LABEL_SELECTOR = "app.kubernetes.io/name=terrapod-runner"
+_JOB_SNAPSHOT_TTL = 2.0
+_job_snapshots: dict[str, tuple[float, dict[str, str]]] = {}
+_job_snapshot_tasks: dict[str, asyncio.Task[dict[str, str]]] = {}
+
+
+async def _list_job_phases(namespace: str) -> dict[str, str]:
+    batch_api = _get_batch_api()
+    loop = asyncio.get_running_loop()
+    fetched_at = loop.time()
+    jobs = await loop.run_in_executor(
+        _executor,
+        lambda: batch_api.list_namespaced_job(
+            namespace=namespace, label_selector=_JOB_LABEL_SELECTOR
+        ),
+    )
+    batch_api.api_client.last_response = None
+    phases = {job.metadata.name: _job_phase(job) for job in jobs.items}
+    _job_snapshots[namespace] = (fetched_at, phases)
+    return phases
+
+
+async def _job_phases(namespace: str) -> dict[str, str]:
+    """Return {job_name: status} for runner Jobs, at most _JOB_SNAPSHOT_TTL old."""
+    loop = asyncio.get_running_loop()
+    cached = _job_snapshots.get(namespace)
+    if cached is not None and loop.time() - cached[0] < _JOB_SNAPSHOT_TTL:
+        return cached[1]
+
+    task = _job_snapshot_tasks.get(namespace)
+    if task is None:
+        task = loop.create_task(_list_job_phases(namespace))
+        _job_snapshot_tasks[namespace] = task
+        task.add_done_callback(lambda _: _job_snapshot_tasks.pop(namespace, None))
+    # Shield so one cancelled caller doesn't cancel the list for everyone else.
+    return await asyncio.shield(task)
+
+
 async def get_job_status(job_name: str, namespace: str = "") -> str | None:
     """Get the current status of a Job.
 
@@ -211,24 +272,26 @@ async def get_job_status(job_name: str, namespace: str = "") -> str | None:
     if not namespace:
         namespace = _default_namespace()
 
+    try:
+        phase = (await _job_phases(namespace)).get(job_name)
+    except ApiException:
+        phase = None
+    if phase is not None:
+        return phase
+
+    # Not in the snapshot: either created after it was taken, or really gone.
+    # Confirm with a direct read so a fresh Job is never reported as deleted.
     batch_api = _get_batch_api()
 
     try:
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         job = await loop.run_in_executor(
             _executor,
             lambda: batch_api.read_namespaced_job(name=job_name, namespace=namespace),
         )
         # Clear last_response to avoid retaining Job JSON in memory
         batch_api.api_client.last_response = None
-
-        if job.status.succeeded and job.status.succeeded > 0:
-            return "succeeded"
-        if job.status.failed and job.status.failed > 0:
-            return "failed"
-        if job.status.active and job.status.active > 0:
-            return "running"
-        return "running"  # Job exists but no status yet
+        return _job_phase(job)
     except ApiException as e:
         if e.status == 404:
             return None
@@ -241,56 +304,98 @@ async def get_job_uid(job_name: str, namespace: str = "") -> str:
         namespace = _default_namespace()
 
     batch_api = _get_batch_api()
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     job = await loop.run_in_executor(
-        None,
+        _executor,
         lambda: batch_api.read_namespaced_job(name=job_name, namespace=namespace),
     )
+    batch_api.api_client.last_response = None
     return str(job.metadata.uid)
 
 
-async def get_pod_logs(
+# Log tails are requested repeatedly for the same Job, so the pod name is
+# cached instead of listing pods on every tail. Entries expire so a pod
+# replaced by a Job retry (backoffLimit) is picked up within the TTL.
+_POD_NAME_TTL = 30.0
+_job_pod_cache: dict[tuple[str, str], tuple[float, str]] = {}
+
+
+async def _job_pod_name(job_name: str, namespace: str) -> str | None:
+    loop = asyncio.get_running_loop()
+    now = loop.time()
+    cached = _job_pod_cache.get((namespace, job_name))
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    core_api = _get_core_api()
+    pods = await loop.run_in_executor(
+        _executor,
+        lambda: core_api.list_namespaced_pod(
+            namespace=namespace,
+            label_selector=f"job-name={job_name}",
+        ),
+    )
+    # Clear last_response to release the V1PodList JSON from memory
+    core_api.api_client.last_response = None
+
+    if not pods.items:
+        _job_pod_cache.pop((namespace, job_name), None)
+        return None
+
+    # Drop expired entries so finished Jobs don't accumulate.
+    for key in [k for k, (expires, _) in _job_pod_cache.items() if expires <= now]:
+        del _job_pod_cache[key]
+    pod_name = pods.items[0].metadata.name
+    _job_pod_cache[(namespace, job_name)] = (now + _POD_NAME_TTL, pod_name)
+    return pod_name
+
+
+_LOG_CHUNK_SIZE = 64 * 1024
+
+
+async def iter_pod_logs(
     job_name: str,
     namespace: str = "",
     tail_lines: int = 100,
     limit_bytes: int | None = None,
-) -> str:
-    """Get logs from a Job's pod."""
+) -> AsyncIterator[bytes]:
+    """Stream logs from a Job's pod as raw byte chunks.
+
+    Yields nothing if the pod doesn't exist or its logs can't be read yet.
+    The log body is never decoded or held in memory as a whole.
+    """
     if not namespace:
         namespace = _default_namespace()
 
     core_api = _get_core_api()
+    loop = asyncio.get_running_loop()
 
     try:
-        loop = asyncio.get_event_loop()
-        pods = await loop.run_in_executor(
-            _executor,
-            lambda: core_api.list_namespaced_pod(
-                namespace=namespace,
-                label_selector=f"job-name={job_name}",
-            ),
-        )
-        # Clear last_response to release the V1PodList JSON from memory
-        core_api.api_client.last_response = None
-
-        if not pods.items:
-            return ""
+        pod_name = await _job_pod_name(job_name, namespace)
+        if pod_name is None:
+            return
 
-        pod_name = pods.items[0].metadata.name
         log_kwargs: dict = {
             "name": pod_name,
             "namespace": namespace,
             "tail_lines": tail_lines,
+            "_preload_content": False,
         }
         if limit_bytes is not None:
             log_kwargs["limit_bytes"] = limit_bytes
 
-        logs = await loop.run_in_executor(
+        resp = await loop.run_in_executor(
             _executor,
             lambda: core_api.read_namespaced_pod_log(**log_kwargs),
         )
-        # Clear last_response to release the raw log string from K8s client memory
-        core_api.api_client.last_response = None
-        return logs
-    except ApiException:
-        return ""
+    except ApiException as e:
+        if e.status == 404:
+            _job_pod_cache.pop((namespace, job_name), None)
+        return
+
+    try:
+        chunks = resp.stream(_LOG_CHUNK_SIZE)
+        while chunk := await loop.run_in_executor(_executor, next, chunks, b""):
+            yield chunk
+    finally:
+        resp.release_conn()
@@ -1,14 +1,97 @@
 """Build K8s Job specs for terraform/tofu plan and apply phases."""
 
-import json
 import os
-import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+import orjson
 
 from terrapod.config import RunnerConfig
 from terrapod.logging_config import get_logger
+from terrapod.runner.job_manager import _default_namespace
 
 logger = get_logger(__name__)
 
+# Binary-SI suffixes accepted by _double_resource (plus the "m" millicore unit).
+_BINARY_SUFFIXES = frozenset({"Ki", "Mi", "Gi", "Ti"})
+
+# Prefix terraform reads input variables from (category=terraform vars)
+_TF_VAR = "TF_VAR_"
+
+# Label keys shared by the Job and pod label sets, named once so the spelling
+# can't drift between them.
+_LABEL_NAME = "app.kubernetes.io/name"
+_LABEL_COMPONENT = "app.kubernetes.io/component"
+_LABEL_RUN_ID = "terrapod.io/run-id"
+_LABEL_PHASE = "terrapod.io/phase"
+
+# Optional pod spec fields copied verbatim from runner config when set
+_POD_SPEC_OPTIONS = (
+    ("serviceAccountName", "service_account_name"),
+    ("nodeSelector", "node_selector"),
+    ("tolerations", "tolerations"),
+    ("affinity", "affinity"),
+    ("priorityClassName", "priority_class_name"),
+    ("topologySpreadConstraints", "topology_spread_constraints"),
+    ("securityContext", "pod_security_context"),
+)
+
+# Static label sets; per-run labels are merged on top in build_job_spec
+_JOB_LABELS = {_LABEL_NAME: "terrapod-runner", _LABEL_COMPONENT: "runner"}
+_POD_LABELS = {_LABEL_NAME: "terrapod-runner"}
+_AZURE_WORKLOAD_IDENTITY_LABELS = {"azure.workload.identity/use": "true"}
+
+# Invariant parts of every runner Job, built once at import. They are shared
+# by reference between specs (as runner_config values already are), so
+# nothing downstream may mutate them — the K8s client only serialises.
+_POD_FAILURE_POLICY = {
+    "rules": [
+        {
+            "action": "FailJob",
+            "onExitCodes": {
+                "containerName": "runner",
+                "operator": "NotIn",
+                "values": [0],
+            },
+        },
+        {
+            "action": "Count",
+            "onPodConditions": [{"type": "DisruptionTarget", "status": "True"}],
+        },
+    ],
+}
+
+_VOLUMES = [
+    {"name": "workspace", "emptyDir": {}},
+    {"name": "tmp", "emptyDir": {}},
+]
+
+_VOLUME_MOUNTS = [
+    {"name": "workspace", "mountPath": "/workspace"},
+    {"name": "tmp", "mountPath": "/tmp"},
+]
+
+_CONTAINER_SECURITY_CONTEXT = {
+    "runAsNonRoot": True,
+    "runAsUser": 1000,
+    "runAsGroup": 1000,
+    "readOnlyRootFilesystem": True,
+    "allowPrivilegeEscalation": False,
+    "capabilities": {"drop": ["ALL"]},
+    "seccompProfile": {"type": "RuntimeDefault"},
+}
+
+
+# A container's env is fixed for its lifetime, so read it once.
+@lru_cache(maxsize=1)
+def _runner_api_url() -> str:
+    return os.environ.get("TERRAPOD_API_URL", "http://terrapod-api:8000")
+
+
+def _json_env(value: list[str]) -> str:
+    """Encode a list as a compact JSON env var value (parsed by jq in the entrypoint)."""
+    return orjson.dumps(value).decode()
+
 
 def _double_resource(value: str) -> str:
     """Double a K8s resource value.
@@ -16,59 +99,60 @@ def _double_resource(value: str) -> str:
     Examples:
         '1' → '2', '500m' → '1', '2Gi' → '4Gi', '256Mi' → '512Mi'
     """
-    match = re.match(r"^(\d+)(m|Ki|Mi|Gi|Ti)?$", value.strip())
-    if not match:
+    return _DOUBLE_FAST.get(value) or _parse_and_double(value)
+
+
+@lru_cache(maxsize=256)
+def _parse_and_double(value: str) -> str:
+    """Parse and double a resource value (the slow path of _double_resource).
+
+    Pure and drawn from a handful of workspace defaults, so results are
+    memoised (an unparseable value is therefore only warned about once).
+    """
+    stripped = value.strip()
+    suffix = stripped[-2:]
+    if suffix in _BINARY_SUFFIXES:
+        digits = stripped[:-2]
+    elif stripped.endswith("m"):
+        digits, suffix = stripped[:-1], "m"
+    else:
+        digits, suffix = stripped, ""
+
+    # isdecimal() is exactly the \d class the old regex accepted.
+    if not digits.isdecimal():
         logger.warning("Could not parse resource value, returning as-is", value=value)
         return value
 
-    number = int(match.group(1))
-    suffix = match.group(2) or ""
+    number = int(digits)
 
     doubled = number * 2
 
     # Handle millicore promotion: 500m * 2 = 1000m = 1
-    if suffix == "m" and doubled >= 1000:
-        whole = doubled // 1000
-        remainder = doubled % 1000
-        if remainder == 0:
-            return str(whole)
-        return f"{doubled}m"
+    if suffix == "m":
+        whole, remainder = divmod(doubled, 1000)
+        return f"{doubled}m" if remainder else str(whole)
 
     return f"{doubled}{suffix}"
 
 
-def build_job_spec(
-    run_id: str,
-    phase: str,  # "plan" or "apply"
-    runner_config: RunnerConfig,
-    auth_secret_name: str,
-    env_vars: list[dict[str, str]],
-    terraform_vars: list[dict[str, str]],
-    resource_cpu: str = "1",
-    resource_memory: str = "2Gi",
-    timeout_minutes: int = 60,
-    terraform_version: str = "",
-    execution_backend: str = "",
-    namespace: str = "",
-    plan_only: bool = False,
-    var_files: list[str] | None = None,
-    target_addrs: list[str] | None = None,
-    replace_addrs: list[str] | None = None,
-    refresh_only: bool = False,
-    refresh: bool = True,
-    allow_empty_apply: bool = False,
-    is_destroy: bool = False,
-    working_directory: str = "",
-) -> dict:
-    """Build a K8s Job spec for a run phase.
+# Request defaults (the listener falls back to "1"/"2Gi") and common sizes,
+# resolved once at import so the usual case is a single dict hit.
+_DOUBLE_FAST = {
+    value: _parse_and_double(value)
+    for value in ("1", "2", "250m", "500m", "256Mi", "512Mi", "1Gi", "2Gi", "4Gi")
+}
 
-    Args:
+
+@dataclass(slots=True, frozen=True)
+class JobBuildRequest:
+    """Per-run inputs to build_job_spec; everything else comes from RunnerConfig.
+
+    Attributes:
         run_id: The run UUID.
         phase: "plan" or "apply".
-        runner_config: Global runner config (image, defaults, etc.).
         auth_secret_name: K8s Secret name containing the runner token.
-        env_vars: Workspace env vars [{key, value}].
-        terraform_vars: Terraform vars [{key, value}] → TF_VAR_*.
+        env_vars: Workspace env vars as (key, value) pairs.
+        terraform_vars: Terraform vars as (key, value) pairs → TF_VAR_*.
         resource_cpu: CPU request (e.g. "1", "500m").
         resource_memory: Memory request (e.g. "2Gi", "256Mi").
         timeout_minutes: Job timeout in minutes.
@@ -76,92 +160,107 @@ def build_job_spec(
         execution_backend: Execution backend (terraform or tofu).
         namespace: Target namespace for the Job.
     """
-    if not namespace:
-        namespace = os.environ.get("TERRAPOD_RUNNER_NAMESPACE", "terrapod-runners")
 
-    run_short = run_id[:16]
-    job_name = f"tprun-{run_short}-{phase}"
+    run_id: str
+    phase: str  # "plan" or "apply"
+    auth_secret_name: str
+    env_vars: tuple[tuple[str, str], ...] = ()
+    terraform_vars: tuple[tuple[str, str], ...] = ()
+    resource_cpu: str = "1"
+    resource_memory: str = "2Gi"
+    timeout_minutes: int = 60
+    terraform_version: str = ""
+    execution_backend: str = ""
+    namespace: str = ""
+    plan_only: bool = False
+    var_files: list[str] | None = None
+    target_addrs: list[str] | None = None
+    replace_addrs: list[str] | None = None
+    refresh_only: bool = False
+    refresh: bool = True
+    allow_empty_apply: bool = False
+    is_destroy: bool = False
+    working_directory: str = ""
+
 
-    # Build container env vars
+def build_job_spec(req: JobBuildRequest, runner_config: RunnerConfig) -> tuple[dict, str, str]:
+    """Build a K8s Job spec for a run phase.
+
+    Args:
+        req: The run-specific inputs.
+        runner_config: Global runner config (image, defaults, etc.).
+
+    Returns:
+        ``(job_spec, job_name, namespace)`` — the name and namespace are
+        returned alongside so callers don't dig them back out of metadata.
+        The manifest stays a plain dict rather than pre-serialised:
+        create_namespaced_job always sanitises and json.dumps() its body,
+        so bytes or a JSON string would be double-encoded, not sent as-is.
+    """
+    namespace = req.namespace or _default_namespace()
+
+    run_short = req.run_id[:16]
+    job_name = f"tprun-{run_short}-{req.phase}"
+
+    # Optional run flags — only emitted when set, in this fixed order
+    version = req.terraform_version or runner_config.default_terraform_version
+    backend = req.execution_backend or runner_config.default_execution_backend
+    optional_env = (
+        ("TP_PLAN_ONLY", "true" if req.plan_only else None),
+        ("TP_VAR_FILES", _json_env(req.var_files) if req.var_files else None),
+        ("TP_TARGET_ADDRS", _json_env(req.target_addrs) if req.target_addrs else None),
+        ("TP_REPLACE_ADDRS", _json_env(req.replace_addrs) if req.replace_addrs else None),
+        ("TP_REFRESH_ONLY", "true" if req.refresh_only else None),
+        ("TP_REFRESH", None if req.refresh else "false"),
+        ("TP_ALLOW_EMPTY_APPLY", "true" if req.allow_empty_apply else None),
+        ("TP_DESTROY", "true" if req.is_destroy else None),
+        ("TP_WORKING_DIR", req.working_directory or None),
+    )
+
+    # Build container env vars in a single list display
     container_env = [
-        {"name": "TP_RUN_ID", "value": run_id},
-        {"name": "TP_PHASE", "value": phase},
+        {"name": "TP_RUN_ID", "value": req.run_id},
+        {"name": "TP_PHASE", "value": req.phase},
         {
             "name": "TP_API_URL",
-            "value": os.environ.get("TERRAPOD_API_URL", "http://terrapod-api:8000"),
+            "value": _runner_api_url(),
         },
         {
             "name": "TP_AUTH_TOKEN",
             "valueFrom": {
                 "secretKeyRef": {
-                    "name": auth_secret_name,
+                    "name": req.auth_secret_name,
                     "key": "token",
                 }
             },
         },
-    ]
-
-    # Terraform version + backend
-    version = terraform_version or runner_config.default_terraform_version
-    backend = execution_backend or runner_config.default_execution_backend
-    container_env.append({"name": "TP_VERSION", "value": version})
-    container_env.append({"name": "TP_BACKEND", "value": backend})
-    if plan_only:
-        container_env.append({"name": "TP_PLAN_ONLY", "value": "true"})
-    if var_files:
-        container_env.append({"name": "TP_VAR_FILES", "value": json.dumps(var_files)})
-    if target_addrs:
-        container_env.append({"name": "TP_TARGET_ADDRS", "value": json.dumps(target_addrs)})
-    if replace_addrs:
-        container_env.append({"name": "TP_REPLACE_ADDRS", "value": json.dumps(replace_addrs)})
-    if refresh_only:
-        container_env.append({"name": "TP_REFRESH_ONLY", "value": "true"})
-    if not refresh:
-        container_env.append({"name": "TP_REFRESH", "value": "false"})
-    if allow_empty_apply:
-        container_env.append({"name": "TP_ALLOW_EMPTY_APPLY", "value": "true"})
-    if is_destroy:
-        container_env.append({"name": "TP_DESTROY", "value": "true"})
-    if working_directory:
-        container_env.append({"name": "TP_WORKING_DIR", "value": working_directory})
-
-    # Termination grace period — passed to entrypoint for time-budgeted shutdown
-    container_env.append(
+        # Terraform version + backend
+        {"name": "TP_VERSION", "value": version},
+        {"name": "TP_BACKEND", "value": backend},
+        *({"name": name, "value": value} for name, value in optional_env if value is not None),
+        # Termination grace period — passed to entrypoint for time-budgeted shutdown
         {
             "name": "TP_TERMINATION_GRACE",
             "value": str(runner_config.termination_grace_period_seconds),
-        }
-    )
-
-    # Workspace env vars (category=env)
-    for var in env_vars:
-        container_env.append({"name": var["key"], "value": var["value"]})
-
-    # Terraform vars (category=terraform → TF_VAR_*)
-    for var in terraform_vars:
-        container_env.append({"name": f"TF_VAR_{var['key']}", "value": var["value"]})
-
-    # Extra env vars from runner config (Helm values → runners.extraEnv)
-    for extra in runner_config.extra_env:
-        container_env.append(extra)
-
-    # Image config
-    image = runner_config.image.repository
-    if runner_config.image.tag:
-        image = f"{image}:{runner_config.image.tag}"
+        },
+        # Workspace env vars (category=env)
+        *({"name": key, "value": value} for key, value in req.env_vars),
+        # Terraform vars (category=terraform → TF_VAR_*)
+        *({"name": _TF_VAR + key, "value": value} for key, value in req.terraform_vars),
+        # Extra env vars from runner config (Helm values → runners.extraEnv)
+        *runner_config.extra_env,
+    ]
 
     # Compute limits as 2x requests
-    limit_cpu = _double_resource(resource_cpu)
-    limit_memory = _double_resource(resource_memory)
-
-    # Pod labels (conditionally include Azure Workload Identity label)
-    pod_labels = {
-        "app.kubernetes.io/name": "terrapod-runner",
-        "terrapod.io/run-id": run_id,
-        "terrapod.io/phase": phase,
-    }
+    limit_cpu = _double_resource(req.resource_cpu)
+    limit_memory = _double_resource(req.resource_memory)
+
+    # Labels: static bases merged with the per-run pair (pods additionally
+    # carry the Azure Workload Identity label when enabled)
+    run_labels = {_LABEL_RUN_ID: req.run_id, _LABEL_PHASE: req.phase}
+    pod_labels = {**_POD_LABELS, **run_labels}
     if runner_config.azure_workload_identity:
-        pod_labels["azure.workload.identity/use"] = "true"
+        pod_labels.update(_AZURE_WORKLOAD_IDENTITY_LABELS)
 
     # Build Job spec
     job_spec = {
@@ -170,32 +269,12 @@ def build_job_spec(
         "metadata": {
             "name": job_name,
             "namespace": namespace,
-            "labels": {
-                "app.kubernetes.io/name": "terrapod-runner",
-                "app.kubernetes.io/component": "runner",
-                "terrapod.io/run-id": run_id,
-                "terrapod.io/phase": phase,
-            },
+            "labels": {**_JOB_LABELS, **run_labels},
         },
         "spec": {
             "backoffLimit": 3,
-            "podFailurePolicy": {
-                "rules": [
-                    {
-                        "action": "FailJob",
-                        "onExitCodes": {
-                            "containerName": "runner",
-                            "operator": "NotIn",
-                            "values": [0],
-                        },
-                    },
-                    {
-                        "action": "Count",
-                        "onPodConditions": [{"type": "DisruptionTarget", "status": "True"}],
-                    },
-                ],
-            },
-            "activeDeadlineSeconds": timeout_minutes * 60,
+            "podFailurePolicy": _POD_FAILURE_POLICY,
+            "activeDeadlineSeconds": req.timeout_minutes * 60,
             "ttlSecondsAfterFinished": runner_config.ttl_seconds_after_finished,
             "template": {
                 "metadata": {
@@ -205,39 +284,25 @@ def build_job_spec(
                     "terminationGracePeriodSeconds": runner_config.termination_grace_period_seconds,
                     "restartPolicy": "Never",
                     "automountServiceAccountToken": bool(runner_config.service_account_name),
-                    "volumes": [
-                        {"name": "workspace", "emptyDir": {}},
-                        {"name": "tmp", "emptyDir": {}},
-                    ],
+                    "volumes": _VOLUMES,
                     "containers": [
                         {
                             "name": "runner",
-                            "image": image,
+                            "image": runner_config.image.ref,
                             "imagePullPolicy": runner_config.image.pull_policy,
                             "env": container_env,
                             "resources": {
                                 "requests": {
-                                    "cpu": resource_cpu,
-                                    "memory": resource_memory,
+                                    "cpu": req.resource_cpu,
+                                    "memory": req.resource_memory,
                                 },
                                 "limits": {
                                     "cpu": limit_cpu,
                                     "memory": limit_memory,
                                 },
                             },
-                            "securityContext": {
-                                "runAsNonRoot": True,
-                                "runAsUser": 1000,
-                                "runAsGroup": 1000,
-                                "readOnlyRootFilesystem": True,
-                                "allowPrivilegeEscalation": False,
-                                "capabilities": {"drop": ["ALL"]},
-                                "seccompProfile": {"type": "RuntimeDefault"},
-                            },
-                            "volumeMounts": [
-                                {"name": "workspace", "mountPath": "/workspace"},
-                                {"name": "tmp", "mountPath": "/tmp"},
-                            ],
+                            "securityContext": _CONTAINER_SECURITY_CONTEXT,
+                            "volumeMounts": _VOLUME_MOUNTS,
                         }
                     ],
                 },
@@ -245,38 +310,24 @@ def build_job_spec(
         },
     }
 
-    # envFrom — inject all keys from Secrets/ConfigMaps as env vars
-    if runner_config.extra_env_from:
-        job_spec["spec"]["template"]["spec"]["containers"][0]["envFrom"] = (
-            runner_config.extra_env_from
-        )
-
-    # Service account (CSP identity) — from global runner config (Helm values)
-    if runner_config.service_account_name:
-        job_spec["spec"]["template"]["spec"]["serviceAccountName"] = (
-            runner_config.service_account_name
-        )
-
-    # Scheduling and placement from runner config
     pod_spec = job_spec["spec"]["template"]["spec"]
 
+    # envFrom — inject all keys from Secrets/ConfigMaps as env vars
+    if extra_env_from := runner_config.extra_env_from:
+        pod_spec["containers"][0]["envFrom"] = extra_env_from
+
     # Image pull secrets — for pulling custom runner images from private registries
-    if runner_config.image_pull_secrets:
-        pod_spec["imagePullSecrets"] = [{"name": s} for s in runner_config.image_pull_secrets]
-    if runner_config.node_selector:
-        pod_spec["nodeSelector"] = runner_config.node_selector
-    if runner_config.tolerations:
-        pod_spec["tolerations"] = runner_config.tolerations
-    if runner_config.affinity:
-        pod_spec["affinity"] = runner_config.affinity
-    if runner_config.priority_class_name:
-        pod_spec["priorityClassName"] = runner_config.priority_class_name
-    if runner_config.topology_spread_constraints:
-        pod_spec["topologySpreadConstraints"] = runner_config.topology_spread_constraints
-    if runner_config.pod_security_context:
-        pod_spec["securityContext"] = runner_config.pod_security_context
-    if runner_config.pod_annotations:
-        pod_meta = job_spec["spec"]["template"]["metadata"]
-        pod_meta["annotations"] = runner_config.pod_annotations
-
-    return job_spec
+    if image_pull_secrets := runner_config.image_pull_secrets:
+        pod_spec["imagePullSecrets"] = [{"name": s} for s in image_pull_secrets]
+
+    # Service account (CSP identity), scheduling and placement from runner
+    # config (Helm values) — one attribute read per optional field
+    for spec_key, config_attr in _POD_SPEC_OPTIONS:
+        value = getattr(runner_config, config_attr)
+        if value:
+            pod_spec[spec_key] = value
+
+    if pod_annotations := runner_config.pod_annotations:
+        job_spec["spec"]["template"]["metadata"]["annotations"] = pod_annotations
+
+    return job_spec, job_name, namespace
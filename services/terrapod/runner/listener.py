@@ -28,11 +28,19 @@ import json
 import os
 import signal
 import time
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
 
 import httpx
+import orjson
+from kubernetes import client as k8s_client
 
 from terrapod.config import load_runner_config
 from terrapod.logging_config import configure_logging, get_logger
+from terrapod.runner import job_manager, job_template
+
+if TYPE_CHECKING:
+    from terrapod.runner.identity import ListenerIdentity
 
 logger = get_logger(__name__)
 
@@ -40,20 +48,42 @@ logger = get_logger(__name__)
 _shutdown = asyncio.Event()
 
 
+async def _wait_shutdown(seconds: float) -> bool:
+    """Sleep up to `seconds`, waking early on shutdown. Returns True if shutting down.
+
+    asyncio.timeout() cancels the wait in place rather than wrapping it in
+    an extra Task, which matters for loops that park here indefinitely.
+    """
+    try:
+        async with asyncio.timeout(seconds):
+            await _shutdown.wait()
+    except TimeoutError:
+        return False
+    return True
+
+
 class RunnerListener:
     """Stateless Job launcher — ARC-pattern controller."""
 
     def __init__(self):
-        self.identity = None
+        self.identity: ListenerIdentity | None = None
         self.runner_config = load_runner_config()
         self._heartbeat_interval = int(os.environ.get("TERRAPOD_HEARTBEAT_INTERVAL", "60"))
         self._max_concurrent = int(os.environ.get("TERRAPOD_MAX_CONCURRENT", "3"))
         self._health_port = int(os.environ.get("TERRAPOD_HEALTH_PORT", "8081"))
         self._sse_retry_interval = int(os.environ.get("TERRAPOD_SSE_RETRY_INTERVAL", "5"))
         self._poll_interval = int(os.environ.get("TERRAPOD_POLL_INTERVAL", "30"))
+        # Static for the life of the pod; resolved once rather than per heartbeat.
+        self._pod_name = os.environ.get("POD_NAME") or os.environ.get("HOSTNAME") or ""
+        # Heartbeat JSON with only active_runs left to fill in per beat.
+        self._heartbeat_template = b'{"capacity":%d,"active_runs":%%d,"pod_name":%b}' % (
+            self._max_concurrent,
+            orjson.dumps(self._pod_name).replace(b"%", b"%%"),
+        )
         self._identity_ready = False
         self._last_heartbeat_at: float | None = None
         self._active_launches = 0  # count of concurrent launch operations
+        self._claim_deferred = False  # a claim was skipped while at capacity
 
         # Track background tasks to prevent GC accumulation (Finding 1: memory leak)
         self._background_tasks: set[asyncio.Task] = set()
@@ -62,6 +92,7 @@ class RunnerListener:
         # Eliminates memory fragmentation from repeated create/destroy cycles.
         self._http_client: httpx.AsyncClient | None = None
         self._sse_client: httpx.AsyncClient | None = None
+        self._http_client_url = ""  # identity.api_url the HTTP client was built for
 
         # Prometheus metrics — separate registry to avoid colliding with API metrics
         from prometheus_client import CollectorRegistry, Gauge
@@ -83,24 +114,37 @@ class RunnerListener:
             registry=self._metrics_registry,
         )
 
-    def _auth_headers(self) -> dict[str, str]:
-        """Build authentication headers for API calls.
+    @property
+    def identity(self) -> "ListenerIdentity | None":
+        return self._identity
+
+    @identity.setter
+    def identity(self, identity: "ListenerIdentity | None") -> None:
+        """Swap identity and re-encode the cert header once, up front.
 
-        The cert is renewed in the background by `renew_loop`, which mutates
-        `self.identity` in place. Cache by the cert PEM identity (id() is
-        stable while the same string object is held in memory) so we
-        re-encode only on rotation, not every request.
+        Every identity change — join, re-join, and `renew_loop` renewing or
+        adopting a cert — is an assignment here, so the base64 header is
+        computed once per cert rather than checked on each request.
         """
-        cert_pem = self.identity.certificate_pem if self.identity else ""
-        cached = getattr(self, "_cached_auth_headers_for_cert", None)
-        if cached is not None and cached[0] is cert_pem:
-            return cached[1]
+        self._identity = identity
         headers: dict[str, str] = {}
-        if cert_pem:
-            cert_b64 = base64.b64encode(cert_pem.encode()).decode()
+        if identity is not None and identity.certificate_pem:
+            cert_b64 = base64.b64encode(identity.certificate_pem.encode()).decode()
             headers["X-Terrapod-Client-Cert"] = cert_b64
-        self._cached_auth_headers_for_cert = (cert_pem, headers)
-        return headers
+        self._cert_headers = headers
+
+    def _auth_headers(self) -> dict[str, str]:
+        """Authentication headers for API calls (precomputed per cert)."""
+        return self._cert_headers
+
+    def _new_http_client(self) -> httpx.AsyncClient:
+        """Pooled client for listener → API calls (everything except SSE)."""
+        self._http_client_url = self.identity.api_url
+        return httpx.AsyncClient(
+            base_url=self.identity.api_url,
+            timeout=httpx.Timeout(30, connect=10),
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+        )
 
     async def _establish_identity(self) -> None:
         """Establish or re-establish listener identity."""
@@ -108,14 +152,10 @@ class RunnerListener:
 
         self.identity = await establish_identity()
         self._identity_ready = True
-        # Drop any cached headers so the next call re-encodes against the new cert.
-        self._cached_auth_headers_for_cert = None
 
     async def start(self) -> None:
         """Main entry point — initialize and start loops."""
-        from terrapod.runner.job_manager import init_k8s
-
-        init_k8s()
+        job_manager.init_k8s()
 
         # Establish identity via join token
         await self._establish_identity()
@@ -127,11 +167,7 @@ class RunnerListener:
         )
 
         # Create reusable HTTP clients — one for API calls, one for SSE (no timeout)
-        self._http_client = httpx.AsyncClient(
-            base_url=self.identity.api_url,
-            timeout=httpx.Timeout(30, connect=10),
-            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
-        )
+        self._http_client = self._new_http_client()
         self._sse_client = httpx.AsyncClient(
             timeout=None,
             limits=httpx.Limits(max_connections=5, max_keepalive_connections=2),
@@ -141,17 +177,41 @@ class RunnerListener:
             # Start concurrent loops — SSE for sub-second responsiveness,
             # poll loop as reliability fallback (~30s worst-case latency),
             # cert-renewal loop to refresh the X.509 cert before it expires.
-            await asyncio.gather(
-                self._health_server(),
-                self._heartbeat_loop(),
-                self._sse_loop(),
-                self._poll_loop(),
-                self._cert_renewal_loop(),
-                self._shutdown_waiter(),
-            )
+            # A TaskGroup cancels the siblings if one loop dies (e.g. the health
+            # port is taken), rather than leaving them running against the HTTP
+            # clients the finally block is about to close.
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self._health_server(), name="health")
+                tg.create_task(self._heartbeat_loop(), name="heartbeat")
+                tg.create_task(self._sse_loop(), name="sse")
+                tg.create_task(self._poll_loop(), name="poll")
+                tg.create_task(self._cert_renewal_loop(), name="cert-renewal")
+                tg.create_task(self._shutdown_waiter(), name="shutdown-waiter")
         finally:
+            from terrapod.runner.identity import close_api_client
+
+            await self._drain_background_tasks()
             await self._http_client.aclose()
             await self._sse_client.aclose()
+            await close_api_client()
+
+    async def _drain_background_tasks(self, timeout: float = 10) -> None:
+        """Let in-flight event handlers finish before the HTTP clients close.
+
+        A launch cut off mid-way leaves its run claimed with no Job until the
+        reconciler's launch timeout, so handlers get a short grace period and
+        only the stragglers are cancelled. The set is snapshotted once since
+        done-callbacks remove tasks from it while we wait.
+        """
+        tasks = {t for t in self._background_tasks if not t.done()}
+        if not tasks:
+            return
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+            logger.warning("Cancelled unfinished event handlers", count=len(pending))
 
     async def _cert_renewal_loop(self) -> None:
         """Keep the listener's X.509 cert fresh.
@@ -204,17 +264,18 @@ class RunnerListener:
             listener_id=str(self.identity.listener_id) if self.identity else "<unknown>",
             name=self.identity.name if self.identity else "<unknown>",
         )
-        clear_credentials_secret()
+        await asyncio.get_running_loop().run_in_executor(
+            job_manager._executor, clear_credentials_secret
+        )
         await self._establish_identity()
 
-        # Recreate HTTP clients with the new identity base URL
-        if self._http_client:
-            await self._http_client.aclose()
-        self._http_client = httpx.AsyncClient(
-            base_url=self.identity.api_url,
-            timeout=httpx.Timeout(30, connect=10),
-            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
-        )
+        # Keep the pooled keep-alive connections unless the API URL moved.
+        # Auth rides on per-request headers, so a new cert alone doesn't need
+        # a new client.
+        if self._http_client is None or self._http_client_url != self.identity.api_url:
+            if self._http_client:
+                await self._http_client.aclose()
+            self._http_client = self._new_http_client()
 
         logger.info(
             "Re-joined successfully",
@@ -334,11 +395,8 @@ class RunnerListener:
             except Exception as e:
                 logger.error("Heartbeat failed", error=str(e))
 
-            try:
-                await asyncio.wait_for(_shutdown.wait(), timeout=self._heartbeat_interval)
-                return  # Shutdown signaled
-            except TimeoutError:
-                pass
+            if await _wait_shutdown(self._heartbeat_interval):
+                return
 
     async def _send_heartbeat(self) -> None:
         """Send heartbeat via API.
@@ -354,12 +412,8 @@ class RunnerListener:
         """
         await self._http_client.post(
             f"/api/v2/listeners/listener-{self.identity.listener_id}/heartbeat",
-            json={
-                "capacity": self._max_concurrent,
-                "active_runs": self._active_launches,
-                "pod_name": os.environ.get("POD_NAME") or os.environ.get("HOSTNAME") or "",
-            },
-            headers=self._auth_headers(),
+            content=self._heartbeat_template % self._active_launches,
+            headers={**self._auth_headers(), "Content-Type": "application/json"},
         )
         self._last_heartbeat_at = time.monotonic()
 
@@ -420,11 +474,8 @@ class RunnerListener:
                 return
 
             logger.info("SSE reconnecting", delay=self._sse_retry_interval)
-            try:
-                await asyncio.wait_for(_shutdown.wait(), timeout=self._sse_retry_interval)
+            if await _wait_shutdown(self._sse_retry_interval):
                 return
-            except TimeoutError:
-                pass
 
     async def _sse_connect(self) -> None:
         """Maintain a single SSE connection and dispatch events."""
@@ -451,13 +502,29 @@ class RunnerListener:
                 elif line == "":
                     # Empty line = end of event
                     if event_type and event_data:
-                        task = asyncio.create_task(self._dispatch_event(event_type, event_data))
+                        task = asyncio.create_task(
+                            self._dispatch_event(event_type, event_data),
+                            name=f"sse:{event_type}",
+                        )
                         self._background_tasks.add(task)
-                        task.add_done_callback(self._background_tasks.discard)
+                        task.add_done_callback(self._on_background_task_done)
                     event_type = ""
                     event_data = ""
                 # Ignore comment lines (keepalives start with ":")
 
+    def _on_background_task_done(self, task: asyncio.Task) -> None:
+        """Drop a finished background task and surface any exception it raised.
+
+        Without this an unhandled handler error is only reported (as "Task
+        exception was never retrieved") whenever the Task gets collected.
+        """
+        self._background_tasks.discard(task)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.error("Event handler failed", task=task.get_name(), error=str(exc))
+
     # ── Poll Fallback Loop ─────────────────────────────────────────
 
     async def _poll_loop(self) -> None:
@@ -474,11 +541,8 @@ class RunnerListener:
         to recover a fresh identity without requiring a pod restart.
         """
         while not _shutdown.is_set():
-            try:
-                await asyncio.wait_for(_shutdown.wait(), timeout=self._poll_interval)
-                return  # Shutdown signaled
-            except TimeoutError:
-                pass
+            if await _wait_shutdown(self._poll_interval):
+                return
 
             try:
                 await self._handle_run_available()
@@ -502,8 +566,8 @@ class RunnerListener:
     async def _dispatch_event(self, event_type: str, raw_data: str) -> None:
         """Dispatch an SSE event to the appropriate handler."""
         try:
-            data = json.loads(raw_data)
-        except json.JSONDecodeError:
+            data = orjson.loads(raw_data)
+        except orjson.JSONDecodeError:
             logger.warning("Invalid SSE event data", event_type=event_type)
             return
 
@@ -521,29 +585,41 @@ class RunnerListener:
     # ── Event Handlers ───────────────────────────────────────────────
 
     async def _handle_run_available(self) -> None:
-        """Claim a run, launch a Job, report back — done."""
+        """Claim a run, launch a Job, report back — done.
+
+        The launch slot is reserved before the claim request, with no await
+        between the capacity check and the increment, so concurrent SSE and
+        poll triggers can never claim more than `_max_concurrent` runs. A
+        trigger that finds every slot busy is replayed as soon as one frees
+        instead of waiting for the next poll tick.
+        """
         if self._active_launches >= self._max_concurrent:
+            self._claim_deferred = True
             return
 
-        response = await self._http_client.get(
-            f"/api/v2/listeners/listener-{self.identity.listener_id}/runs/next",
-            headers=self._auth_headers(),
-        )
+        self._active_launches += 1
+        try:
+            response = await self._http_client.get(
+                f"/api/v2/listeners/listener-{self.identity.listener_id}/runs/next",
+                headers=self._auth_headers(),
+            )
 
-        if response.status_code == 204:
-            return  # No runs available (another listener claimed it)
-        response.raise_for_status()
+            if response.status_code == 204:
+                return  # No runs available (another listener claimed it)
+            response.raise_for_status()
 
-        data = response.json()["data"]
-        run_id = data["id"].removeprefix("run-")
-        attrs = data.get("attributes", {})
+            data = orjson.loads(response.content)["data"]
+            run_id = data["id"].removeprefix("run-")
+            attrs = data.get("attributes", {})
 
-        # Launch the Job in the background (fire-and-forget)
-        self._active_launches += 1
-        try:
             await self._launch_run(run_id, attrs)
         finally:
             self._active_launches -= 1
+            if self._claim_deferred and not _shutdown.is_set():
+                self._claim_deferred = False
+                task = asyncio.create_task(self._handle_run_available(), name="claim:deferred")
+                self._background_tasks.add(task)
+                task.add_done_callback(self._on_background_task_done)
 
     async def _launch_run(self, run_id: str, attrs: dict) -> None:
         """Build and launch a K8s Job for a claimed run, then report back.
@@ -555,9 +631,6 @@ class RunnerListener:
         backstop, but surfacing the actual error here gives operators an
         immediate signal at the API instead of a generic timeout 5 min later.
         """
-        from terrapod.runner.job_manager import create_job, get_job_uid
-        from terrapod.runner.job_template import build_job_spec
-
         phase = attrs.get("phase", "plan")
 
         try:
@@ -567,10 +640,8 @@ class RunnerListener:
             await self._report_launch_failed(run_id, f"Could not obtain runner token: {e}")
             return
 
-        env_vars = [{"key": v["key"], "value": v["value"]} for v in attrs.get("env-vars", [])]
-        terraform_vars = [
-            {"key": v["key"], "value": v["value"]} for v in attrs.get("terraform-vars", [])
-        ]
+        env_vars = tuple((v["key"], v["value"]) for v in attrs.get("env-vars", []))
+        terraform_vars = tuple((v["key"], v["value"]) for v in attrs.get("terraform-vars", []))
 
         run_short = run_id[:16]
         # Phase is part of the Secret name to avoid a 409 AlreadyExists when
@@ -581,10 +652,9 @@ class RunnerListener:
         # that GC at their own pace and never collide.
         auth_secret_name = f"tprun-{run_short}-{phase}-auth"
 
-        spec = build_job_spec(
+        request = job_template.JobBuildRequest(
             run_id=run_id,
             phase=phase,
-            runner_config=self.runner_config,
             auth_secret_name=auth_secret_name,
             env_vars=env_vars,
             terraform_vars=terraform_vars,
@@ -602,11 +672,10 @@ class RunnerListener:
             is_destroy=attrs.get("is-destroy", False),
             working_directory=attrs.get("working-directory", ""),
         )
-
-        namespace = os.environ.get("TERRAPOD_RUNNER_NAMESPACE", "terrapod-runners")
+        spec, job_name, namespace = job_template.build_job_spec(request, self.runner_config)
 
         try:
-            job_name = await create_job(spec)
+            await job_manager.create_job(spec, namespace)
         except Exception as e:
             logger.error("Failed to create Job", run_id=run_id, error=str(e))
             await self._report_launch_failed(run_id, f"Failed to create K8s Job: {e}")
@@ -614,7 +683,7 @@ class RunnerListener:
 
         # Create auth Secret with ownerReference to the Job
         try:
-            job_uid = await get_job_uid(job_name)
+            job_uid = await job_manager.get_job_uid(job_name)
             await self._create_auth_secret(
                 auth_secret_name, run_id, runner_token, job_name, job_uid
             )
@@ -675,8 +744,6 @@ class RunnerListener:
 
     async def _handle_check_job_status(self, data: dict) -> None:
         """Query K8s for Job status and POST the result back to the API."""
-        from terrapod.runner.job_manager import get_job_status
-
         job_name = data.get("job_name", "")
         job_namespace = data.get("job_namespace", "")
         run_id = data.get("run_id", "")
@@ -686,7 +753,7 @@ class RunnerListener:
             return
 
         try:
-            status = await get_job_status(job_name, namespace=job_namespace)
+            status = await job_manager.get_job_status(job_name, namespace=job_namespace)
             if status is None:
                 status = "deleted"
         except Exception as e:
@@ -705,8 +772,6 @@ class RunnerListener:
 
     async def _handle_stream_logs(self, data: dict) -> None:
         """Read pod logs from K8s and PUT them back to the API."""
-        from terrapod.runner.job_manager import get_pod_logs
-
         job_name = data.get("job_name", "")
         job_namespace = data.get("job_namespace", "")
         run_id = data.get("run_id", "")
@@ -716,14 +781,16 @@ class RunnerListener:
         if not job_name or not run_id:
             return
 
+        chunks = job_manager.iter_pod_logs(
+            job_name,
+            namespace=job_namespace,
+            tail_lines=tail_lines,
+            limit_bytes=256 * 1024,  # Cap at 256KB to bound memory per call
+        )
         try:
-            logs = await get_pod_logs(
-                job_name,
-                namespace=job_namespace,
-                tail_lines=tail_lines,
-                limit_bytes=256 * 1024,  # Cap at 256KB to bound memory per call
-            )
-            if not logs:
+            first = await anext(chunks, b"")
+            if not first:
+                await chunks.aclose()
                 return
         except Exception as e:
             # Pod may not have logs yet (container still starting) — this is
@@ -738,18 +805,22 @@ class RunnerListener:
                 job=job_name,
                 error=str(e),
             )
+            await chunks.aclose()
             return
 
-        # Encode once — avoid holding both str and bytes simultaneously
-        log_bytes = logs.encode() if isinstance(logs, str) else logs
-        del logs  # Release the string copy immediately
+        # Forward chunks as they arrive from K8s; the body is never joined
+        # into one buffer on the listener side.
+        async def body() -> AsyncIterator[bytes]:
+            yield first
+            async for chunk in chunks:
+                yield chunk
 
         try:
             await self._http_client.put(
                 f"/api/v2/listeners/listener-{self.identity.listener_id}"
                 f"/runs/run-{run_id}/log-stream",
                 params={"phase": phase},
-                content=log_bytes,
+                content=body(),
                 headers={
                     **self._auth_headers(),
                     "Content-Type": "application/octet-stream",
@@ -766,11 +837,11 @@ class RunnerListener:
                 job=job_name,
                 error=str(e),
             )
+        finally:
+            await chunks.aclose()
 
     async def _handle_cancel_job(self, data: dict) -> None:
         """Delete a K8s Job for a canceled run."""
-        from terrapod.runner.job_manager import delete_job
-
         job_name = data.get("job_name", "")
         job_namespace = data.get("job_namespace", "")
 
@@ -778,7 +849,7 @@ class RunnerListener:
             return
 
         try:
-            await delete_job(job_name, namespace=job_namespace)
+            await job_manager.delete_job(job_name, namespace=job_namespace)
             logger.info("Job deleted (canceled)", job=job_name)
         except Exception as e:
             logger.warning("Failed to delete Job", job=job_name, error=str(e))
@@ -794,7 +865,7 @@ class RunnerListener:
             headers=self._auth_headers(),
         )
         response.raise_for_status()
-        return response.json()["token"]
+        return orjson.loads(response.content)["token"]
 
     async def _create_auth_secret(
         self, secret_name: str, run_id: str, token: str, job_name: str, job_uid: str
@@ -805,11 +876,7 @@ class RunnerListener:
         plan and apply Secrets have distinct names and don't 409 each other
         when both Jobs of the same run live briefly in the cluster.
         """
-        from kubernetes import client as k8s_client
-
-        from terrapod.runner.job_manager import _get_core_api
-
-        namespace = os.environ.get("TERRAPOD_RUNNER_NAMESPACE", "terrapod-runners")
+        namespace = job_manager._default_namespace()
 
         secret = k8s_client.V1Secret(
             metadata=k8s_client.V1ObjectMeta(
@@ -833,18 +900,20 @@ class RunnerListener:
             string_data={"token": token},
         )
 
-        core_api = _get_core_api()
-        core_api.create_namespaced_secret(namespace=namespace, body=secret)
+        core_api = job_manager._get_core_api()
+        await asyncio.get_running_loop().run_in_executor(
+            job_manager._executor,
+            lambda: core_api.create_namespaced_secret(namespace=namespace, body=secret),
+        )
+        core_api.api_client.last_response = None
         logger.info("Created auth secret", secret=secret_name, job=job_name)
         return secret_name
 
 
-def _handle_signals() -> None:
-    """Register signal handlers for graceful shutdown."""
-    loop = asyncio.get_event_loop()
-
+def _handle_signals(loop: asyncio.AbstractEventLoop) -> None:
+    """Register signal handlers for graceful shutdown on the listener's loop."""
     for sig in (signal.SIGTERM, signal.SIGINT):
-        loop.add_signal_handler(sig, lambda: _shutdown.set())
+        loop.add_signal_handler(sig, _shutdown.set)
 
 
 def main() -> None:
@@ -857,7 +926,7 @@ def main() -> None:
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
 
-    _handle_signals()
+    _handle_signals(loop)
 
     try:
         loop.run_until_complete(listener.start())
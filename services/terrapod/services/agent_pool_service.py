@@ -5,7 +5,7 @@ import secrets
 import uuid
 from datetime import UTC, datetime, timedelta
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from terrapod.auth.ca import (
@@ -21,6 +21,36 @@ from terrapod.redis.client import get_redis_client
 
 logger = get_logger(__name__)
 
+# Join-token lookup, built once and reused on every listener join.
+_SELECT_TOKEN_BY_HASH = select(AgentPoolToken).where(
+    AgentPoolToken.token_hash == bindparam("token_hash")
+)
+
+# Hashes of existing join tokens that are dead for good: {token_hash: None},
+# oldest first. Revoked, expired and used-up tokens never come back, so a
+# listener crash-looping on one is answered from memory instead of the DB.
+# Unknown hashes are not cached: the bootstrap Job may insert a pre-shared
+# token after the listener has started trying it. Valid tokens are never
+# cached either: their use_count and revocation must be read fresh.
+_rejected_token_hashes: dict[bytes, None] = {}
+_REJECTED_TOKEN_CACHE_SIZE = 1024
+
+# Conditional increment: the max_uses check and the bump happen in one
+# statement, so concurrent joins cannot both take the last use.
+_CONSUME_TOKEN_USE = (
+    update(AgentPoolToken)
+    .where(
+        AgentPoolToken.id == bindparam("token_id"),
+        or_(
+            AgentPoolToken.max_uses.is_(None),
+            AgentPoolToken.use_count < AgentPoolToken.max_uses,
+        ),
+    )
+    .values(use_count=AgentPoolToken.use_count + 1)
+    .returning(AgentPoolToken.use_count)
+    .execution_options(synchronize_session=False)
+)
+
 
 async def create_pool(
     db: AsyncSession,
@@ -89,11 +119,15 @@ async def delete_pool(db: AsyncSession, pool: AgentPool) -> None:
 # --- Join Tokens ---
 
 
-def generate_join_token() -> tuple[str, str]:
-    """Generate a join token. Returns (raw_token, sha256_hash)."""
+def hash_join_token(raw_token: str) -> bytes:
+    """SHA-256 hash a raw join token for storage (raw 32-byte digest)."""
+    return hashlib.sha256(raw_token.encode()).digest()
+
+
+def generate_join_token() -> tuple[str, bytes]:
+    """Generate a join token. Returns (raw_token, sha256_digest)."""
     raw = secrets.token_urlsafe(48)
-    token_hash = hashlib.sha256(raw.encode()).hexdigest()
-    return raw, token_hash
+    return raw, hash_join_token(raw)
 
 
 _UNSET = object()
@@ -138,25 +172,38 @@ async def create_pool_token(
 
 async def validate_join_token(db: AsyncSession, raw_token: str) -> AgentPoolToken | None:
     """Validate a join token. Returns the token record if valid, None otherwise."""
-    token_hash = hashlib.sha256(raw_token.encode()).hexdigest()
-    result = await db.execute(select(AgentPoolToken).where(AgentPoolToken.token_hash == token_hash))
+    token_hash = hash_join_token(raw_token)
+    if token_hash in _rejected_token_hashes:
+        return None
+
+    result = await db.execute(_SELECT_TOKEN_BY_HASH, {"token_hash": token_hash})
     token = result.scalar_one_or_none()
     if token is None:
         return None
-
-    # Check revoked
-    if token.is_revoked:
+    if (
+        # Check revoked
+        token.is_revoked
+        # Check expiry
+        or (token.expires_at and utc_now() > token.expires_at)
+        # Check max uses
+        or (token.max_uses is not None and token.use_count >= token.max_uses)
+    ):
+        if len(_rejected_token_hashes) >= _REJECTED_TOKEN_CACHE_SIZE:
+            del _rejected_token_hashes[next(iter(_rejected_token_hashes))]
+        _rejected_token_hashes[token_hash] = None
         return None
 
-    # Check expiry
-    if token.expires_at and utc_now() > token.expires_at:
-        return None
+    return token
 
-    # Check max uses
-    if token.max_uses is not None and token.use_count >= token.max_uses:
-        return None
 
-    return token
+async def consume_join_token(db: AsyncSession, token: AgentPoolToken) -> int | None:
+    """Atomically record one use of a join token.
+
+    Returns the new use count, or None if the token hit max_uses since it
+    was validated (a concurrent join took the last use).
+    """
+    result = await db.execute(_CONSUME_TOKEN_USE, {"token_id": token.id})
+    return result.scalar_one_or_none()
 
 
 async def list_pool_tokens(db: AsyncSession, pool_id: uuid.UUID) -> list[AgentPoolToken]:
@@ -285,16 +332,13 @@ async def is_fingerprint_valid(
     return False
 
 
-async def join_listener(
-    pool: AgentPool,
-    token: AgentPoolToken,
-    name: str,
-    db: AsyncSession,
-) -> dict:
+async def join_listener(pool: AgentPool, name: str) -> dict:
     """Register or re-register a listener via join token exchange.
 
-    If a listener with the same name already exists (re-join after restart),
-    the existing hash is updated with a fresh certificate.
+    The caller must have validated and consumed the join token first (see
+    `consume_join_token`). If a listener with the same name already exists
+    (re-join after restart), the existing hash is updated with a fresh
+    certificate.
 
     Returns dict with listener_id, certificate PEM, private key PEM, CA cert PEM.
     """
@@ -366,10 +410,6 @@ async def join_listener(
             fingerprint=fingerprint[:16],
         )
 
-    # Increment token use count (still DB-backed)
-    token.use_count += 1
-    await db.flush()
-
     return {
         "listener_id": listener_id,
         "certificate": serialize_certificate(cert).decode(),
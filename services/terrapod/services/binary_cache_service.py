@@ -6,10 +6,12 @@ stores it in object storage, and returns a presigned download URL.
 Subsequent requests serve from cache.
 """
 
+import asyncio
 from datetime import UTC, datetime
 
 import httpx
-from sqlalchemy import select
+from sqlalchemy import bindparam, delete, func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from terrapod.api.metrics import BINARY_CACHE_REQUESTS
@@ -30,6 +32,30 @@ VALID_ARCH = {"amd64", "arm64", "arm", "386"}
 _VERSION_CACHE_PREFIX = "tp:version_resolve"
 _VERSION_CACHE_TTL = 3600  # 1 hour
 
+# Single-statement upsert for a freshly cached binary; a concurrent miss for
+# the same tool/version/platform refreshes the row instead of failing.
+_INSERT_BINARY = insert(CachedBinary)
+_UPSERT_BINARY = _INSERT_BINARY.on_conflict_do_update(
+    constraint="uq_cached_binaries",
+    set_={
+        "shasum": _INSERT_BINARY.excluded.shasum,
+        "download_url": _INSERT_BINARY.excluded.download_url,
+        "cached_at": func.now(),
+        "last_accessed_at": func.now(),
+    },
+)
+
+# Purge every platform of a tool+version in one statement; RETURNING hands
+# back the (os, arch) pairs needed to build the object-store keys.
+_PURGE_BINARY_ROWS = (
+    delete(CachedBinary)
+    .where(
+        CachedBinary.tool == bindparam("tool"),
+        CachedBinary.version == bindparam("version"),
+    )
+    .returning(CachedBinary.os, CachedBinary.arch)
+)
+
 # Pre-release stability tiers, least → most stable.
 # Both terraform and tofu use these suffixes (tofu does not emit "dev").
 _PRERELEASE_TAGS = ("dev", "alpha", "beta", "rc")
@@ -150,16 +176,17 @@ async def get_or_cache_binary(
     shasum, size_bytes = await _fetch_and_store_binary(storage, key, download_url)
 
     # Record in database
-    entry = CachedBinary(
-        tool=tool,
-        version=version,
-        os=os_,
-        arch=arch,
-        shasum=shasum,
-        download_url=download_url,
+    await db.execute(
+        _UPSERT_BINARY,
+        {
+            "tool": tool,
+            "version": version,
+            "os": os_,
+            "arch": arch,
+            "shasum": shasum,
+            "download_url": download_url,
+        },
     )
-    db.add(entry)
-    await db.flush()
 
     logger.info(
         "Binary cached",
@@ -193,20 +220,15 @@ async def purge_binary(
     version: str,
 ) -> int:
     """Purge all cached binaries for a tool+version. Returns count deleted."""
-    result = await db.execute(
-        select(CachedBinary).where(
-            CachedBinary.tool == tool,
-            CachedBinary.version == version,
-        )
+    # One DELETE ... RETURNING for the rows, then the per-platform objects
+    # concurrently. A storage failure propagates before the caller commits,
+    # so the rows survive and the purge can be retried.
+    result = await db.execute(_PURGE_BINARY_ROWS, {"tool": tool, "version": version})
+    platforms = result.all()
+    await asyncio.gather(
+        *(storage.delete(binary_cache_key(tool, version, os_, arch)) for os_, arch in platforms)
     )
-    entries = list(result.scalars().all())
-    for entry in entries:
-        key = binary_cache_key(tool, version, entry.os, entry.arch)
-        await storage.delete(key)
-        await db.delete(entry)
-
-    await db.flush()
-    return len(entries)
+    return len(platforms)
 
 
 async def warm_binary(
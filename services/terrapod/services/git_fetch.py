@@ -82,6 +82,7 @@ import os
 import re
 import tarfile
 from collections.abc import AsyncIterator, Iterable
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -157,12 +158,14 @@ def paths_hash(paths: Iterable[str] | None) -> str:
     return hashlib.sha256(payload).hexdigest()[:12]
 
 
+@lru_cache(maxsize=64)
 def _resolve_clone_host(provider: str, server_url: str | None) -> str:
     """Compute the git host (e.g. `github.com`) from a connection's API URL.
 
     The connection stores `server_url` as the HTTP API endpoint, but
     git fetches happen against the bare host. For GHE, the API URL has
-    an `api.` prefix or `/api/v3` path that we need to strip.
+    an `api.` prefix or `/api/v3` path that we need to strip. There are
+    only a handful of connections, so the parse is memoised per URL.
     """
     if provider == "gitlab":
         base = (server_url or "https://gitlab.com").rstrip("/")
@@ -21,6 +21,11 @@ logger = get_logger(__name__)
 
 DEFAULT_GITHUB_API_URL = "https://api.github.com"
 
+# Shared client so installation-token, branch/PR polling and archive calls
+# reuse pooled keep-alive TLS connections instead of a handshake per call.
+# Created lazily on first use, closed from the API lifespan.
+_client: httpx.AsyncClient | None = None
+
 # Hard cap on how long we'll wait between retries. GitHub's X-RateLimit-Reset
 # on the primary rate limit can be an hour out; we don't want to tie up a
 # poll-cycle coroutine that long — a short wait is enough to ride out a burst,
@@ -111,6 +116,22 @@ def _should_retry(resp: httpx.Response, method: str, retry_5xx: bool) -> bool:
     return False
 
 
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared GitHub HTTP client, creating it on first use."""
+    global _client  # noqa: PLW0603
+    if _client is None:
+        _client = httpx.AsyncClient()
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared GitHub HTTP client."""
+    global _client  # noqa: PLW0603
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
 async def _github_request(
     method: str,
     url: str,
@@ -140,55 +161,61 @@ async def _github_request(
     headers.setdefault("Accept", "application/vnd.github+json")
     headers.setdefault("X-GitHub-Api-Version", "2022-11-28")
 
-    async with httpx.AsyncClient(follow_redirects=follow_redirects) as client:
-        resp: httpx.Response | None = None
-        for attempt in range(_MAX_RETRIES + 1):
-            try:
-                resp = await client.request(method, url, headers=headers, **kwargs)  # type: ignore[arg-type]
-            except httpx.TransportError as e:
-                # Connect errors / read timeouts / protocol errors — the
-                # request didn't land, so it's safe to retry any method.
-                if attempt >= _MAX_RETRIES:
-                    logger.warning(
-                        "GitHub transport error, retries exhausted",
-                        method=method,
-                        url=url,
-                        error=str(e),
-                    )
-                    raise
+    client = _get_client()
+    resp: httpx.Response | None = None
+    for attempt in range(_MAX_RETRIES + 1):
+        try:
+            resp = await client.request(
+                method,
+                url,
+                headers=headers,
+                follow_redirects=follow_redirects,
+                **kwargs,  # type: ignore[arg-type]
+            )
+        except httpx.TransportError as e:
+            # Connect errors / read timeouts / protocol errors — the
+            # request didn't land, so it's safe to retry any method.
+            if attempt >= _MAX_RETRIES:
                 logger.warning(
-                    "GitHub transport error, retrying",
+                    "GitHub transport error, retries exhausted",
                     method=method,
                     url=url,
                     error=str(e),
-                    attempt=attempt + 1,
                 )
-                await asyncio.sleep(_DEFAULT_BACKOFF_SECONDS)
-                continue
+                raise
+            logger.warning(
+                "GitHub transport error, retrying",
+                method=method,
+                url=url,
+                error=str(e),
+                attempt=attempt + 1,
+            )
+            await asyncio.sleep(_DEFAULT_BACKOFF_SECONDS)
+            continue
 
-            if not _should_retry(resp, method, retry_5xx):
-                return resp
-            if attempt >= _MAX_RETRIES:
-                logger.warning(
-                    "GitHub retries exhausted, returning last response",
-                    method=method,
-                    url=url,
-                    status=resp.status_code,
-                )
-                return resp
-            delay = _parse_retry_delay(resp)
+        if not _should_retry(resp, method, retry_5xx):
+            return resp
+        if attempt >= _MAX_RETRIES:
             logger.warning(
-                "GitHub request rate-limited or failed, retrying",
+                "GitHub retries exhausted, returning last response",
                 method=method,
                 url=url,
                 status=resp.status_code,
-                delay_seconds=delay,
-                attempt=attempt + 1,
             )
-            await asyncio.sleep(delay)
-        # Unreachable: loop either returns or exhausts and returns.
-        assert resp is not None
-        return resp
+            return resp
+        delay = _parse_retry_delay(resp)
+        logger.warning(
+            "GitHub request rate-limited or failed, retrying",
+            method=method,
+            url=url,
+            status=resp.status_code,
+            delay_seconds=delay,
+            attempt=attempt + 1,
+        )
+        await asyncio.sleep(delay)
+    # Unreachable: loop either returns or exhausts and returns.
+    assert resp is not None
+    return resp
 
 
 # Installation token cache: {installation_id: (token, expires_at_epoch)}
@@ -367,17 +394,19 @@ async def download_repo_archive_to_file(
     }
 
     bytes_written = 0
-    async with httpx.AsyncClient(follow_redirects=True, timeout=timeout) as client:
-        async with client.stream("GET", url, headers=headers) as resp:
-            resp.raise_for_status()
-            with open(dest_path, "wb") as f:
-                async for chunk in resp.aiter_bytes(chunk_size=chunk_size):
-                    if not chunk:
-                        continue
-                    # Disk write is sync; offload to a thread so we don't
-                    # block the event loop on every chunk.
-                    await asyncio.to_thread(f.write, chunk)
-                    bytes_written += len(chunk)
+    client = _get_client()
+    async with client.stream(
+        "GET", url, headers=headers, follow_redirects=True, timeout=timeout
+    ) as resp:
+        resp.raise_for_status()
+        with open(dest_path, "wb") as f:
+            async for chunk in resp.aiter_bytes(chunk_size=chunk_size):
+                if not chunk:
+                    continue
+                # Disk write is sync; offload to a thread so we don't
+                # block the event loop on every chunk.
+                await asyncio.to_thread(f.write, chunk)
+                bytes_written += len(chunk)
     return bytes_written
 
 
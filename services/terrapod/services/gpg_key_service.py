@@ -18,6 +18,7 @@ from pgpy.constants import (
 )
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from terrapod.db.models import GPGKey
 from terrapod.logging_config import get_logger
@@ -157,6 +158,7 @@ async def get_or_create_signing_key(db: AsyncSession) -> tuple[GPGKey, str]:
     # 1. Existing key in DB
     result = await db.execute(
         select(GPGKey)
+        .options(undefer(GPGKey.private_key))
         .where(GPGKey.private_key.isnot(None))
         .order_by(GPGKey.created_at.desc())
         .limit(1)
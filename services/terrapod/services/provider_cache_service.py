@@ -17,7 +17,8 @@ import json
 from datetime import UTC, datetime
 
 import httpx
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from terrapod.api.metrics import PROVIDER_CACHE_REQUESTS
@@ -34,6 +35,20 @@ logger = get_logger(__name__)
 _META_KEY_PREFIX = "tp:provider_meta"
 _META_TTL = 86400  # 24 hours
 
+# Single-statement upsert for a freshly cached platform binary. Two runners
+# fetching the same platform concurrently both re-upload the same object key;
+# the later one refreshes the row instead of failing on the unique constraint.
+_INSERT_PACKAGE = insert(CachedProviderPackage)
+_UPSERT_PACKAGE = _INSERT_PACKAGE.on_conflict_do_update(
+    constraint="uq_cached_provider_packages",
+    set_={
+        "filename": _INSERT_PACKAGE.excluded.filename,
+        "shasum": _INSERT_PACKAGE.excluded.shasum,
+        "cached_at": func.now(),
+        "last_accessed_at": func.now(),
+    },
+)
+
 
 def _meta_redis_key(hostname: str, namespace: str, type_: str, version: str) -> str:
     return f"{_META_KEY_PREFIX}:{hostname}:{namespace}:{type_}:{version}"
@@ -278,18 +293,19 @@ async def fetch_and_cache_single_platform(
             size_bytes = stream.size
 
     # Record in database
-    entry = CachedProviderPackage(
-        hostname=hostname,
-        namespace=namespace,
-        type=type_,
-        version=version,
-        os=os_,
-        arch=arch,
-        filename=filename,
-        shasum=shasum,
+    await db.execute(
+        _UPSERT_PACKAGE,
+        {
+            "hostname": hostname,
+            "namespace": namespace,
+            "type": type_,
+            "version": version,
+            "os": os_,
+            "arch": arch,
+            "filename": filename,
+            "shasum": shasum,
+        },
     )
-    db.add(entry)
-    await db.flush()
 
     logger.info(
         "Provider binary cached (on-demand)",
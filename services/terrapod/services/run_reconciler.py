@@ -11,6 +11,7 @@ The API owns all run lifecycle state. The reconciler:
 Registered as a periodic task (2s interval) in app.py.
 """
 
+import asyncio
 import uuid
 from datetime import UTC, datetime, timedelta
 
@@ -33,7 +34,7 @@ async def _persist_live_log_if_missing(run: Run, phase: str) -> None:
     didn't upload its own final log.  This prevents log loss when a Job fails
     before the entrypoint's log upload step (or when the upload itself fails).
     """
-    from terrapod.redis.client import LOG_STREAM_PREFIX, get_redis_client
+    from terrapod.redis.client import LOG_STREAM_PREFIX, get_bytes
     from terrapod.storage import get_storage
     from terrapod.storage.keys import apply_log_key, plan_log_key
     from terrapod.storage.protocol import ObjectNotFoundError
@@ -52,11 +53,8 @@ async def _persist_live_log_if_missing(run: Run, phase: str) -> None:
 
     # Promote Redis live log to storage
     try:
-        redis = get_redis_client()
-        live_data = await redis.get(f"{LOG_STREAM_PREFIX}{run.id}:{phase}")
+        live_data = await get_bytes(f"{LOG_STREAM_PREFIX}{run.id}:{phase}")
         if live_data:
-            if isinstance(live_data, str):
-                live_data = live_data.encode()
             await storage.put(log_key, live_data)
             logger.info(
                 "Persisted live log from Redis to storage",
@@ -113,36 +111,40 @@ async def _reconcile_one(db: AsyncSession, run: Run) -> None:
         await _check_stale(db, run)
         return
 
-    # Publish check_job_status event to the pool's listener channel
+    # Publish check_job_status to the pool's listener channel, and also
+    # request log streaming for in-progress runs
+    requests = []
     if run.pool_id:
-        await publish_listener_event(
-            str(run.pool_id),
-            {
-                "event": "check_job_status",
-                "request_id": str(uuid.uuid4()),
-                "run_id": str(run.id),
-                "job_name": run.job_name,
-                "job_namespace": run.job_namespace or "",
-                "phase": phase,
-            },
-        )
-
-        # Also request log streaming for in-progress runs
-        await publish_listener_event(
-            str(run.pool_id),
-            {
-                "event": "stream_logs",
-                "run_id": str(run.id),
-                "job_name": run.job_name,
-                "job_namespace": run.job_namespace or "",
-                "tail_lines": 500,
-                "phase": phase,
-            },
-        )
+        requests = [
+            publish_listener_event(
+                str(run.pool_id),
+                {
+                    "event": "check_job_status",
+                    "request_id": str(uuid.uuid4()),
+                    "run_id": str(run.id),
+                    "job_name": run.job_name,
+                    "job_namespace": run.job_namespace or "",
+                    "phase": phase,
+                },
+            ),
+            publish_listener_event(
+                str(run.pool_id),
+                {
+                    "event": "stream_logs",
+                    "run_id": str(run.id),
+                    "job_name": run.job_name,
+                    "job_namespace": run.job_namespace or "",
+                    "tail_lines": 500,
+                    "phase": phase,
+                },
+            ),
+        ]
 
     # Check for recently reported status in Redis (phase-keyed to prevent
-    # stale plan "succeeded" from causing premature apply transitions)
-    status = await get_job_status_from_redis(str(run.id), phase)
+    # stale plan "succeeded" from causing premature apply transitions).
+    # Listeners answer this tick's requests for a later tick, so the read
+    # doesn't wait on the publishes — all three round-trips go out together.
+    *_, status = await asyncio.gather(*requests, get_job_status_from_redis(str(run.id), phase))
     if status is None:
         # No status yet — check for stale runs
         await _check_stale(db, run)
@@ -3,8 +3,9 @@
 import json
 import uuid
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 from terrapod.api.metrics import (
     RUN_APPLY_DURATION,
@@ -25,6 +26,30 @@ from terrapod.services.notification_service import STATUS_TO_TRIGGER
 
 logger = get_logger(__name__)
 
+# Hot run reads (listener claim polling, run lookups, workspace run lists),
+# built once with bindparam() placeholders and reused on every call.
+_SELECT_RUN_BY_ID = select(Run).where(Run.id == bindparam("run_id"))
+_SELECT_WORKSPACE_RUNS = (
+    select(Run)
+    .where(Run.workspace_id == bindparam("workspace_id"))
+    .order_by(Run.created_at.desc())
+    .offset(bindparam("offset"))
+    .limit(bindparam("limit"))
+)
+# The claimed run's workspace rides along in the same query (the listener
+# needs its var files and working directory); only the run row is locked.
+_SELECT_NEXT_CLAIMABLE_RUN = (
+    select(Run)
+    .options(joinedload(Run.workspace))
+    .where(
+        Run.status == bindparam("status"),
+        Run.pool_id == bindparam("pool_id"),
+    )
+    .order_by(Run.created_at.asc())
+    .limit(1)
+    .with_for_update(skip_locked=True, of=Run)
+)
+
 # Valid state transitions
 VALID_TRANSITIONS: dict[str, set[str]] = {
     "pending": {"queued", "canceled", "errored"},
@@ -407,6 +432,19 @@ async def complete_planned_as_noop(db: AsyncSession, run: Run) -> Run:
     return run
 
 
+async def unlock_workspace(db: AsyncSession, workspace_id: uuid.UUID) -> None:
+    """Release a workspace lock with a single UPDATE (no-op if not locked).
+
+    Avoids the load-then-assign round-trip on the listener status path; any
+    copy already in the session is synchronised by the ORM update.
+    """
+    await db.execute(
+        update(Workspace)
+        .where(Workspace.id == workspace_id, Workspace.locked.is_(True))
+        .values(locked=False, lock_id=None)
+    )
+
+
 async def queue_run(db: AsyncSession, run: Run) -> Run:
     """Queue a run for execution."""
     return await transition_run(db, run, "queued")
@@ -513,7 +551,7 @@ async def cancel_run(db: AsyncSession, run: Run, *, force: bool = False) -> Run:
 
 async def get_run(db: AsyncSession, run_id: uuid.UUID) -> Run | None:
     """Get a run by ID."""
-    result = await db.execute(select(Run).where(Run.id == run_id))
+    result = await db.execute(_SELECT_RUN_BY_ID, {"run_id": run_id})
     return result.scalar_one_or_none()
 
 
@@ -525,11 +563,12 @@ async def list_workspace_runs(
 ) -> list[Run]:
     """List runs for a workspace, ordered by creation time desc."""
     result = await db.execute(
-        select(Run)
-        .where(Run.workspace_id == workspace_id)
-        .order_by(Run.created_at.desc())
-        .offset((page_number - 1) * page_size)
-        .limit(page_size)
+        _SELECT_WORKSPACE_RUNS,
+        {
+            "workspace_id": workspace_id,
+            "offset": (page_number - 1) * page_size,
+            "limit": page_size,
+        },
     )
     return list(result.scalars().all())
 
@@ -556,18 +595,9 @@ async def claim_next_run(
         ("queued", "plan", "planning"),
         ("confirmed", "apply", "applying"),
     ]:
-        query = (
-            select(Run)
-            .where(
-                Run.status == target_status,
-                Run.pool_id == pool_id,
-            )
-            .order_by(Run.created_at.asc())
-            .limit(1)
-            .with_for_update(skip_locked=True)
+        result = await db.execute(
+            _SELECT_NEXT_CLAIMABLE_RUN, {"status": target_status, "pool_id": pool_id}
         )
-
-        result = await db.execute(query)
         run = result.scalar_one_or_none()
 
         if run is not None:
@@ -8,8 +8,9 @@ import hashlib
 import uuid
 from dataclasses import dataclass
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from terrapod.db.models import (
     Variable,
@@ -20,6 +21,32 @@ from terrapod.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Variable resolution runs for every run; these statements are built once and
+# reused instead of constructing the same clauses on each call.
+_SELECT_WORKSPACE_VARIABLES = (
+    select(Variable)
+    .where(Variable.workspace_id == bindparam("workspace_id"))
+    .order_by(Variable.key)
+)
+_SELECT_GLOBAL_VARSETS = (
+    select(VariableSet)
+    .options(selectinload(VariableSet.variables))
+    .where(
+        VariableSet.global_set.is_(True),
+        VariableSet.priority == bindparam("priority"),
+    )
+)
+_SELECT_ASSIGNED_VARSETS = (
+    select(VariableSet)
+    .options(selectinload(VariableSet.variables))
+    .join(VariableSetWorkspace, VariableSet.id == VariableSetWorkspace.variable_set_id)
+    .where(
+        VariableSetWorkspace.workspace_id == bindparam("workspace_id"),
+        VariableSet.global_set.is_(False),
+        VariableSet.priority == bindparam("priority"),
+    )
+)
+
 
 @dataclass
 class ResolvedVariable:
@@ -110,9 +137,7 @@ async def get_variable(
 
 async def list_variables(db: AsyncSession, workspace_id: uuid.UUID) -> list[Variable]:
     """List all variables for a workspace."""
-    result = await db.execute(
-        select(Variable).where(Variable.workspace_id == workspace_id).order_by(Variable.key)
-    )
+    result = await db.execute(_SELECT_WORKSPACE_VARIABLES, {"workspace_id": workspace_id})
     return list(result.scalars().all())
 
 
@@ -176,30 +201,10 @@ async def _get_applicable_varsets(
     db: AsyncSession, workspace_id: uuid.UUID, priority: bool
 ) -> list[VariableSet]:
     """Get variable sets applicable to a workspace."""
-    # Global sets
-    global_q = select(VariableSet).where(
-        VariableSet.global_set.is_(True),
-        VariableSet.priority.is_(priority),
-    )
-
-    # Assigned sets
-    assigned_q = (
-        select(VariableSet)
-        .join(VariableSetWorkspace, VariableSet.id == VariableSetWorkspace.variable_set_id)
-        .where(
-            VariableSetWorkspace.workspace_id == workspace_id,
-            VariableSet.global_set.is_(False),
-            VariableSet.priority.is_(priority),
-        )
+    # Global sets, then sets assigned to this workspace
+    global_result = await db.execute(_SELECT_GLOBAL_VARSETS, {"priority": priority})
+    assigned_result = await db.execute(
+        _SELECT_ASSIGNED_VARSETS, {"workspace_id": workspace_id, "priority": priority}
     )
 
-    global_result = await db.execute(global_q)
-    assigned_result = await db.execute(assigned_q)
-
-    varsets = list(global_result.scalars().all()) + list(assigned_result.scalars().all())
-
-    # Eagerly load variables for each set
-    for vs in varsets:
-        await db.refresh(vs, ["variables"])
-
-    return varsets
+    return list(global_result.scalars().all()) + list(assigned_result.scalars().all())
@@ -76,7 +76,7 @@ class TestListenerHeartbeat:
     listener-id must also match the path id.
     """
 
-    @patch("terrapod.redis.client.publish_event", new_callable=AsyncMock)
+    @patch("terrapod.redis.client.publish_events", new_callable=AsyncMock)
     @patch("terrapod.services.agent_pool_service.heartbeat_listener", new_callable=AsyncMock)
     @patch("terrapod.services.agent_pool_service.get_listener")
     async def test_heartbeat_sets_redis_keys(self, mock_get_listener, mock_heartbeat, mock_publish):
@@ -106,7 +106,7 @@ class TestListenerHeartbeat:
         assert call_kwargs["capacity"] == "5"
         assert call_kwargs["active_runs"] == "2"
 
-    @patch("terrapod.redis.client.publish_event", new_callable=AsyncMock)
+    @patch("terrapod.redis.client.publish_events", new_callable=AsyncMock)
     @patch("terrapod.services.agent_pool_service.heartbeat_listener", new_callable=AsyncMock)
     @patch("terrapod.services.agent_pool_service.get_listener")
     async def test_heartbeat_without_pod_name_passes_none(
@@ -130,7 +130,7 @@ class TestListenerHeartbeat:
         mock_heartbeat.assert_called_once()
         assert mock_heartbeat.call_args.kwargs["pod_name"] is None
 
-    @patch("terrapod.redis.client.publish_event", new_callable=AsyncMock)
+    @patch("terrapod.redis.client.publish_events", new_callable=AsyncMock)
     @patch("terrapod.services.agent_pool_service.heartbeat_listener", new_callable=AsyncMock)
     @patch("terrapod.services.agent_pool_service.get_listener")
     async def test_heartbeat_publishes_admin_event(
@@ -152,10 +152,11 @@ class TestListenerHeartbeat:
 
         assert res.status_code == 200
 
-        # Verify publish_event was called with admin channel
-        assert mock_publish.call_count >= 1
-        channels = [call.args[0] for call in mock_publish.call_args_list]
+        # Admin and pool channels are published in one pipelined call
+        mock_publish.assert_awaited_once()
+        channels = mock_publish.call_args.args[0]
         assert "tp:admin_events" in channels
+        assert f"tp:pool_events:{listener['pool_id']}" in channels
 
     @patch("terrapod.services.agent_pool_service.get_listener")
     async def test_heartbeat_not_found(self, mock_get_listener):
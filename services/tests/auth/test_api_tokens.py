@@ -44,10 +44,10 @@ class TestHashToken:
         h2 = hash_token(raw)
         assert h1 == h2
 
-    def test_hash_is_hex_sha256(self):
+    def test_hash_is_raw_sha256_digest(self):
         h = hash_token("test")
-        assert len(h) == 64  # SHA-256 produces 64 hex chars
-        assert all(c in "0123456789abcdef" for c in h)
+        assert isinstance(h, bytes)
+        assert len(h) == 32  # SHA-256 produces a 32-byte digest
 
     def test_different_tokens_different_hashes(self):
         h1 = hash_token("token-a")
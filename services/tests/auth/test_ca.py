@@ -64,6 +64,11 @@ class TestCertificateAuthorityGenerate:
         assert pem.startswith("-----BEGIN CERTIFICATE-----")
         assert pem.strip().endswith("-----END CERTIFICATE-----")
 
+    def test_ca_public_key_matches_cert(self):
+        ca = CertificateAuthority.generate()
+        assert ca.ca_public_key.public_bytes_raw() == ca.ca_cert.public_key().public_bytes_raw()
+        assert ca.ca_public_key is ca.ca_public_key
+
 
 class TestCertificateAuthorityLoad:
     def test_roundtrip_load(self):
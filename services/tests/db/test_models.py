@@ -0,0 +1,22 @@
+"""Tests for database model helpers."""
+
+import time
+import uuid
+
+from terrapod.db.models import generate_uuid7
+
+
+class TestGenerateUuid7:
+    def test_version_and_variant(self):
+        value = generate_uuid7()
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_embeds_current_millisecond_timestamp(self):
+        before = time.time_ns() // 1_000_000
+        value = generate_uuid7()
+        after = time.time_ns() // 1_000_000
+        assert before <= int.from_bytes(value.bytes[:6], "big") <= after
+
+    def test_unique(self):
+        assert len({generate_uuid7() for _ in range(1000)}) == 1000
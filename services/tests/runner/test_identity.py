@@ -56,6 +56,11 @@ def _identity():
     )
 
 
+@pytest.fixture(autouse=True)
+def _reset_api_client(monkeypatch):
+    monkeypatch.setattr(identity_mod, "_api_client", None)
+
+
 class TestCallRenewWithRetries:
     @pytest.mark.asyncio
     async def test_returns_data_on_200(self):
@@ -106,15 +111,18 @@ class TestCallRenewWithRetries:
         mock_client = AsyncMock()
         mock_client.__aenter__.return_value = mock_client
         mock_client.post.side_effect = [mock_500, mock_200]
+        mock_client.is_closed = False
 
         with (
-            patch("httpx.AsyncClient", return_value=mock_client),
+            patch("httpx.AsyncClient", return_value=mock_client) as client_cls,
             patch("asyncio.sleep", new=AsyncMock()),
         ):
             result = await identity_mod._call_renew_with_retries(ident)
 
         assert result == {"certificate": "PEM"}
         assert mock_client.post.call_count == 2
+        # Retries reuse the shared client's connection rather than building a new one.
+        client_cls.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_returns_none_after_three_failures(self):
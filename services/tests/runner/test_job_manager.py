@@ -0,0 +1,110 @@
+"""Tests for job_manager — shared Job status snapshot."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from kubernetes.client.rest import ApiException
+
+from terrapod.runner import job_manager
+
+
+def _job(name: str, *, succeeded: int = 0, failed: int = 0, active: int = 1):
+    return SimpleNamespace(
+        metadata=SimpleNamespace(name=name),
+        status=SimpleNamespace(succeeded=succeeded, failed=failed, active=active),
+    )
+
+
+@pytest.fixture
+def batch_api(monkeypatch):
+    api = MagicMock()
+    monkeypatch.setattr(job_manager, "_batch_v1", api)
+    monkeypatch.setattr(job_manager, "_job_snapshots", {})
+    monkeypatch.setattr(job_manager, "_job_snapshot_tasks", {})
+    return api
+
+
+class TestGetJobStatus:
+    async def test_concurrent_callers_share_one_list(self, batch_api):
+        batch_api.list_namespaced_job.return_value = SimpleNamespace(
+            items=[_job("tprun-a-plan"), _job("tprun-b-plan", succeeded=1)]
+        )
+
+        results = await asyncio.gather(
+            job_manager.get_job_status("tprun-a-plan", "ns"),
+            job_manager.get_job_status("tprun-b-plan", "ns"),
+            job_manager.get_job_status("tprun-a-plan", "ns"),
+        )
+
+        assert results == ["running", "succeeded", "running"]
+        assert batch_api.list_namespaced_job.call_count == 1
+        batch_api.read_namespaced_job.assert_not_called()
+
+    async def test_snapshot_miss_falls_back_to_direct_read(self, batch_api):
+        batch_api.list_namespaced_job.return_value = SimpleNamespace(items=[])
+        batch_api.read_namespaced_job.return_value = _job("tprun-new-plan", failed=1)
+
+        assert await job_manager.get_job_status("tprun-new-plan", "ns") == "failed"
+        batch_api.read_namespaced_job.assert_called_once()
+
+    async def test_missing_job_returns_none(self, batch_api):
+        batch_api.list_namespaced_job.return_value = SimpleNamespace(items=[])
+        batch_api.read_namespaced_job.side_effect = ApiException(status=404)
+
+        assert await job_manager.get_job_status("tprun-gone-plan", "ns") is None
+
+
+@pytest.fixture
+def core_api(monkeypatch):
+    api = MagicMock()
+    monkeypatch.setattr(job_manager, "_core_v1", api)
+    monkeypatch.setattr(job_manager, "_job_pod_cache", {})
+    return api
+
+
+async def _collect(job_name: str) -> bytes:
+    return b"".join([c async for c in job_manager.iter_pod_logs(job_name, "ns")])
+
+
+def _log_response(*chunks: bytes):
+    resp = MagicMock()
+    resp.stream.side_effect = lambda _size: iter(chunks)
+    return resp
+
+
+class TestIterPodLogs:
+    async def test_streams_raw_chunks(self, core_api):
+        core_api.list_namespaced_pod.return_value = SimpleNamespace(
+            items=[SimpleNamespace(metadata=SimpleNamespace(name="tprun-a-plan-xyz"))]
+        )
+        resp = _log_response(b"line 1\n", b"line 2\n")
+        core_api.read_namespaced_pod_log.return_value = resp
+
+        assert await _collect("tprun-a-plan") == b"line 1\nline 2\n"
+        assert core_api.read_namespaced_pod_log.call_args.kwargs["_preload_content"] is False
+        resp.release_conn.assert_called_once()
+
+    async def test_pod_name_is_cached_across_tails(self, core_api):
+        core_api.list_namespaced_pod.return_value = SimpleNamespace(
+            items=[SimpleNamespace(metadata=SimpleNamespace(name="tprun-a-plan-xyz"))]
+        )
+        core_api.read_namespaced_pod_log.side_effect = lambda **_: _log_response(b"line\n")
+
+        assert await _collect("tprun-a-plan") == b"line\n"
+        assert await _collect("tprun-a-plan") == b"line\n"
+
+        assert core_api.list_namespaced_pod.call_count == 1
+        assert core_api.read_namespaced_pod_log.call_args.kwargs["name"] == "tprun-a-plan-xyz"
+
+    async def test_log_404_invalidates_cached_pod(self, core_api):
+        core_api.list_namespaced_pod.return_value = SimpleNamespace(
+            items=[SimpleNamespace(metadata=SimpleNamespace(name="tprun-a-plan-xyz"))]
+        )
+        core_api.read_namespaced_pod_log.side_effect = ApiException(status=404)
+
+        assert await _collect("tprun-a-plan") == b""
+        assert await _collect("tprun-a-plan") == b""
+
+        assert core_api.list_namespaced_pod.call_count == 2
@@ -9,6 +9,7 @@ def _runner_config():
     cfg = MagicMock()
     cfg.image.repository = "ghcr.io/test/runner"
     cfg.image.tag = "latest"
+    cfg.image.ref = "ghcr.io/test/runner:latest"
     cfg.image.pull_policy = "IfNotPresent"
     cfg.default = "default"
     cfg.default_terraform_version = "1.11"
@@ -34,16 +35,18 @@ def _runner_config():
 class TestVarFilesInjection:
     def test_var_files_env_var_set(self):
         """TP_VAR_FILES should be set when var_files is provided."""
-        from terrapod.runner.job_template import build_job_spec
+        from terrapod.runner.job_template import JobBuildRequest, build_job_spec
 
-        spec = build_job_spec(
-            run_id="abc123",
-            phase="plan",
-            runner_config=_runner_config(),
-            auth_secret_name="tprun-abc12345-auth",
-            env_vars=[],
-            terraform_vars=[],
-            var_files=["envs/dev.tfvars", "secrets.tfvars"],
+        spec, _, _ = build_job_spec(
+            JobBuildRequest(
+                run_id="abc123",
+                phase="plan",
+                auth_secret_name="tprun-abc12345-auth",
+                env_vars=(),
+                terraform_vars=(),
+                var_files=["envs/dev.tfvars", "secrets.tfvars"],
+            ),
+            _runner_config(),
         )
 
         container = spec["spec"]["template"]["spec"]["containers"][0]
@@ -54,16 +57,18 @@ class TestVarFilesInjection:
 
     def test_no_var_files_env_var_when_empty(self):
         """TP_VAR_FILES should NOT be set when var_files is empty."""
-        from terrapod.runner.job_template import build_job_spec
+        from terrapod.runner.job_template import JobBuildRequest, build_job_spec
 
-        spec = build_job_spec(
-            run_id="abc123",
-            phase="plan",
-            runner_config=_runner_config(),
-            auth_secret_name="tprun-abc12345-auth",
-            env_vars=[],
-            terraform_vars=[],
-            var_files=[],
+        spec, _, _ = build_job_spec(
+            JobBuildRequest(
+                run_id="abc123",
+                phase="plan",
+                auth_secret_name="tprun-abc12345-auth",
+                env_vars=(),
+                terraform_vars=(),
+                var_files=[],
+            ),
+            _runner_config(),
         )
 
         container = spec["spec"]["template"]["spec"]["containers"][0]
@@ -72,16 +77,18 @@ class TestVarFilesInjection:
 
     def test_no_var_files_env_var_when_none(self):
         """TP_VAR_FILES should NOT be set when var_files is None."""
-        from terrapod.runner.job_template import build_job_spec
+        from terrapod.runner.job_template import JobBuildRequest, build_job_spec
 
-        spec = build_job_spec(
-            run_id="abc123",
-            phase="plan",
-            runner_config=_runner_config(),
-            auth_secret_name="tprun-abc12345-auth",
-            env_vars=[],
-            terraform_vars=[],
-            var_files=None,
+        spec, _, _ = build_job_spec(
+            JobBuildRequest(
+                run_id="abc123",
+                phase="plan",
+                auth_secret_name="tprun-abc12345-auth",
+                env_vars=(),
+                terraform_vars=(),
+                var_files=None,
+            ),
+            _runner_config(),
         )
 
         container = spec["spec"]["template"]["spec"]["containers"][0]
@@ -90,15 +97,17 @@ class TestVarFilesInjection:
 
     def test_var_files_default_omitted(self):
         """TP_VAR_FILES should NOT be set when var_files is not passed."""
-        from terrapod.runner.job_template import build_job_spec
+        from terrapod.runner.job_template import JobBuildRequest, build_job_spec
 
-        spec = build_job_spec(
-            run_id="abc123",
-            phase="plan",
-            runner_config=_runner_config(),
-            auth_secret_name="tprun-abc12345-auth",
-            env_vars=[],
-            terraform_vars=[],
+        spec, _, _ = build_job_spec(
+            JobBuildRequest(
+                run_id="abc123",
+                phase="plan",
+                auth_secret_name="tprun-abc12345-auth",
+                env_vars=(),
+                terraform_vars=(),
+            ),
+            _runner_config(),
         )
 
         container = spec["spec"]["template"]["spec"]["containers"][0]
@@ -110,16 +119,19 @@ class TestPodFailurePolicy:
     """Verify pod failure policy prevents retries after container execution."""
 
     def _build_default_spec(self):
-        from terrapod.runner.job_template import build_job_spec
+        from terrapod.runner.job_template import JobBuildRequest, build_job_spec
 
-        return build_job_spec(
-            run_id="abc123",
-            phase="plan",
-            runner_config=_runner_config(),
-            auth_secret_name="tprun-abc12345-auth",
-            env_vars=[],
-            terraform_vars=[],
+        spec, _, _ = build_job_spec(
+            JobBuildRequest(
+                run_id="abc123",
+                phase="plan",
+                auth_secret_name="tprun-abc12345-auth",
+                env_vars=(),
+                terraform_vars=(),
+            ),
+            _runner_config(),
         )
+        return spec
 
     def test_backoff_limit(self):
         """backoffLimit should be 3 to allow retries for pod disruptions."""
@@ -156,15 +168,17 @@ class TestPodFailurePolicy:
 class TestAuthTokenInjection:
     def test_auth_token_from_secret_ref(self):
         """TP_AUTH_TOKEN should use secretKeyRef, not a plain value."""
-        from terrapod.runner.job_template import build_job_spec
+        from terrapod.runner.job_template import JobBuildRequest, build_job_spec
 
-        spec = build_job_spec(
-            run_id="abc123",
-            phase="plan",
-            runner_config=_runner_config(),
-            auth_secret_name="tprun-abc12345-auth",
-            env_vars=[],
-            terraform_vars=[],
+        spec, _, _ = build_job_spec(
+            JobBuildRequest(
+                run_id="abc123",
+                phase="plan",
+                auth_secret_name="tprun-abc12345-auth",
+                env_vars=(),
+                terraform_vars=(),
+            ),
+            _runner_config(),
         )
 
         container = spec["spec"]["template"]["spec"]["containers"][0]
@@ -172,3 +186,217 @@ class TestAuthTokenInjection:
         assert "valueFrom" in auth_env
         assert auth_env["valueFrom"]["secretKeyRef"]["name"] == "tprun-abc12345-auth"
         assert auth_env["valueFrom"]["secretKeyRef"]["key"] == "token"
+
+
+class TestDoubleResource:
+    def test_doubles_each_unit(self):
+        from terrapod.runner.job_template import _double_resource
+
+        assert _double_resource("1") == "2"
+        assert _double_resource("250m") == "500m"
+        assert _double_resource("500m") == "1"
+        assert _double_resource("750m") == "1500m"
+        assert _double_resource("1500m") == "3"
+        assert _double_resource("0m") == "0"
+        assert _double_resource("256Mi") == "512Mi"
+        assert _double_resource(" 2Gi ") == "4Gi"
+        assert _double_resource("1Ki") == "2Ki"
+        assert _double_resource("1Ti") == "2Ti"
+
+    def test_unparseable_returned_as_is(self):
+        from terrapod.runner.job_template import _double_resource
+
+        for value in ("", "m", "Gi", "1.5", "1G", "-1", "abc", "1mi"):
+            assert _double_resource(value) == value
+
+    def test_common_values_skip_the_parser(self):
+        from terrapod.runner.job_template import _double_resource, _parse_and_double
+
+        _parse_and_double.cache_clear()
+        assert _double_resource("2Gi") == "4Gi"
+        assert _double_resource("500m") == "1"
+
+        info = _parse_and_double.cache_info()
+        assert (info.hits, info.misses) == (0, 0)
+
+    def test_other_values_are_memoised(self):
+        from terrapod.runner.job_template import _double_resource, _parse_and_double
+
+        _parse_and_double.cache_clear()
+        _double_resource("3Gi")
+        _double_resource("3Gi")
+
+        info = _parse_and_double.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+
+class TestImageRef:
+    def test_tag_appended_when_set(self):
+        from terrapod.config import RunnerImageConfig
+
+        assert RunnerImageConfig(repository="r/runner", tag="1.2").ref == "r/runner:1.2"
+        assert RunnerImageConfig(repository="r/runner").ref == "r/runner"
+
+    def test_ref_used_in_job_spec(self):
+        from terrapod.runner.job_template import JobBuildRequest, build_job_spec
+
+        spec, _, _ = build_job_spec(
+            JobBuildRequest(
+                run_id="abc123",
+                phase="plan",
+                auth_secret_name="tprun-abc123-plan-auth",
+                env_vars=(),
+                terraform_vars=(),
+            ),
+            _runner_config(),
+        )
+        container = spec["spec"]["template"]["spec"]["containers"][0]
+        assert container["image"] == "ghcr.io/test/runner:latest"
+
+
+class TestContainerEnvOrder:
+    def test_env_order_is_stable(self):
+        from terrapod.runner.job_template import JobBuildRequest, build_job_spec
+
+        cfg = _runner_config()
+        cfg.termination_grace_period_seconds = 120
+        cfg.extra_env = [{"name": "EXTRA", "value": "1"}]
+
+        spec, _, _ = build_job_spec(
+            JobBuildRequest(
+                run_id="abc123",
+                phase="apply",
+                auth_secret_name="tprun-abc123-apply-auth",
+                env_vars=(("AWS_REGION", "eu-west-1"),),
+                terraform_vars=(("region", "eu-west-1"),),
+                refresh=False,
+                is_destroy=True,
+            ),
+            cfg,
+        )
+        env = spec["spec"]["template"]["spec"]["containers"][0]["env"]
+
+        assert [e["name"] for e in env] == [
+            "TP_RUN_ID",
+            "TP_PHASE",
+            "TP_API_URL",
+            "TP_AUTH_TOKEN",
+            "TP_VERSION",
+            "TP_BACKEND",
+            "TP_REFRESH",
+            "TP_DESTROY",
+            "TP_TERMINATION_GRACE",
+            "AWS_REGION",
+            "TF_VAR_region",
+            "EXTRA",
+        ]
+
+    def test_request_can_be_rebuilt(self):
+        from terrapod.runner.job_template import JobBuildRequest, build_job_spec
+
+        req = JobBuildRequest(
+            run_id="abc123",
+            phase="plan",
+            auth_secret_name="tprun-abc123-plan-auth",
+            env_vars=(("AWS_REGION", "eu-west-1"),),
+            terraform_vars=(("region", "eu-west-1"),),
+        )
+
+        cfg = _runner_config()
+        first, _, _ = build_job_spec(req, cfg)
+        second, _, _ = build_job_spec(req, cfg)
+
+        env = second["spec"]["template"]["spec"]["containers"][0]["env"]
+        assert {"name": "TF_VAR_region", "value": "eu-west-1"} in env
+        assert env == first["spec"]["template"]["spec"]["containers"][0]["env"]
+
+
+class TestLabels:
+    def _spec(self, cfg):
+        from terrapod.runner.job_template import JobBuildRequest, build_job_spec
+
+        spec, _, _ = build_job_spec(
+            JobBuildRequest(
+                run_id="abc123",
+                phase="plan",
+                auth_secret_name="tprun-abc123-plan-auth",
+                env_vars=(),
+                terraform_vars=(),
+            ),
+            cfg,
+        )
+        return spec
+
+    def test_job_and_pod_labels(self):
+        spec = self._spec(_runner_config())
+
+        assert spec["metadata"]["labels"] == {
+            "app.kubernetes.io/name": "terrapod-runner",
+            "app.kubernetes.io/component": "runner",
+            "terrapod.io/run-id": "abc123",
+            "terrapod.io/phase": "plan",
+        }
+        assert spec["spec"]["template"]["metadata"]["labels"] == {
+            "app.kubernetes.io/name": "terrapod-runner",
+            "terrapod.io/run-id": "abc123",
+            "terrapod.io/phase": "plan",
+        }
+
+    def test_azure_label_does_not_leak_between_specs(self):
+        cfg = _runner_config()
+        cfg.azure_workload_identity = True
+        azure_spec = self._spec(cfg)
+        plain_spec = self._spec(_runner_config())
+
+        azure_labels = azure_spec["spec"]["template"]["metadata"]["labels"]
+        plain_labels = plain_spec["spec"]["template"]["metadata"]["labels"]
+        assert azure_labels["azure.workload.identity/use"] == "true"
+        assert "azure.workload.identity/use" not in plain_labels
+
+
+class TestPodSpecOptions:
+    def test_set_options_copied_unset_omitted(self):
+        from terrapod.runner.job_template import JobBuildRequest, build_job_spec
+
+        cfg = _runner_config()
+        cfg.service_account_name = "runner-sa"
+        cfg.node_selector = {"pool": "runners"}
+        cfg.image_pull_secrets = ["regcred"]
+        cfg.extra_env_from = []
+
+        spec, _, _ = build_job_spec(
+            JobBuildRequest(
+                run_id="abc123",
+                phase="plan",
+                auth_secret_name="tprun-abc123-plan-auth",
+                env_vars=(),
+                terraform_vars=(),
+            ),
+            cfg,
+        )
+        pod_spec = spec["spec"]["template"]["spec"]
+
+        assert pod_spec["serviceAccountName"] == "runner-sa"
+        assert pod_spec["nodeSelector"] == {"pool": "runners"}
+        assert pod_spec["imagePullSecrets"] == [{"name": "regcred"}]
+        assert "tolerations" not in pod_spec
+        assert "affinity" not in pod_spec
+        assert "envFrom" not in pod_spec["containers"][0]
+
+
+class TestReturnValue:
+    def test_returns_name_and_namespace(self):
+        from terrapod.runner.job_template import JobBuildRequest, build_job_spec
+
+        spec, job_name, namespace = build_job_spec(
+            JobBuildRequest(
+                run_id="0123456789abcdef-zzzz",
+                phase="apply",
+                auth_secret_name="tprun-0123456789abcdef-apply-auth",
+                namespace="runners",
+            ),
+            _runner_config(),
+        )
+
+        assert job_name == "tprun-0123456789abcdef-apply" == spec["metadata"]["name"]
+        assert namespace == "runners" == spec["metadata"]["namespace"]
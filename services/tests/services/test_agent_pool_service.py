@@ -12,6 +12,7 @@ from terrapod.services.agent_pool_service import (
     LISTENER_POD_TTL,
     _fingerprint_ttl,
     _register_fingerprint,
+    consume_join_token,
     count_listener_replicas,
     create_pool_token,
     generate_join_token,
@@ -33,7 +34,7 @@ class TestGenerateJoinToken:
     def test_hash_matches_raw(self):
         """SHA-256 hash matches the raw token value."""
         raw, token_hash = generate_join_token()
-        expected = hashlib.sha256(raw.encode()).hexdigest()
+        expected = hashlib.sha256(raw.encode()).digest()
         assert token_hash == expected
 
     def test_uniqueness(self):
@@ -165,6 +166,83 @@ class TestValidateJoinToken:
         result = await validate_join_token(db, raw)
         assert result is mock_record
 
+    @pytest.mark.asyncio
+    async def test_rejected_token_is_not_looked_up_again(self):
+        """A dead token is answered from memory on the next attempt."""
+        raw, _ = generate_join_token()
+        db = AsyncMock()
+        result_mock = MagicMock()
+        result_mock.scalar_one_or_none.return_value = _mock_token(is_revoked=True)
+        db.execute.return_value = result_mock
+
+        assert await validate_join_token(db, raw) is None
+        assert await validate_join_token(db, raw) is None
+        assert db.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_token_is_accepted_once_inserted(self):
+        """A token tried before its row exists is valid once the row lands."""
+        raw, _ = generate_join_token()
+        mock_record = _mock_token()
+        db = AsyncMock()
+        result_mock = MagicMock()
+        result_mock.scalar_one_or_none.side_effect = [None, mock_record]
+        db.execute.return_value = result_mock
+
+        assert await validate_join_token(db, raw) is None
+        assert await validate_join_token(db, raw) is mock_record
+        assert db.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_valid_token_is_always_looked_up(self):
+        """Valid tokens are re-read so use_count/revocation stay current."""
+        raw, _ = generate_join_token()
+        db = AsyncMock()
+        result_mock = MagicMock()
+        result_mock.scalar_one_or_none.return_value = _mock_token()
+        db.execute.return_value = result_mock
+
+        await validate_join_token(db, raw)
+        await validate_join_token(db, raw)
+        assert db.execute.await_count == 2
+
+
+# ── consume_join_token ───────────────────────────────────────────────
+
+
+class TestConsumeJoinToken:
+    @pytest.mark.asyncio
+    async def test_returns_new_use_count(self):
+        """A successful conditional UPDATE returns the incremented count."""
+        token = _mock_token(max_uses=2, use_count=0)
+        token.id = uuid.uuid4()
+
+        db = AsyncMock()
+        result_mock = MagicMock()
+        result_mock.scalar_one_or_none.return_value = 1
+        db.execute.return_value = result_mock
+
+        assert await consume_join_token(db, token) == 1
+        stmt, params = db.execute.call_args.args
+        assert params == {"token_id": token.id}
+        sql = str(stmt)
+        assert "use_count + " in sql
+        assert "max_uses IS NULL" in sql
+        assert "RETURNING" in sql
+
+    @pytest.mark.asyncio
+    async def test_exhausted_returns_none(self):
+        """No row updated (max_uses reached concurrently) returns None."""
+        token = _mock_token(max_uses=2, use_count=1)
+        token.id = uuid.uuid4()
+
+        db = AsyncMock()
+        result_mock = MagicMock()
+        result_mock.scalar_one_or_none.return_value = None
+        db.execute.return_value = result_mock
+
+        assert await consume_join_token(db, token) is None
+
 
 # ── create_pool_token defaults ──────────────────────────────────────
 
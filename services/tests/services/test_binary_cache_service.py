@@ -9,6 +9,7 @@ from terrapod.services.binary_cache_service import (
     _parse_stability,
     _version_sort_key,
     get_or_cache_binary,
+    purge_binary,
 )
 
 
@@ -186,3 +187,24 @@ class TestGetOrCacheBinaryGatesPrereleases:
 
         url = await get_or_cache_binary(db, storage, "terraform", "1.14.8", "linux", "amd64")
         assert url == "https://example/presigned"
+
+
+class TestPurgeBinary:
+    async def test_deletes_every_platform_object_and_row(self) -> None:
+        result = MagicMock()
+        result.all.return_value = [("linux", "amd64"), ("darwin", "arm64")]
+        db = AsyncMock()
+        db.execute.return_value = result
+        storage = AsyncMock()
+
+        assert await purge_binary(db, storage, "tofu", "1.9.0") == 2
+
+        deleted = {c.args[0] for c in storage.delete.await_args_list}
+        assert deleted == {
+            "cache/binaries/tofu/1.9.0/linux_amd64",
+            "cache/binaries/tofu/1.9.0/darwin_arm64",
+        }
+        # Rows go in one DELETE ... RETURNING, not an ORM delete per entry
+        db.execute.assert_awaited_once()
+        assert str(db.execute.call_args.args[0]).startswith("DELETE FROM cached_binaries")
+        db.delete.assert_not_called()
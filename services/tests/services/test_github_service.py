@@ -228,6 +228,14 @@ def _fake_resp(
     return resp
 
 
+@pytest.fixture(autouse=True)
+def fresh_github_client(monkeypatch):
+    """Each test builds its own shared client (patched or real)."""
+    from terrapod.services import github_service
+
+    monkeypatch.setattr(github_service, "_client", None)
+
+
 def _patched_client(sequence):
     """Patch httpx.AsyncClient to return responses (or raise exceptions) in order."""
     from unittest.mock import AsyncMock
@@ -463,6 +471,20 @@ class TestGithubRequestRetry:
         assert m_cls.return_value.request.await_count == 1
 
 
+class TestSharedClient:
+    @pytest.mark.asyncio
+    async def test_requests_reuse_one_client(self):
+        from terrapod.services.github_service import _github_request
+
+        client = _patched_client([_fake_resp(200), _fake_resp(200)])
+        with patch("httpx.AsyncClient", return_value=client) as m_cls:
+            await _github_request("GET", "https://api.github.com/a", "tok")
+            await _github_request("GET", "https://api.github.com/b", "tok")
+
+        assert m_cls.call_count == 1
+        assert client.request.await_count == 2
+
+
 class TestParseRetryDelay:
     def test_prefers_retry_after_seconds(self):
         from terrapod.services.github_service import _parse_retry_delay
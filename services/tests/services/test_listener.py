@@ -27,10 +27,11 @@ def _make_listener(shutdown_event: asyncio.Event, **overrides) -> RunnerListener
         mock_cfg.return_value = MagicMock(definitions=[])
         listener = RunnerListener()
 
-    listener.identity = MagicMock()
-    listener.identity.listener_id = "test-listener-id"
-    listener.identity.api_url = "http://api:8000"
-    listener.identity.certificate_pem = "CERT"
+    listener.identity = MagicMock(
+        listener_id="test-listener-id",
+        api_url="http://api:8000",
+        certificate_pem="CERT",
+    )
     listener._identity_ready = True
 
     for k, v in overrides.items():
@@ -129,7 +130,7 @@ class TestHandleRunAvailable:
         }
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = run_data
+        mock_response.content = json.dumps(run_data).encode()
         mock_response.raise_for_status = MagicMock()
 
         mock_client = AsyncMock()
@@ -142,6 +143,29 @@ class TestHandleRunAvailable:
         listener._launch_run.assert_called_once()
         assert listener._active_launches == 0  # Decremented after launch
 
+    async def test_concurrent_triggers_never_exceed_capacity(self, fresh_shutdown_event):
+        """SSE and poll racing each other claim at most _max_concurrent runs."""
+        listener = _make_listener(fresh_shutdown_event, _max_concurrent=1)
+        release = asyncio.Event()
+
+        async def slow_get(*_args, **_kwargs):
+            await release.wait()
+            return MagicMock(status_code=204)
+
+        listener._http_client = MagicMock(get=AsyncMock(side_effect=slow_get))
+
+        first = asyncio.create_task(listener._handle_run_available())
+        await asyncio.sleep(0)
+        await listener._handle_run_available()
+        release.set()
+        await first
+        await asyncio.gather(*listener._background_tasks)
+
+        # One claim while full was deferred and replayed after the slot freed
+        assert listener._http_client.get.await_count == 2
+        assert listener._claim_deferred is False
+        assert listener._active_launches == 0
+
 
 # ── SSE dispatch ─────────────────────────────────────────────────────
 
@@ -256,7 +280,10 @@ class TestLaunchFailureReporting:
         listener.runner_config = MagicMock()
 
         with (
-            patch("terrapod.runner.job_template.build_job_spec", return_value={"kind": "Job"}),
+            patch(
+                "terrapod.runner.job_template.build_job_spec",
+                return_value=({"kind": "Job"}, "job-x", "terrapod-runners"),
+            ),
             patch(
                 "terrapod.runner.job_manager.create_job",
                 AsyncMock(side_effect=RuntimeError("kubernetes API down")),
@@ -309,9 +336,9 @@ class TestAuthSecretNaming:
 
         captured = {}
 
-        def fake_build(**kwargs):
-            captured.setdefault("calls", []).append(kwargs)
-            return {"kind": "Job"}
+        def fake_build(request, runner_config):
+            captured.setdefault("calls", []).append(request)
+            return {"kind": "Job"}, "job-x", "terrapod-runners"
 
         with (
             patch("terrapod.runner.job_template.build_job_spec", side_effect=fake_build),
@@ -322,10 +349,162 @@ class TestAuthSecretNaming:
             await listener._launch_run(run_id, {"phase": "plan"})
             await listener._launch_run(run_id, {"phase": "apply"})
 
-        names = [c["auth_secret_name"] for c in captured["calls"]]
+        names = [c.auth_secret_name for c in captured["calls"]]
         assert names[0] != names[1], f"plan/apply must differ, got {names}"
         assert "plan" in names[0] and "apply" in names[1]
         # Same run prefix on both — only the phase suffix differs.
         prefix_plan = names[0].rsplit("-plan-", 1)[0]
         prefix_apply = names[1].rsplit("-apply-", 1)[0]
         assert prefix_plan == prefix_apply
+
+
+# ── Background event tasks ────────────────────────────────────────────
+
+
+class TestBackgroundTasks:
+    async def test_failed_task_is_logged_and_dropped(self, fresh_shutdown_event):
+        listener = _make_listener(fresh_shutdown_event)
+
+        async def boom():
+            raise RuntimeError("handler exploded")
+
+        task = asyncio.create_task(boom(), name="sse:stream_logs")
+        listener._background_tasks.add(task)
+        with patch.object(listener_module.logger, "error") as mock_error:
+            task.add_done_callback(listener._on_background_task_done)
+            await asyncio.gather(task, return_exceptions=True)
+            await asyncio.sleep(0)
+
+        assert task not in listener._background_tasks
+        mock_error.assert_called_once()
+        assert mock_error.call_args.kwargs["task"] == "sse:stream_logs"
+
+    async def test_drain_waits_then_cancels_stragglers(self, fresh_shutdown_event):
+        listener = _make_listener(fresh_shutdown_event)
+        finished = asyncio.create_task(asyncio.sleep(0.01))
+        stuck = asyncio.create_task(asyncio.sleep(60))
+        for task in (finished, stuck):
+            listener._background_tasks.add(task)
+            task.add_done_callback(listener._on_background_task_done)
+
+        await listener._drain_background_tasks(timeout=0.1)
+
+        assert finished.done() and not finished.cancelled()
+        assert stuck.cancelled()
+        assert not listener._background_tasks
+
+
+# ── start() ───────────────────────────────────────────────────────────
+
+
+class TestStart:
+    async def test_failed_loop_cancels_siblings(self, fresh_shutdown_event):
+        """A loop that dies takes the others down instead of leaking them."""
+        listener = _make_listener(fresh_shutdown_event)
+        heartbeat_cancelled = asyncio.Event()
+
+        async def broken_health():
+            raise OSError("address in use")
+
+        async def heartbeat():
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                heartbeat_cancelled.set()
+                raise
+
+        async def idle():
+            await asyncio.sleep(60)
+
+        async def establish():
+            pass
+
+        listener._establish_identity = establish
+        listener._health_server = broken_health
+        listener._heartbeat_loop = heartbeat
+        listener._sse_loop = listener._poll_loop = listener._cert_renewal_loop = idle
+
+        with (
+            patch.object(listener_module.job_manager, "init_k8s"),
+            patch("terrapod.runner.identity.close_api_client", new_callable=AsyncMock),
+            pytest.raises(ExceptionGroup),
+        ):
+            await asyncio.wait_for(listener.start(), timeout=2)
+
+        assert heartbeat_cancelled.is_set()
+
+
+# ── Heartbeat ─────────────────────────────────────────────────────────
+
+
+class TestHeartbeat:
+    async def test_prebuilt_body_carries_live_active_runs(self, fresh_shutdown_event):
+        with patch.dict(
+            "os.environ", {"POD_NAME": "listener-7f9%x", "TERRAPOD_MAX_CONCURRENT": "4"}
+        ):
+            listener = _make_listener(fresh_shutdown_event)
+        listener._http_client = AsyncMock()
+        listener._active_launches = 2
+
+        await listener._send_heartbeat()
+
+        kwargs = listener._http_client.post.call_args.kwargs
+        assert json.loads(kwargs["content"]) == {
+            "capacity": 4,
+            "active_runs": 2,
+            "pod_name": "listener-7f9%x",
+        }
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+        assert (
+            kwargs["headers"]["X-Terrapod-Client-Cert"]
+            == listener._cert_headers["X-Terrapod-Client-Cert"]
+        )
+
+
+# ── Re-join ───────────────────────────────────────────────────────────
+
+
+class TestRejoin:
+    async def _rejoin(self, listener, new_api_url: str) -> None:
+        async def fake_establish():
+            listener.identity.api_url = new_api_url
+
+        listener._establish_identity = fake_establish
+        with patch("terrapod.runner.identity.clear_credentials_secret"):
+            await listener._rejoin()
+
+    async def test_same_api_url_keeps_pooled_client(self, fresh_shutdown_event):
+        listener = _make_listener(fresh_shutdown_event)
+        listener._http_client = client = listener._new_http_client()
+
+        await self._rejoin(listener, "http://api:8000")
+
+        assert listener._http_client is client
+        await client.aclose()
+
+    async def test_moved_api_url_rebuilds_client(self, fresh_shutdown_event):
+        listener = _make_listener(fresh_shutdown_event)
+        listener._http_client = old = listener._new_http_client()
+
+        await self._rejoin(listener, "http://api-2:8000")
+
+        assert listener._http_client is not old
+        assert old.is_closed
+        assert str(listener._http_client.base_url) == "http://api-2:8000"
+        await listener._http_client.aclose()
+
+
+# ── Auth headers ──────────────────────────────────────────────────────
+
+
+class TestAuthHeaders:
+    def test_header_recomputed_on_identity_swap(self, fresh_shutdown_event):
+        listener = _make_listener(fresh_shutdown_event)
+        assert listener._auth_headers() == {"X-Terrapod-Client-Cert": "Q0VSVA=="}
+
+        # renew_loop replaces the whole identity object on rotation
+        listener.identity = MagicMock(certificate_pem="NEW")
+        assert listener._auth_headers() == {"X-Terrapod-Client-Cert": "TkVX"}
+
+        listener.identity = None
+        assert listener._auth_headers() == {}
@@ -20,6 +20,7 @@ from terrapod.services.run_service import (
     discard_run,
     queue_run,
     transition_run,
+    unlock_workspace,
 )
 
 # ── can_transition ─────────────────────────────────────────────────────
@@ -344,6 +345,23 @@ class TestQueueRun:
         assert result.status == "queued"
 
 
+# ── unlock_workspace ───────────────────────────────────────────────────
+
+
+class TestUnlockWorkspace:
+    async def test_single_update_only_touching_locked_rows(self):
+        db = AsyncMock(spec=AsyncSession)
+        ws_id = uuid.uuid4()
+
+        await unlock_workspace(db, ws_id)
+
+        db.execute.assert_awaited_once()
+        db.get.assert_not_called()
+        sql = str(db.execute.call_args.args[0])
+        assert sql.startswith("UPDATE workspaces")
+        assert "workspaces.locked IS true" in sql
+
+
 # ── claim_next_run ─────────────────────────────────────────────────────
 
 
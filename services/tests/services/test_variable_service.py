@@ -3,9 +3,14 @@
 import uuid
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from terrapod.api.routers.variables import _var_json
+from terrapod.db.models import Variable
 from terrapod.services.variable_service import (
+    _get_applicable_varsets,
     _version_hash,
     create_variable,
     delete_variable,
@@ -65,6 +70,27 @@ class TestCreateVariable:
         call_kwargs = MockVar.call_args[1]
         assert call_kwargs["version_id"] == _version_hash("k", "v", "terraform")
 
+    async def test_serialises_without_refresh(self):
+        """Timestamps are populated by the flush itself.
+
+        The mapper sets eager_defaults=False, so a server-side default would
+        leave created_at unloaded and _var_json would trigger a lazy load,
+        which fails under AsyncSession.
+        """
+        engine = sa.create_engine("sqlite://")
+        Variable.__table__.create(engine)
+        with Session(engine) as session:
+            db = MagicMock()
+            db.add = session.add
+            db.flush = AsyncMock(side_effect=session.flush)
+
+            var = await create_variable(db, uuid.uuid4(), key="k", value="v")
+
+            assert sa.inspect(var).unloaded == {"workspace"}
+            attrs = _var_json(var)["attributes"]
+            assert attrs["created-at"]
+            assert attrs["updated-at"]
+
 
 # ── update_variable ───────────────────────────────────────────────────
 
@@ -265,6 +291,25 @@ class TestResolveVariables:
         assert result == []
 
 
+# ── _get_applicable_varsets ────────────────────────────────────────────
+
+
+class TestGetApplicableVarsets:
+    async def test_loads_set_variables_without_per_set_refresh(self):
+        db = AsyncMock(spec=AsyncSession)
+        global_vs, assigned_vs = MagicMock(), MagicMock()
+        global_result, assigned_result = MagicMock(), MagicMock()
+        global_result.scalars.return_value.all.return_value = [global_vs]
+        assigned_result.scalars.return_value.all.return_value = [assigned_vs]
+        db.execute.side_effect = [global_result, assigned_result]
+
+        varsets = await _get_applicable_varsets(db, uuid.uuid4(), priority=False)
+
+        assert varsets == [global_vs, assigned_vs]
+        assert db.execute.await_count == 2
+        db.refresh.assert_not_called()
+
+
 # ── delete_variable ────────────────────────────────────────────────────
 
 
@@ -21,8 +21,13 @@ from __future__ import annotations
 import io
 import json
 import logging
+import re
+import uuid
+from datetime import UTC, datetime
 
-from terrapod.logging_config import configure_logging
+import structlog
+
+from terrapod.logging_config import configure_logging, utc_timestamper
 
 
 def _install_uvicorn_default_handlers() -> None:
@@ -73,3 +78,39 @@ def test_uvicorn_access_record_emits_as_json(capsys):
     assert record["logger"] == "uvicorn.access"
     assert record["level"] == "info"
     assert "GET /health" in record["event"]
+
+
+def test_utc_timestamper_formats_iso8601_millis():
+    before = datetime.now(UTC).replace(microsecond=0)
+    ts = utc_timestamper(None, "info", {})["timestamp"]
+    after = datetime.now(UTC)
+
+    assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z", ts)
+    parsed = datetime.strptime(ts, "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=UTC)
+    assert before <= parsed <= after
+
+
+def test_below_level_calls_skip_the_processor_chain(capsys):
+    configure_logging(json_logs=True, log_level="INFO")
+
+    bound = structlog.get_config()["wrapper_class"](logging.getLogger("t"), [], {})
+    assert not bound.is_enabled_for(logging.DEBUG)
+
+    structlog.get_logger("terrapod.test").debug("dropped")
+    structlog.get_logger("terrapod.test").info("kept")
+    lines = capsys.readouterr().out.strip().splitlines()
+    assert json.loads(lines[-1])["event"] == "kept"
+    assert not any("dropped" in line for line in lines)
+
+
+def test_json_renderer_serializes_uuid_and_datetime(capsys):
+    configure_logging(json_logs=True, log_level="INFO")
+
+    run_id = uuid.uuid4()
+    when = datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC)
+    structlog.get_logger("terrapod.test").info("typed", run_id=run_id, when=when, counts={1: 2})
+
+    record = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+    assert record["run_id"] == str(run_id)
+    assert record["when"] == "2026-01-02T03:04:05+00:00"
+    assert record["counts"] == {"1": 2}
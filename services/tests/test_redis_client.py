@@ -0,0 +1,62 @@
+"""Tests for the SSE pub/sub relay in `terrapod.redis.client`."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+from terrapod.redis.client import SSE_IDLE_TIMEOUT, stream_pubsub_events
+
+
+def _pubsub(*messages):
+    pubsub = MagicMock()
+    pubsub.get_message = AsyncMock(side_effect=list(messages))
+    pubsub.unsubscribe = AsyncMock()
+    pubsub.aclose = AsyncMock()
+    return pubsub
+
+
+def _disconnect_after(polls: int) -> AsyncMock:
+    return AsyncMock(side_effect=[False] * polls + [True])
+
+
+class TestStreamPubsubEvents:
+    async def test_relays_message_with_its_event_name(self):
+        data = json.dumps({"event": "run_created", "run_id": "run-1"})
+        pubsub = _pubsub({"type": "message", "data": data})
+
+        events = [
+            e async for e in stream_pubsub_events(pubsub, "ch", _disconnect_after(1), "update")
+        ]
+
+        assert events == [{"event": "run_created", "data": data}]
+        pubsub.get_message.assert_awaited_with(
+            ignore_subscribe_messages=True, timeout=SSE_IDLE_TIMEOUT
+        )
+
+    async def test_default_event_and_bytes_payload(self):
+        pubsub = _pubsub({"type": "message", "data": b'{"run_id": "run-1"}'})
+
+        events = [
+            e async for e in stream_pubsub_events(pubsub, "ch", _disconnect_after(1), "update")
+        ]
+
+        assert events == [{"event": "update", "data": '{"run_id": "run-1"}'}]
+
+    async def test_keepalive_when_idle(self):
+        pubsub = _pubsub(None, None)
+
+        events = [
+            e async for e in stream_pubsub_events(pubsub, "ch", _disconnect_after(2), "update")
+        ]
+
+        assert events == [{"comment": "keepalive"}, {"comment": "keepalive"}]
+
+    async def test_closes_subscription_on_disconnect(self):
+        pubsub = _pubsub()
+
+        events = [
+            e async for e in stream_pubsub_events(pubsub, "ch", _disconnect_after(0), "update")
+        ]
+
+        assert events == []
+        pubsub.unsubscribe.assert_awaited_once_with("ch")
+        pubsub.aclose.assert_awaited_once()